@@ -0,0 +1,65 @@
+"""
+Measure CustomArchitecture with a monorepo layout of ~100k folders.
+
+The folder list is one brace pattern expanding to --services x 5 x 100
+leaf folders. The raw input also lists every leaf twice and every
+ancestor once, like concatenated layouts from several teams. The
+benchmark reports the time to expand and collapse the list in the trie
+and to compute the plan's directory set. It then compares creating only
+the leaf folders in a single pass with calling os.makedirs on every raw
+path.
+
+Usage: python benchmarks/bench_custom_paths.py [--services 200]
+"""
+import argparse
+import os
+import shutil
+import tempfile
+import time
+from pathlib import Path
+
+from skelly.core.pathset import PathSet, expand_braces
+from skelly.core.plan import BuildPlan
+from skelly.strategies.architecture import CustomArchitecture
+
+
+def _timed(label: str, func):
+    start = time.perf_counter()
+    result = func()
+    print(f"{label:>28}: {(time.perf_counter() - start) * 1000:9.1f}ms")
+    return result
+
+
+def _make_dirs(root: Path, paths: list[str]) -> None:
+    for path in paths:
+        os.makedirs(root / path, exist_ok=True)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--services", type=int, default=200)
+    args = parser.parse_args()
+
+    pattern = f"services/svc{{0..{args.services - 1}}}/{{api,domain,infra,web,jobs}}/m{{000..099}}"
+    leaves = expand_braces(pattern)
+    ancestors = sorted({path.rpartition("/")[0] for path in leaves} | {"services"})
+    raw = [*leaves, *ancestors, *leaves]
+    print(f"pattern: {pattern}")
+    print(f"{len(leaves)} leaf folders, {len(raw)} raw paths\n")
+
+    _timed("brace expansion", lambda: expand_braces(pattern))
+    _timed("trie (raw paths)", lambda: PathSet(raw).leaves())
+    architecture = _timed("CustomArchitecture(pattern)", lambda: CustomArchitecture([pattern]))
+    plan = BuildPlan().add_folders(architecture.get_folders())
+    directories = _timed("BuildPlan.directories()", plan.directories)
+    assert len(directories) == len(leaves)
+
+    tmpfs = "/dev/shm" if os.path.isdir("/dev/shm") else None
+    with tempfile.TemporaryDirectory(dir=tmpfs) as tmp:
+        _timed("makedirs, leaves only", lambda: _make_dirs(Path(tmp) / "leaves", directories))
+        _timed("makedirs, every raw path", lambda: _make_dirs(Path(tmp) / "raw", raw))
+        shutil.rmtree(tmp, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+Time a diff-based dry run against an existing generated project.
+
+Builds hexagonal Express and Java projects from a schema with --entities
+entities, edits one file by hand, and then times builder.diff() against
+the result: planning, the os.scandir index of the project and hashing the
+rendered output in memory. A node_modules tree with --junk files is added
+next to the sources to show that the index does not walk directories the
+plan never writes to.
+
+Usage: python benchmarks/bench_diff.py [--entities 500] [--junk 20000]
+"""
+import argparse
+import json
+import os
+import tempfile
+import time
+
+from skelly.core.spec import ProjectSpec
+
+BUILD_FILES = {"Express": "package.json", "Java": "pom.xml"}
+FIELDS = {"name": "string", "quantity": "integer", "price": "decimal", "active": "boolean"}
+
+
+def _builder(schema: str, output: str, stack: str):
+    spec = ProjectSpec.from_dict({
+        "name": "bench", "backend_stack": stack, "architecture": "hexagonal", "schema": schema, "output_path": output,
+    })
+    return spec.create_builder(install=False)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--entities", type=int, default=500)
+    parser.add_argument("--junk", type=int, default=20000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        schema = os.path.join(tmp, "schema.json")
+        with open(schema, "w") as f:
+            json.dump({"entities": [{"name": f"Entity{i:04d}", "fields": FIELDS} for i in range(args.entities)]}, f)
+
+        print(f"{args.entities} entities, {args.junk} files in node_modules")
+        for stack in ("Express", "Java"):
+            output = os.path.join(tmp, stack)
+            _builder(schema, output, stack).build()
+            project = os.path.join(output, "bench")
+            junk = os.path.join(project, "node_modules", "junk")
+            os.makedirs(junk)
+            for i in range(args.junk):
+                open(os.path.join(junk, f"{i}.js"), "w").close()
+            with open(os.path.join(project, "server", BUILD_FILES[stack]), "a") as f:
+                f.write("\n")
+
+            start = time.perf_counter()
+            counts = _builder(schema, output, stack).diff().counts()
+            elapsed = time.perf_counter() - start
+            summary = ", ".join(f"{count} {status}" for status, count in counts.items())
+            print(f"  {stack:<8} {elapsed * 1000:8.1f}ms  ({summary})")
+
+
+if __name__ == "__main__":
+    main()
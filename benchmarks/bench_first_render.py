@@ -0,0 +1,80 @@
+"""
+Measure first-render latency of all packaged templates in a fresh interpreter.
+Import time is excluded; the clock covers environment creation, loading and rendering.
+
+Compares four set-ups, each in its own subprocess with its own cache dir:
+  no cache         SKELLY_TEMPLATE_CACHE=0, every template is lexed and compiled
+  bytecode cache   on-disk Jinja bytecode cache, warmed by a previous process
+  bundle+bytecode  bytecode cache, sources served from `skelly bundle-templates`
+  compiled modules templates precompiled with `skelly compile-templates`
+
+Usage: python benchmarks/bench_first_render.py [--runs 5]
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+CHILD = """
+import time
+from skelly.core.domain import Entity, Field
+from skelly.core.template_renderer import list_templates, render_template
+# One context for all templates; the per-entity templates get a sample entity.
+entity = Entity("Order", (Field("total", "decimal"),)).context()
+context = dict(package="com.example.bench", project_name="bench", dependencies=[], modules=["api"],
+               entity=entity, entities=[entity], exports=[("Order", "Order.js")])
+start = time.perf_counter()
+names = [name for name in list_templates() if name.endswith(".j2")]
+for name in names:
+    render_template(name, **context)
+print(len(names), (time.perf_counter() - start) * 1000)
+"""
+
+
+def _run_child(env: dict) -> tuple[int, float]:
+    out = subprocess.run([sys.executable, "-c", CHILD], env=env, check=True, capture_output=True, text=True)
+    count, millis = out.stdout.split()
+    return int(count), float(millis)
+
+
+def _measure(env: dict, runs: int) -> tuple[int, float]:
+    _run_child(env)  # warm caches and __pycache__
+    samples = [_run_child(env) for _ in range(runs)]
+    return samples[0][0], statistics.median(ms for _, ms in samples)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        base = dict(os.environ, SKELLY_TEMPLATE_BUNDLE="0")
+
+        no_cache = dict(base, SKELLY_TEMPLATE_CACHE="0")
+        results.append(("no cache", *_measure(no_cache, args.runs)))
+
+        bytecode = dict(base, SKELLY_CACHE_DIR=os.path.join(tmp, "bytecode"))
+        results.append(("bytecode cache", *_measure(bytecode, args.runs)))
+
+        bundle_path = os.path.join(tmp, "templates.bundle")
+        subprocess.run([sys.executable, "-m", "skelly.cli", "bundle-templates", "--target", bundle_path],
+                       env=base, check=True, capture_output=True)
+        bundle = dict(base, SKELLY_CACHE_DIR=os.path.join(tmp, "bundle"), SKELLY_TEMPLATE_BUNDLE=bundle_path)
+        results.append(("bundle+bytecode", *_measure(bundle, args.runs)))
+
+        compiled = dict(base, SKELLY_CACHE_DIR=os.path.join(tmp, "compiled"))
+        subprocess.run([sys.executable, "-m", "skelly.cli", "compile-templates"], env=compiled,
+                       check=True, capture_output=True)
+        results.append(("compiled modules", *_measure(compiled, args.runs)))
+
+    baseline = results[0][2]
+    for label, count, millis in results:
+        print(f"{label:>16}: {count} templates, first render {millis:7.2f}ms  ({baseline / millis:4.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+Compare creating the initial commit of a generated project through git fast-import
+with the usual `git init && git add -A && git commit`.
+
+The project is an Express + React scaffold with a custom layout of
+--folders extra folders, each holding a .gitkeep, so the tree has
+several hundred files. Both variants commit the same files; the
+fast-import variant reuses the contents rendered during the build.
+
+Usage: python benchmarks/bench_git_init.py [--folders 400]
+"""
+import argparse
+import os
+import subprocess
+import tempfile
+import time
+from pathlib import Path
+
+from skelly.core.git_import import GitCommit
+from skelly.core.spec import ProjectSpec
+from skelly.core.tracing import tracing
+
+AUTHOR = "Bench <bench@example.com>"
+
+
+def _spec(output: str, folders: int) -> ProjectSpec:
+    return ProjectSpec.from_dict({
+        "name": "bench", "backend_stack": "Express", "frontend_stack": "React", "architecture": "custom",
+        "custom_folders": [f"server/src/modules/m{{000..{folders - 1}}}"], "output_path": output,
+    })
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--folders", type=int, default=400)
+    args = parser.parse_args()
+
+    env = dict(os.environ, GIT_AUTHOR_NAME="Bench", GIT_AUTHOR_EMAIL="bench@example.com",
+               GIT_COMMITTER_NAME="Bench", GIT_COMMITTER_EMAIL="bench@example.com")
+    with tempfile.TemporaryDirectory() as tmp:
+        plain = os.path.join(tmp, "plain")
+        _spec(plain, args.folders).create_builder(install=False).build()
+        project = Path(plain) / "bench"
+        start = time.perf_counter()
+        for cmd in (["git", "init", "-q"], ["git", "add", "-A"], ["git", "commit", "-q", "-m", "Initial commit"]):
+            subprocess.run(cmd, cwd=project, env=env, check=True)
+        plain_ms = (time.perf_counter() - start) * 1000
+        count = len(subprocess.run(["git", "ls-files"], cwd=project, capture_output=True, text=True).stdout.split())
+
+        fast = os.path.join(tmp, "fast")
+        builder = _spec(fast, args.folders).create_builder(install=False, git=GitCommit(author=AUTHOR))
+        with tracing() as tracer:
+            builder.build()
+        [git_span] = tracer.spans("git")
+        fast_ms = git_span["dur"] / 1000
+
+    print(f"{count} files")
+    print(f"  init + add + commit: {plain_ms:7.1f}ms")
+    print(f"  fast-import commit:  {fast_ms:7.1f}ms  (the build's git span)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""
+Compare sequential and threaded plan application.
+
+Runs a Java hexagonal + Angular scaffold plan against a tmpfs target
+(/dev/shm when available) and against a simulated slow filesystem that
+adds a fixed latency to every directory and file operation.
+
+Usage: python benchmarks/bench_parallel_write.py [--latency-ms 5] [--rounds 5]
+"""
+import argparse
+import contextlib
+import io
+import os
+import shutil
+import tempfile
+import time
+from pathlib import Path
+
+from skelly.core.builder import ProjectBuilder
+from skelly.core.executor import DEFAULT_WORKERS, PlanExecutor
+from skelly.core.models import Architecture, BackendStack, FrontendStack
+from skelly.factories.base import StrategyFactory
+
+
+class SlowFsExecutor(PlanExecutor):
+    """PlanExecutor that sleeps before each filesystem call, like an NFS round trip."""
+
+    def __init__(self, workers: int, latency: float):
+        super().__init__(workers)
+        self.latency = latency
+
+    def _make_directory(self, output, directory):
+        time.sleep(self.latency)
+        super()._make_directory(output, directory)
+
+    def _write_file(self, output, planned, data):
+        time.sleep(self.latency)
+        super()._write_file(output, planned, data)
+
+
+def _create_plan():
+    name = "benchapp"
+    builder = ProjectBuilder()
+    builder.set_meta_data(name)\
+           .set_architecture(Architecture.HEXAGONAL.value)\
+           .add_backend_libraries(["lombok", "spring-boot-starter-data-jpa"])\
+           .with_architecture_strategy(StrategyFactory.create_architecture("hexagonal", name, BackendStack.JAVA))\
+           .with_backend_strategy(StrategyFactory.create_backend(BackendStack.JAVA, name))\
+           .with_frontend_strategy(StrategyFactory.create_frontend(FrontendStack.ANGULAR))
+    return builder.create_plan(builder._create_config())
+
+
+def _time_apply(executor: PlanExecutor, plan, root: Path, rounds: int) -> float:
+    best = float("inf")
+    for i in range(rounds):
+        target = root / f"round-{i}"
+        start = time.perf_counter()
+        executor.apply(plan, target)
+        best = min(best, time.perf_counter() - start)
+        shutil.rmtree(target)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--latency-ms", type=float, default=5.0)
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS)
+    args = parser.parse_args()
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        plan = _create_plan()
+        # Warm the template cache so only emission is measured.
+        for planned in plan.files:
+            planned.render()
+
+    tmpfs = "/dev/shm" if os.path.isdir("/dev/shm") else None
+    latency = args.latency_ms / 1000
+    cases = [
+        ("tmpfs", PlanExecutor(1), PlanExecutor(args.workers)),
+        (f"slow-fs ({args.latency_ms:g}ms/op)", SlowFsExecutor(1, latency), SlowFsExecutor(args.workers, latency)),
+    ]
+
+    print(f"plan: {len(plan.directories())} directories, {len(plan.files)} files, {args.workers} workers")
+    for label, sequential, parallel in cases:
+        with tempfile.TemporaryDirectory(dir=tmpfs) as tmp, contextlib.redirect_stdout(io.StringIO()):
+            seq = _time_apply(sequential, plan, Path(tmp), args.rounds)
+            par = _time_apply(parallel, plan, Path(tmp), args.rounds)
+        print(f"{label:>24}: sequential {seq * 1000:8.2f}ms  parallel {par * 1000:8.2f}ms  speedup {seq / par:5.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Compare scaffolding through the `skelly serve` daemon with one CLI process per project.
+
+The CLI side runs `skelly batch` on a single-spec file per project, as a
+portal shelling out to skelly would. The daemon side posts the same spec
+to a warm in-process server and receives a tarball. Reports per-request
+latency percentiles for both.
+
+Usage: python benchmarks/bench_serve.py [--requests 50] [--cli-runs 5]
+"""
+import argparse
+import http.client
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+from skelly.core.server import ScaffoldService, create_server, percentile
+
+SPEC = {"name": "bench", "backend_stack": "Java", "architecture": "hexagonal"}
+
+
+def _summary(label: str, durations: list[float]) -> None:
+    values = sorted(durations)
+    print(f"{label:>16}: p50 {percentile(values, 50) * 1000:7.1f}ms  "
+          f"p99 {percentile(values, 99) * 1000:7.1f}ms  ({len(values)} requests)")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=50)
+    parser.add_argument("--cli-runs", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        spec_file = os.path.join(tmp, "spec.jsonl")
+        cli_durations = []
+        for run in range(args.cli_runs):
+            with open(spec_file, "w") as f:
+                f.write(json.dumps({**SPEC, "output_path": os.path.join(tmp, f"cli{run}")}) + "\n")
+            start = time.perf_counter()
+            subprocess.run([sys.executable, "-m", "skelly.cli", "batch", spec_file, "--processes", "1"],
+                           check=True, capture_output=True)
+            cli_durations.append(time.perf_counter() - start)
+
+        service = ScaffoldService(root=tmp)
+        service.warm()
+        server = create_server(service, port=0)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        body = json.dumps(SPEC).encode()
+        daemon_durations = []
+        connection = http.client.HTTPConnection(*server.server_address)
+        for _ in range(args.requests):
+            start = time.perf_counter()
+            connection.request("POST", "/scaffold", body=body)
+            response = connection.getresponse()
+            response.read()
+            assert response.status == 200
+            daemon_durations.append(time.perf_counter() - start)
+        connection.close()
+        server.shutdown()
+        server.server_close()
+        service.close()
+
+    _summary("CLI process", cli_durations)
+    _summary("daemon", daemon_durations)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+"""
+Measure how long importing the CLI takes, against a budget.
+
+Each run imports skelly.cli in a fresh interpreter under
+`python -X importtime` (which itself adds some overhead) and reads the
+cumulative time of the module; the best run is compared with --budget.
+The exit status is 1 when the best run is over budget, so CI jobs on
+quiet machines can opt in to the check.
+
+Usage: python benchmarks/bench_startup.py [--runs 5] [--budget 100]
+"""
+import argparse
+import subprocess
+import sys
+
+
+def _import_time_us(module: str) -> int:
+    """Cumulative import time of module in a fresh interpreter (µs)."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    for line in result.stderr.splitlines():
+        if line.startswith("import time:") and "cumulative" not in line:
+            _, cumulative, name = line.split("|")
+            if name.strip() == module:
+                return int(cumulative)
+    raise RuntimeError(f"{module} missing from the -X importtime output")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--budget", type=float, default=100.0, help="Budget in milliseconds (default: 100)")
+    args = parser.parse_args()
+
+    times = sorted(_import_time_us("skelly.cli") / 1000 for _ in range(args.runs))
+    print(f"import skelly.cli: best {times[0]:.1f}ms, median {times[len(times) // 2]:.1f}ms "
+          f"over {args.runs} runs (budget {args.budget:.0f}ms)")
+    if times[0] > args.budget:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
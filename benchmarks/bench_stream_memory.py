@@ -0,0 +1,57 @@
+"""
+Measure the memory a large generated file costs while it is rendered and written.
+
+Each run applies a plan with a single aggregate file (an index.js that
+re-exports N modules) of roughly the given size, once rendered into
+memory first and once streamed block by block. The figure is the
+tracemalloc peak during apply() above what was allocated before, so the
+template context itself is not counted. Streaming should stay flat as
+the output grows; rendering into memory grows with it. Times are taken
+under tracemalloc, which slows streaming (many small allocations) more.
+
+Usage: python benchmarks/bench_stream_memory.py [--sizes 1 10 50]
+"""
+import argparse
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+from skelly.core.executor import PlanExecutor
+from skelly.core.plan import BuildPlan
+
+TEMPLATE = "express/hexagonal/entity/exports_index.js.j2"
+# One rendered export line: "export { Symbol0000001 } from './Module0000001.js';\n"
+LINE = 53
+
+
+def _apply(megabytes: int, output: Path, stream_threshold: int | None) -> tuple[float, float, int]:
+    exports = [(f"Symbol{i:07d}", f"Module{i:07d}.js") for i in range(megabytes * 2**20 // LINE)]
+    plan = BuildPlan().add_template("src/index.js", TEMPLATE, exports=exports)
+    executor = PlanExecutor(workers=1, stream_threshold=stream_threshold)
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+    start = time.perf_counter()
+    executor.apply(plan, output)
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1] - baseline
+    tracemalloc.stop()
+    return elapsed * 1000, peak / 2**20, (output / "src/index.js").stat().st_size
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1, 10, 50], metavar="MB")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        # Load the template once so compiling it is not part of the first measurement.
+        _apply(0, Path(tmp, "warmup"), None)
+        for megabytes in args.sizes:
+            for label, threshold in (("in memory", None), ("streamed", PlanExecutor().stream_threshold)):
+                elapsed, peak, size = _apply(megabytes, Path(tmp, f"{megabytes}-{label}"), threshold)
+                print(f"{size / 2**20:6.1f} MiB output  {label:>9}: peak {peak:7.2f} MiB  {elapsed:8.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,26 +1,38 @@
 import argparse
+import contextlib
+import json
+import sys
+import time
+from functools import lru_cache
+from pathlib import Path
+
+from skelly.core.exceptions import SkellyError
+from skelly.core.models import Architecture, BackendStack, FrontendStack
+from skelly.core.output import ARCHIVE_FORMATS, archive_format_for, open_archive
 
-import questionary
-from rich.console import Console
+# questionary, rich and jinja2 dominate start-up time, so they are only
+# imported on the code paths that use them (see tests/test_startup.py).
 
-from skelly.core.builder import ProjectBuilder
-from skelly.core.models import Architecture, BackendStack, FrontendStack
-from skelly.factories.base import StrategyFactory
-from skelly.factories.frontend_factory import FrontendFactory
-from skelly.factories.backend_factory import BackendFactory
 
-console = Console()
+@lru_cache(maxsize=None)
+def _console():
+    from rich.console import Console
+    return Console()
 
 
 def _ask_project_name() -> str | None:
+    import questionary
+
     project_name = questionary.text("Enter the project name:").ask()
     if not project_name:
-        console.print("[red]Project name is required.[/red]")
+        _console().print("[red]Project name is required.[/red]")
         return None
     return project_name
 
 
 def _ask_stacks() -> tuple[FrontendStack, BackendStack]:
+    import questionary
+
     frontend_value = questionary.select(
         "Choose a frontend stack:",
         choices=[
@@ -41,6 +53,10 @@ def _ask_stacks() -> tuple[FrontendStack, BackendStack]:
 def _ask_libraries(
     frontend_stack: FrontendStack, backend_stack: BackendStack
 ) -> tuple[list[str], list[str]]:
+    import questionary
+    from skelly.factories.backend_factory import BackendFactory
+    from skelly.factories.frontend_factory import FrontendFactory
+
     frontend_libs = []
     if frontend_stack != FrontendStack.NONE:
         frontend_libs = questionary.checkbox(
@@ -57,6 +73,9 @@ def _ask_libraries(
 
 
 def _ask_architecture() -> tuple[str, list[str] | None]:
+    import questionary
+    from skelly.core.pathset import split_paths
+
     arch_options = [
         questionary.Choice(Architecture.HEXAGONAL.value, value="hexagonal"),
         questionary.Choice(Architecture.LAYERED.value, value="layered"),
@@ -70,10 +89,10 @@ def _ask_architecture() -> tuple[str, list[str] | None]:
 
     custom_folders = None
     if choice == "custom":
-        console.print("[yellow]Please enter folder paths separated by commas.[/yellow]")
-        console.print("[dim]Example: src/controllers, src/models, utils[/dim]")
+        _console().print("[yellow]Please enter folder paths separated by commas.[/yellow]")
+        _console().print("[dim]Example: src/controllers, src/models, services/{users,orders}/src/{api,domain}[/dim]")
         folders_input = questionary.text("Enter folders:").ask()
-        custom_folders = [f.strip() for f in folders_input.split(",") if f.strip()]
+        custom_folders = split_paths(folders_input or "")
 
     return choice, custom_folders
 
@@ -88,17 +107,576 @@ def _parse_args() -> argparse.Namespace:
         action="store_true",
         help="Preview the project structure without creating any files",
     )
+    parser.add_argument(
+        "--diff",
+        nargs="?",
+        const="text",
+        choices=["text", "json"],
+        default=None,
+        help="With --dry-run, compare every planned folder and file with the existing project and report "
+             "what would be added, modified, left unchanged or is in conflict, as text or JSON on stdout",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=None,
+        help="Number of threads used to write project files (default: CPU count + 4, at most 32)",
+    )
+    parser.add_argument(
+        "--member",
+        action="append",
+        default=None,
+        metavar="DIR[=STACK]",
+        help="Make the project a workspace with a member in DIR (repeatable). STACK is a backend or frontend "
+             "stack such as Express or React (default: the chosen backend stack)",
+    )
+    parser.add_argument(
+        "--render-processes",
+        type=int,
+        default=None,
+        metavar="N",
+        help="Render templates in N worker processes; worthwhile for large domain schemas (default: 1)",
+    )
+    parser.add_argument(
+        "--schema",
+        type=Path,
+        default=None,
+        metavar="PATH",
+        help="Domain schema (JSON or YAML) whose entities are generated for hexagonal Java and Express backends",
+    )
+    parser.add_argument(
+        "--install-timeout",
+        type=float,
+        default=None,
+        metavar="SECONDS",
+        help="Abort a dependency installation after this many seconds (default: 900)",
+    )
+    parser.add_argument(
+        "--defer-install",
+        action="store_true",
+        help="Queue the dependency installation for 'skelly install-worker' instead of running it",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Skip the steps an interrupted earlier build of the same project already completed",
+    )
+    parser.add_argument(
+        "--git",
+        action="store_true",
+        help="Add a .gitignore and create a git repository with an initial commit of the generated files",
+    )
+    parser.add_argument(
+        "--git-author",
+        default=None,
+        metavar="'NAME <EMAIL>'",
+        help="Author of the initial commit (default: your git identity)",
+    )
+    parser.add_argument(
+        "--git-message",
+        default=None,
+        help="Message of the initial commit (default: 'Initial commit')",
+    )
+    parser.add_argument(
+        "--events",
+        choices=["progress", "console", "jsonl", "none"],
+        default=None,
+        help="How build events are reported: progress bar, console lines, JSON lines on stdout, or not at all "
+             "(default: progress for builds, none for batch runs and serve, console otherwise)",
+    )
+    parser.add_argument(
+        "--trace",
+        type=Path,
+        default=None,
+        metavar="PATH",
+        help="Write timing spans of the build as a Chrome trace (open in chrome://tracing or Perfetto)",
+    )
+    parser.add_argument(
+        "--profile",
+        type=Path,
+        default=None,
+        metavar="PATH",
+        help="Run the build under cProfile and write the pstats data to PATH",
+    )
+    parser.add_argument(
+        "--output-archive",
+        metavar="PATH",
+        help="Stream the project into a tar.gz/zip archive instead of a folder ('-' for stdout)",
+    )
+    parser.add_argument(
+        "--archive-format",
+        choices=sorted(ARCHIVE_FORMATS),
+        help="Archive format (default: from the file extension, tar.gz for stdout)",
+    )
+
+    subparsers = parser.add_subparsers(dest="command")
+    batch = subparsers.add_parser(
+        "batch",
+        help="Generate many projects headlessly from a JSONL spec file",
+    )
+    batch.add_argument("spec_file", type=Path, help="JSONL file with one project spec per line")
+    batch.add_argument(
+        "--processes",
+        type=int,
+        default=None,
+        help="Number of worker processes (default: CPU count)",
+    )
+    batch.add_argument(
+        "--install",
+        action="store_true",
+        help="Install dependencies for every generated project",
+    )
+    batch.add_argument(
+        "--defer-install",
+        action="store_true",
+        help="Queue the dependency installs for 'skelly install-worker' instead of running them",
+    )
+
+    worker = subparsers.add_parser(
+        "install-worker",
+        help="Run the dependency installs queued with --defer-install",
+    )
+    worker.add_argument(
+        "--concurrency",
+        type=int,
+        default=None,
+        help="Maximum number of concurrent installs (default: 4)",
+    )
+    worker.add_argument(
+        "--limit",
+        action="append",
+        default=[],
+        metavar="ECOSYSTEM=N",
+        help="Maximum concurrent installs per package manager, e.g. maven=2 (default: maven=2, npm=4)",
+    )
+    worker.add_argument(
+        "--retries",
+        type=int,
+        default=None,
+        help="How often a failed install is retried (default: 2)",
+    )
+    worker.add_argument(
+        "--install-timeout",
+        type=float,
+        default=None,
+        metavar="SECONDS",
+        help="Abort a single install step after this many seconds (default: 900)",
+    )
+    worker.add_argument(
+        "--status",
+        action="store_true",
+        help="Show the queue and exit",
+    )
+    worker.add_argument(
+        "--retry-failed",
+        action="store_true",
+        help="Requeue jobs whose retries were used up before draining",
+    )
+
+    cache = subparsers.add_parser(
+        "cache",
+        help="Inspect or prune the node_modules cache",
+    )
+    cache_commands = cache.add_subparsers(dest="cache_command", required=True)
+    cache_commands.add_parser("stats", help="Show the cached dependency sets and their sizes")
+    prune = cache_commands.add_parser("prune", help="Evict least recently used entries")
+    prune.add_argument(
+        "--max-size",
+        default=None,
+        help="Shrink the cache to this size, e.g. 500M or 2G (default: the configured limit, 5G)",
+    )
+    prune.add_argument(
+        "--all",
+        action="store_true",
+        help="Remove every entry",
+    )
+
+    prefetch = subparsers.add_parser(
+        "prefetch",
+        help="Pre-resolve dependencies so that later builds work offline",
+    )
+    prefetch.add_argument("stack", choices=["java", "django"], help="Stack whose libraries are prefetched")
+    prefetch.add_argument(
+        "--from",
+        dest="source",
+        type=Path,
+        default=None,
+        metavar="DIR",
+        help="Copy from an existing Maven repository (java) or wheel directory (django) instead of downloading",
+    )
+
+    versions = subparsers.add_parser(
+        "versions",
+        help="Manage the snapshot used to pin library versions",
+    )
+    version_commands = versions.add_subparsers(dest="versions_command", required=True)
+    refresh = version_commands.add_parser("refresh", help="Fetch the latest versions of all selectable libraries")
+    refresh.add_argument(
+        "--registry",
+        type=Path,
+        default=None,
+        metavar="DIR",
+        help="Read metadata from a local directory mirroring the npm, Maven and PyPI layouts",
+    )
+    version_commands.add_parser("show", help="List the pinned versions")
+
+    compile_parser = subparsers.add_parser(
+        "compile-templates",
+        help="Precompile all templates into Python modules for faster start-up",
+    )
+    compile_parser.add_argument(
+        "--target",
+        type=Path,
+        default=None,
+        help="Output directory (default: skelly's cache directory, where it is picked up automatically)",
+    )
+
+    bundle_parser = subparsers.add_parser(
+        "bundle-templates",
+        help="Pack all templates into one memory-mapped bundle file",
+    )
+    bundle_parser.add_argument(
+        "--target",
+        type=Path,
+        default=None,
+        help="Bundle file (default: templates.bundle inside the installed package, where it is picked up automatically)",
+    )
+
+    serve = subparsers.add_parser(
+        "serve",
+        help="Run a scaffold daemon with warm templates and strategies behind a local HTTP API",
+    )
+    serve.add_argument(
+        "--socket",
+        type=Path,
+        default=None,
+        metavar="PATH",
+        help="Listen on a Unix socket instead of a TCP port",
+    )
+    serve.add_argument("--host", default=None, help="Address to bind (default: 127.0.0.1)")
+    serve.add_argument("--port", type=int, default=None, help="TCP port (default: 8765)")
+    serve.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Number of concurrent builds (default: CPU count, at most 4)",
+    )
+    serve.add_argument(
+        "--queue-size",
+        type=int,
+        default=None,
+        help="Builds waiting for a worker before requests are rejected with 503 (default: 16)",
+    )
+    serve.add_argument(
+        "--root",
+        type=Path,
+        default=None,
+        help="Directory that ?output=dir builds are confined to (default: the current directory)",
+    )
     return parser.parse_args()
 
 
-def main() -> None:
-    args = _parse_args()
+def _run_serve(args: argparse.Namespace) -> None:
+    from skelly.core.server import DEFAULT_HOST, DEFAULT_PORT, DEFAULT_QUEUE_SIZE, ScaffoldService, create_server
+
+    service = ScaffoldService(
+        workers=args.workers,
+        queue_size=args.queue_size if args.queue_size is not None else DEFAULT_QUEUE_SIZE,
+        root=args.root,
+    )
+    start = time.perf_counter()
+    try:
+        count = service.warm()
+        server = create_server(
+            service,
+            socket_path=args.socket,
+            host=args.host or DEFAULT_HOST,
+            port=args.port if args.port is not None else DEFAULT_PORT,
+        )
+    except (OSError, SkellyError) as e:
+        _console().print(f"[red]Error: {e}[/red]")
+        raise SystemExit(1)
+
+    address = args.socket or f"http://{server.server_address[0]}:{server.server_address[1]}"
+    _console().print(
+        f"[green]Serving on {address} with {service.workers} workers "
+        f"({count} templates warmed in {(time.perf_counter() - start) * 1000:.0f}ms)[/green]"
+    )
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        service.close()
+
+
+def _run_batch(args: argparse.Namespace) -> None:
+    from skelly.core.batch import load_specs, run_batch
+
+    try:
+        specs = load_specs(args.spec_file)
+    except (OSError, SkellyError) as e:
+        _console().print(f"[red]Error: {e}[/red]")
+        raise SystemExit(1)
+
+    start = time.perf_counter()
+    failed = 0
+    results = run_batch(specs, processes=args.processes, install=args.install, defer_install=args.defer_install)
+    for result in results:
+        if result.ok:
+            _console().print(f"[green]ok[/green]   {result.name}  {result.duration * 1000:.1f}ms  {result.path}")
+        else:
+            failed += 1
+            _console().print(f"[red]FAIL[/red] {result.name}  line {result.line}: {result.error}")
+    elapsed = time.perf_counter() - start
+
+    rate = len(specs) / elapsed if elapsed else 0.0
+    _console().print(
+        f"\n[bold]{len(specs)} projects ({failed} failed) in {elapsed:.2f}s — {rate:.1f} projects/sec[/bold]"
+    )
+    if failed:
+        raise SystemExit(1)
+
+
+def _parse_limits(values: list[str], defaults: dict[str, int]) -> dict[str, int]:
+    limits = dict(defaults)
+    for value in values:
+        ecosystem, sep, count = value.partition("=")
+        if not sep or not count.isdigit() or int(count) < 1:
+            raise SystemExit(f"Invalid --limit '{value}', expected ECOSYSTEM=N")
+        limits[ecosystem.strip()] = int(count)
+    return limits
+
+
+def _run_install_worker(args: argparse.Namespace) -> None:
+    from skelly.core.install_queue import (
+        DEFAULT_ECOSYSTEM_LIMITS, DONE, FAILED, PENDING, RUNNING, InstallQueue, InstallWorker,
+    )
+
+    queue = InstallQueue()
+    try:
+        if args.status:
+            for job in queue.jobs():
+                error = f"  [red]{job.error}[/red]" if job.status == FAILED else ""
+                _console().print(f"{job.status:<8} {job.label}  attempts: {job.attempts}  {job.project}{error}")
+            counts = queue.counts()
+            _console().print(
+                f"\n[bold]{counts[PENDING]} pending, {counts[RUNNING]} running, "
+                f"{counts[DONE]} done, {counts[FAILED]} failed[/bold]"
+            )
+            return
+
+        if args.retry_failed:
+            queue.retry_failed()
+        worker_options = {"limits": _parse_limits(args.limit, DEFAULT_ECOSYSTEM_LIMITS)}
+        if args.concurrency is not None:
+            worker_options["concurrency"] = args.concurrency
+        if args.retries is not None:
+            worker_options["retries"] = args.retries
+        if args.install_timeout:
+            worker_options["timeout"] = args.install_timeout
+        worker = InstallWorker(queue, **worker_options)
+        start = time.perf_counter()
+        stats = worker.run()
+        # Keep failed jobs for --status and --retry-failed.
+        queue.remove({DONE})
+    except (OSError, ValueError, SkellyError) as e:
+        _console().print(f"[red]Error: {e}[/red]")
+        raise SystemExit(1)
+
+    _console().print(
+        f"\n[bold]{stats[DONE]} installed, {stats[FAILED]} failed in {time.perf_counter() - start:.1f}s[/bold]"
+    )
+    if stats[FAILED]:
+        raise SystemExit(1)
+
+
+def _run_cache(args: argparse.Namespace) -> None:
+    import datetime
+
+    from skelly.core.node_cache import NodeModulesCache, format_size, parse_size
+
+    cache = NodeModulesCache.from_env() or NodeModulesCache()
+    if args.cache_command == "stats":
+        entries = cache.entries()
+        for entry in reversed(entries):
+            last_used = datetime.datetime.fromtimestamp(entry.last_used).strftime("%Y-%m-%d %H:%M")
+            _console().print(f"{entry.key[:16]}  {format_size(entry.size):>10}  last used {last_used}")
+        _console().print(
+            f"\n[bold]{len(entries)} entries, {format_size(sum(e.size for e in entries))} "
+            f"of {format_size(cache.max_bytes)} in {cache.root}[/bold]"
+        )
+        return
+
+    try:
+        max_bytes = 0 if args.all else parse_size(args.max_size) if args.max_size else None
+    except ValueError as e:
+        _console().print(f"[red]Error: {e}[/red]")
+        raise SystemExit(1)
+    removed = cache.prune(max_bytes)
+    _console().print(
+        f"[green]Removed {len(removed)} entries, freed {format_size(sum(e.size for e in removed))}[/green]"
+    )
+
+
+def _run_prefetch(args: argparse.Namespace) -> None:
+    from skelly.factories.backend_factory import BackendFactory
+
+    start = time.perf_counter()
+    try:
+        if args.stack == "java":
+            from skelly.strategies.backend import JavaSpringBackend
+
+            backend = JavaSpringBackend("skelly-prefetch")
+            artifacts = backend.prefetch(BackendFactory.get_library_names(BackendStack.JAVA), source=args.source)
+            summary = f"{len(artifacts)} Java artifacts with their dependencies into {backend.repository.path}"
+        else:
+            from skelly.strategies.backend import DjangoBackend
+
+            backend = DjangoBackend()
+            requirements = backend.prefetch(BackendFactory.get_library_names(BackendStack.DJANGO), source=args.source)
+            summary = f"wheels for {len(requirements)} Django requirements into {backend.wheelhouse.path}"
+    except (OSError, SkellyError) as e:
+        _console().print(f"[red]Error: {e}[/red]")
+        raise SystemExit(1)
+    _console().print(f"[green]Prefetched {summary} in {time.perf_counter() - start:.1f}s[/green]")
+
+
+def _known_packages() -> dict[str, list[str]]:
+    """Every package a generated project can pin, per ecosystem."""
+    from skelly.core.versions import MAVEN, NPM, PYPI
+    from skelly.factories.backend_factory import BackendFactory
+    from skelly.factories.frontend_factory import FrontendFactory
+    from skelly.strategies.backend import DjangoBackend, JavaSpringBackend
+
+    npm = [
+        package
+        for entry in [
+            *BackendFactory.get_library_names(BackendStack.EXPRESS),
+            *(name for stack in FrontendStack for name in FrontendFactory.get_library_names(stack)),
+        ]
+        for package in entry.split()
+    ]
+    maven = [
+        f"{group_id}:{artifact_id}"
+        for artifact_id, (group_id, version) in JavaSpringBackend.DEPENDENCY_MAP.items()
+        if version
+    ]
+    pypi = [name for name, _ in DjangoBackend.BASE_REQUIREMENTS]
+    pypi += BackendFactory.get_library_names(BackendStack.DJANGO)
+    return {NPM: npm, MAVEN: maven, PYPI: pypi}
+
+
+def _run_versions(args: argparse.Namespace) -> None:
+    import datetime
+
+    from skelly.core.versions import Registry, VersionIndex, default_index_path, refresh_index
+
+    if args.versions_command == "show":
+        index = VersionIndex.load()
+        for ecosystem, names in sorted(index.versions.items()):
+            for name, version in sorted(names.items()):
+                _console().print(f"{ecosystem:<6} {name} {version}")
+        if index.generated_at:
+            generated = datetime.datetime.fromtimestamp(index.generated_at).strftime("%Y-%m-%d %H:%M")
+            _console().print(f"\n[bold]{len(index)} packages, refreshed {generated}[/bold]")
+        else:
+            _console().print("[yellow]No version snapshot yet; run 'skelly versions refresh'.[/yellow]")
+        return
+
+    registry = Registry.from_directory(args.registry) if args.registry else Registry()
+    start = time.perf_counter()
+    try:
+        index, missing = refresh_index(_known_packages(), registry)
+        path = index.save(default_index_path())
+    except (OSError, SkellyError) as e:
+        _console().print(f"[red]Error: {e}[/red]")
+        raise SystemExit(1)
+    for name in missing:
+        _console().print(f"[yellow]Not found: {name} (left unpinned)[/yellow]")
+    _console().print(
+        f"[green]Pinned {len(index)} packages in {path} in {time.perf_counter() - start:.1f}s[/green]"
+    )
 
-    console.print("[bold green]Welcome to the Skelly CLI![/bold green]")
-    console.print("[dim]Project scaffolding with separated concerns[/dim]\n")
+
+def _compile_templates(args: argparse.Namespace) -> None:
+    from skelly.core.template_renderer import compile_templates
+
+    start = time.perf_counter()
+    target = compile_templates(args.target)
+    count = len(list(target.glob("tmpl_*.py")))
+    _console().print(
+        f"[green]Compiled {count} templates into {target} in {(time.perf_counter() - start) * 1000:.0f}ms[/green]"
+    )
+
+
+def _bundle_templates(args: argparse.Namespace) -> None:
+    from skelly.core.template_bundle import build_bundle
+
+    start = time.perf_counter()
+    try:
+        target = build_bundle(args.target)
+    except OSError as e:
+        _console().print(f"[red]Error: {e}[/red]")
+        raise SystemExit(1)
+    _console().print(
+        f"[green]Bundled templates into {target} ({target.stat().st_size} bytes) "
+        f"in {(time.perf_counter() - start) * 1000:.0f}ms[/green]"
+    )
+
+
+def _open_archive_stream(path: str, stdout):
+    if path == "-":
+        return contextlib.nullcontext(stdout)
+    return open(path, "wb")
+
+
+@contextlib.contextmanager
+def _instrumented(args: argparse.Namespace):
+    """Trace and/or profile the enclosed build as requested with --trace and --profile."""
+    with contextlib.ExitStack() as stack:
+        tracer = None
+        if args.trace:
+            from skelly.core.tracing import tracing
+            tracer = stack.enter_context(tracing())
+        profiler = None
+        if args.profile:
+            import cProfile
+            profiler = cProfile.Profile()
+        try:
+            if profiler is not None:
+                profiler.enable()
+            yield
+        finally:
+            if profiler is not None:
+                profiler.disable()
+                profiler.dump_stats(args.profile)
+                _console().print(f"[dim]Profile written to {args.profile} (view with: python -m pstats {args.profile})[/dim]")
+            if tracer is not None:
+                tracer.save(args.trace)
+                _console().print(f"[dim]Trace with {len(tracer.spans())} spans written to {args.trace}[/dim]")
+
+
+def _run_interactive(args: argparse.Namespace, stdout) -> None:
+    from skelly.core.spec import ProjectSpec, split_members
+
+    _console().print("[bold green]Welcome to the Skelly CLI![/bold green]")
+    _console().print("[dim]Project scaffolding with separated concerns[/dim]\n")
+
+    if args.diff and (not args.dry_run or args.output_archive):
+        _console().print("[red]Error: --diff needs --dry-run and compares with the output directory, "
+                         "not with an archive.[/red]")
+        return
 
     if args.dry_run:
-        console.print("[yellow]Running in dry-run mode — no files will be created.[/yellow]\n")
+        _console().print("[yellow]Running in dry-run mode — no files will be created.[/yellow]\n")
+
+    try:
+        backends, frontends = split_members(args.member or [])
+    except ValueError as e:
+        _console().print(f"[red]Error: {e}[/red]")
+        return
 
     project_name = _ask_project_name()
     if not project_name:
@@ -108,27 +686,135 @@ def main() -> None:
     frontend_libs, backend_libs = _ask_libraries(frontend_stack, backend_stack)
     arch_choice, custom_folders = _ask_architecture()
 
-    architecture_strategy = StrategyFactory.create_architecture(
-        arch_choice, project_name, backend_stack, custom_folders
+    spec = ProjectSpec(
+        name=project_name,
+        backend_stack=backend_stack,
+        frontend_stack=frontend_stack,
+        architecture=arch_choice,
+        custom_folders=tuple(custom_folders or ()),
+        backend_libraries=tuple(backend_libs),
+        frontend_libraries=tuple(frontend_libs),
+        schema=str(args.schema) if args.schema else None,
+        backends=backends,
+        frontends=frontends,
     )
-    backend_strategy = StrategyFactory.create_backend(backend_stack, project_name)
-    frontend_strategy = StrategyFactory.create_frontend(frontend_stack)
-
-    builder = ProjectBuilder(dry_run=args.dry_run)
-    builder.set_meta_data(project_name)\
-           .set_frontend_stack(frontend_stack.value)\
-           .set_backend_stack(backend_stack.value)\
-           .set_architecture(architecture_strategy.get_name())\
-           .add_frontend_libraries(frontend_libs)\
-           .add_backend_libraries(backend_libs)\
-           .with_architecture_strategy(architecture_strategy)\
-           .with_backend_strategy(backend_strategy)\
-           .with_frontend_strategy(frontend_strategy)
+    builder_options = {"dry_run": args.dry_run}
+    if args.jobs:
+        builder_options["workers"] = args.jobs
+    if args.render_processes:
+        builder_options["render_processes"] = args.render_processes
+    if args.install_timeout:
+        builder_options["install_timeout"] = args.install_timeout
+    if args.defer_install:
+        builder_options["defer_install"] = True
+    if args.resume:
+        builder_options["resume"] = True
+    if args.git:
+        from skelly.core.git_import import GitCommit
+
+        commit = {"author": args.git_author, "message": args.git_message}
+        builder_options["git"] = GitCommit(**{key: value for key, value in commit.items() if value})
+    try:
+        builder = spec.create_builder(**builder_options)
+    except (ValueError, SkellyError) as e:
+        _console().print(f"[red]Error: {e}[/red]")
+        return
 
-    builder.build()
+    try:
+        with _instrumented(args):
+            if args.diff:
+                _print_diff(builder.diff(), args.diff)
+                return
+            if args.output_archive:
+                archive_format = args.archive_format or archive_format_for(args.output_archive)
+                with _open_archive_stream(args.output_archive, stdout) as stream, \
+                        open_archive(stream, archive_format, prefix=project_name) as output:
+                    builder.with_output(output).build()
+            else:
+                builder.build()
+    except (OSError, SkellyError) as e:
+        _console().print(f"[red]Error: {e}[/red]")
+        return
 
     if not args.dry_run:
-        console.print("\n[bold green]Project scaffolding complete![/bold green]")
+        _console().print("\n[bold green]Project scaffolding complete![/bold green]")
+
+
+def _print_diff(diff, diff_format: str) -> None:
+    from skelly.core.diff import ADD, CONFLICT, MODIFY, UNCHANGED
+
+    if diff_format == "json":
+        print(json.dumps(diff.to_dict(), indent=2))
+        return
+    markers = {ADD: "[green]+[/green]", MODIFY: "[yellow]~[/yellow]", CONFLICT: "[red]![/red]"}
+    for entry in diff.entries:
+        if entry.status in markers:
+            suffix = "/" if entry.kind == "folder" else ""
+            reason = f" [dim]({entry.reason})[/dim]" if entry.reason else ""
+            _console().print(f"  {markers[entry.status]} {entry.path}{suffix}{reason}", highlight=False)
+    counts = diff.counts()
+    _console().print(f"\n[bold]{counts[ADD]} to add, {counts[MODIFY]} to modify, {counts[UNCHANGED]} unchanged, "
+                     f"{counts[CONFLICT]} in conflict[/bold] under {diff.root}")
+
+
+def _event_sink(args: argparse.Namespace):
+    """The sink for build events selected with --events."""
+    from skelly.core.events import ConsoleSink, JsonLinesSink, ProgressSink, null_sink
+
+    # A JSON diff is the only output on stdout.
+    default = "none" if args.diff == "json" else "progress"
+    kind = args.events or {None: default, "batch": "none", "serve": "none"}.get(args.command, "console")
+    if kind == "progress":
+        return ProgressSink(_console())
+    if kind == "console":
+        return ConsoleSink(_console())
+    if kind == "jsonl":
+        return JsonLinesSink()
+    return null_sink
+
+
+def main() -> None:
+    args = _parse_args()
+
+    from skelly.core.events import subscribed
+
+    with subscribed(_event_sink(args)):
+        _dispatch(args)
+
+
+def _dispatch(args: argparse.Namespace) -> None:
+    if args.command == "batch":
+        _run_batch(args)
+        return
+    if args.command == "serve":
+        _run_serve(args)
+        return
+    if args.command == "install-worker":
+        _run_install_worker(args)
+        return
+    if args.command == "cache":
+        _run_cache(args)
+        return
+    if args.command == "prefetch":
+        _run_prefetch(args)
+        return
+    if args.command == "versions":
+        _run_versions(args)
+        return
+    if args.command == "compile-templates":
+        _compile_templates(args)
+        return
+    if args.command == "bundle-templates":
+        _bundle_templates(args)
+        return
+
+    if args.output_archive == "-":
+        # stdout carries the archive; prompts and progress output go to stderr.
+        stdout = sys.stdout.buffer
+        with contextlib.redirect_stdout(sys.stderr):
+            _run_interactive(args, stdout)
+    else:
+        _run_interactive(args, None)
 
 
 if __name__ == "__main__":
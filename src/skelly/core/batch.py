@@ -0,0 +1,86 @@
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterator
+
+from skelly.core.exceptions import BuildError, SkellyError
+from skelly.core.spec import ProjectSpec
+from skelly.core.template_renderer import preload_templates
+
+
+@dataclass(frozen=True)
+class BatchResult:
+    """Outcome of a single project build within a batch run."""
+
+    line: int
+    name: str
+    ok: bool
+    duration: float
+    path: str | None = None
+    error: str | None = None
+
+
+def load_specs(spec_file: Path) -> list[tuple[int, dict]]:
+    """Read a JSONL spec file and return (line number, spec data) pairs; blank lines are skipped."""
+    specs = []
+    with open(spec_file) as f:
+        for lineno, line in enumerate(f, start=1):
+            if not line.strip():
+                continue
+            try:
+                data = json.loads(line)
+            except json.JSONDecodeError as e:
+                raise BuildError(f"{spec_file}:{lineno}: invalid JSON ({e.msg})") from e
+            if not isinstance(data, dict):
+                raise BuildError(f"{spec_file}:{lineno}: expected a JSON object")
+            specs.append((lineno, data))
+    return specs
+
+
+def _warm_worker() -> None:
+    """Process pool initializer: compile all templates once per worker process."""
+    preload_templates()
+
+
+def build_spec(lineno: int, data: dict, install: bool = False, defer_install: bool = False) -> BatchResult:
+    """Build one project from spec data, capturing any error; progress events go to no sink."""
+    name = str(data.get("name", "?"))
+    start = time.perf_counter()
+    try:
+        spec = ProjectSpec.from_dict(data)
+        builder = spec.create_builder(workers=1, install=install or defer_install, defer_install=defer_install)
+        config = builder.build()
+    except (SkellyError, ValueError) as e:
+        return BatchResult(lineno, name, False, time.perf_counter() - start, error=str(e))
+    path = str(Path(config.output_path) / config.name)
+    return BatchResult(lineno, name, True, time.perf_counter() - start, path=path)
+
+
+def run_batch(
+    specs: list[tuple[int, dict]],
+    processes: int | None = None,
+    install: bool = False,
+    defer_install: bool = False,
+) -> Iterator[BatchResult]:
+    """
+    Build every spec and yield results as they complete.
+
+    Builds are spread over a process pool whose workers keep their template
+    environment warm between projects. With processes=1 everything runs in
+    the current process. With defer_install the dependency installs are
+    queued for `skelly install-worker` instead of run.
+    """
+    processes = processes or os.cpu_count() or 1
+    if processes == 1:
+        _warm_worker()
+        for lineno, data in specs:
+            yield build_spec(lineno, data, install, defer_install)
+        return
+
+    with ProcessPoolExecutor(max_workers=processes, initializer=_warm_worker) as pool:
+        futures = [pool.submit(build_spec, lineno, data, install, defer_install) for lineno, data in specs]
+        for future in as_completed(futures):
+            yield future.result()
@@ -2,8 +2,22 @@ import logging
 import os
 from pathlib import Path
 
+from skelly.core.diff import PlanDiff, diff_plan
+from skelly.core.events import BuildFinished, BuildStarted, Message, emit
 from skelly.core.exceptions import BuildError
+from skelly.core.executor import DEFAULT_WORKERS, ApplyResult, PlanExecutor
+from skelly.core.git_import import GITIGNORE, GitCommit, gitignore, initialize_repository
+from skelly.core.install_queue import InstallQueue
+from skelly.core.installer import DEFAULT_TIMEOUT, InstallRunner, StepResult
+from skelly.core.journal import StepJournal, plan_fingerprint
+from skelly.core.manifest import hash_config
 from skelly.core.models import ProjectConfig
+from skelly.core.lockfiles import LockfileStore
+from skelly.core.node_cache import NodeModulesCache
+from skelly.core.output import OutputBackend
+from skelly.core.plan import BuildPlan
+from skelly.core.tracing import span
+from skelly.core.workspace import Workspace, WorkspaceMember, member_directory
 from skelly.strategies.base import ArchitectureStrategy, BackendStrategy, FrontendStrategy
 
 logger = logging.getLogger(__name__)
@@ -15,10 +29,26 @@ class ProjectBuilder:
     Orchestrates architecture, backend, and frontend strategies.
 
     Collects configuration in mutable fields, then creates a frozen
-    ProjectConfig at build time.
+    ProjectConfig at build time. The strategies contribute to an in-memory
+    BuildPlan which is applied to disk in a single pass.
+
+    Instead of one backend and one frontend, a build may have several of
+    each, added with add_backend()/add_frontend() into their own
+    directories. The project then becomes a workspace whose members share
+    one npm install and one Maven build (see Workspace).
     """
 
-    def __init__(self, dry_run: bool = False):
+    def __init__(
+        self,
+        dry_run: bool = False,
+        workers: int = DEFAULT_WORKERS,
+        render_processes: int = 1,
+        install: bool = True,
+        install_timeout: float = DEFAULT_TIMEOUT,
+        defer_install: bool = False,
+        resume: bool = False,
+        git: GitCommit | None = None,
+    ):
         self._name: str | None = None
         self._frontend_stack: str = ""
         self._backend_stack: str = ""
@@ -29,12 +59,26 @@ class ProjectBuilder:
         self._architecture: ArchitectureStrategy | None = None
         self._backend: BackendStrategy | None = None
         self._frontend: FrontendStrategy | None = None
+        self._members: list[WorkspaceMember] = []
+        self._workspace: Workspace | None = None
+        self._output: OutputBackend | None = None
         self._dry_run = dry_run
+        self._workers = workers
+        self._render_processes = render_processes
+        self._install = install
+        self._install_timeout = install_timeout
+        self._defer_install = defer_install
+        self._resume = resume
+        self._git = git
 
     def set_meta_data(self, name: str) -> "ProjectBuilder":
         self._name = name
         return self
 
+    def set_output_path(self, path: str) -> "ProjectBuilder":
+        self._output_path = path
+        return self
+
     def set_frontend_stack(self, stack: str) -> "ProjectBuilder":
         self._frontend_stack = stack
         return self
@@ -67,6 +111,42 @@ class ProjectBuilder:
         self._frontend = strategy
         return self
 
+    def add_backend(
+        self,
+        directory: str,
+        strategy: BackendStrategy,
+        architecture: ArchitectureStrategy | None = None,
+        libraries: list[str] | None = None,
+    ) -> "ProjectBuilder":
+        """
+        Add a backend workspace member in its own directory.
+        Without architecture or libraries it uses the build's architecture strategy and backend libraries.
+        """
+        libs = tuple(libraries) if libraries is not None else None
+        self._members.append(WorkspaceMember(member_directory(directory), strategy, architecture, libs))
+        return self
+
+    def add_frontend(
+        self, directory: str, strategy: FrontendStrategy, libraries: list[str] | None = None
+    ) -> "ProjectBuilder":
+        """Add a frontend workspace member in its own directory."""
+        libs = tuple(libraries) if libraries is not None else None
+        self._members.append(WorkspaceMember(member_directory(directory), strategy, libraries=libs))
+        return self
+
+    def with_output(self, output: OutputBackend | None) -> "ProjectBuilder":
+        """Send the project to another destination (archive, memory) instead of the output path."""
+        self._output = output
+        return self
+
+    def _resolve_workspace(self) -> None:
+        """Turn the added members into the build's Workspace."""
+        if not self._members:
+            return
+        if self._backend or self._frontend:
+            raise BuildError("Use either add_backend()/add_frontend() or the single backend and frontend strategies.")
+        self._workspace = Workspace(self._members)
+
     def _create_config(self) -> ProjectConfig:
         """Create an immutable ProjectConfig from the collected builder state."""
         return ProjectConfig(
@@ -79,101 +159,234 @@ class ProjectBuilder:
             output_path=self._output_path,
         )
 
-    def build(self) -> ProjectConfig:
+    def _validate(self) -> None:
         if not self._name:
             raise BuildError("Project name is not set. Call set_meta_data() first.")
 
         if not self._architecture:
             raise BuildError("Architecture strategy is required. Call with_architecture_strategy() first.")
 
+        self._resolve_workspace()
+
+    def build(self) -> ProjectConfig:
+        self._validate()
         config = self._create_config()
 
         if self._dry_run:
             return self._build_dry_run(config)
 
-        print(f"\n[bold]Building project '{config.name}'...[/bold]")
-        print(f"  Architecture: {self._architecture.get_name()}")
-        if self._backend:
-            print(f"  Backend: {self._backend.get_name()}")
-        if self._frontend:
-            print(f"  Frontend: {self._frontend.get_name()}")
-
         base_path = Path(config.output_path) / config.name
+        emit(self._build_started(config, base_path))
 
         try:
-            self._create_root_directory(base_path)
-            self._create_folder_structure(base_path)
-            self._setup_backend(config, base_path)
-            self._setup_frontend(config, base_path)
-        except PermissionError:
+            with span("build", project=config.name):
+                journal = None
+                if self._output is None:
+                    self._create_root_directory(base_path)
+                    journal = StepJournal(base_path, resume=self._resume)
+                    journal.record(("root", hash_config(config)))
+                with span("plan"):
+                    steps = self._plan_steps(config)
+                    plan = BuildPlan.merged(part for _, part in steps)
+                target = self._output if self._output is not None else base_path
+                with span("apply"):
+                    applied = self._apply(plan, steps, target, config, journal)
+                if self._git is not None and self._output is None:
+                    with span("git"):
+                        self._commit(base_path, plan, applied)
+                # Dependencies can only be installed into a project on disk.
+                if self._install and self._output is None:
+                    with span("install"):
+                        self._install_dependencies(base_path, config, journal)
+        except PermissionError as e:
             logger.exception("Permission denied for %s", base_path)
-            print(f"[red]Error: Permission denied. Cannot write to {base_path}.[/red]")
+            raise BuildError(f"Permission denied. Cannot write to {base_path}.") from e
         except BuildError:
             raise
         except Exception as e:
             logger.exception("Unexpected error during build")
-            print(f"[red]An unexpected error occurred during build: {e}[/red]")
-
-        print("\n[bold]Final Configuration:[/bold]")
-        print(config)
+            raise BuildError(f"An unexpected error occurred during build: {e}") from e
 
+        emit(BuildFinished(config.name, str(base_path), config))
         return config
 
-    def _build_dry_run(self, config: ProjectConfig) -> ProjectConfig:
-        """Preview what would be created without writing any files."""
-        print("\n[bold yellow]DRY RUN — No files will be created.[/bold yellow]")
-        print(f"\n[bold]Project: '{config.name}'[/bold]")
-        print(f"  Architecture: {self._architecture.get_name()}")
+    def _build_started(self, config: ProjectConfig, base_path: Path) -> BuildStarted:
+        return BuildStarted(
+            name=config.name,
+            path=str(base_path),
+            architecture=self._architecture.get_name(),
+            backend=self._describe(True) if self._workspace else self._backend and self._backend.get_name(),
+            frontend=self._describe(False) if self._workspace else self._frontend and self._frontend.get_name(),
+            dry_run=self._dry_run,
+        )
+
+    def _describe(self, backends: bool) -> str | None:
+        """Workspace members of one kind as 'orders (Express.js), billing (Java Spring Boot)'."""
+        members = [f"{m.directory} ({m.strategy.get_name()})" for m in self._members if m.is_backend == backends]
+        return ", ".join(members) or None
+
+    def create_plan(self, config: ProjectConfig) -> BuildPlan:
+        """Collect every folder and file of the project without touching the disk."""
+        self._resolve_workspace()
+        return BuildPlan.merged(part for _, part in self._plan_steps(config))
+
+    def _plan_steps(self, config: ProjectConfig) -> list[tuple[str, BuildPlan]]:
+        """The plan split into journal steps: the folders, then the files of each strategy or workspace member."""
+        if self._workspace is not None:
+            steps = self._workspace.plan(config, self._architecture)
+            if self._git is not None:
+                steps.append(("files:git", BuildPlan().add_file(GITIGNORE, gitignore(self._workspace.ignore_patterns()))))
+            return steps
+        folders = BuildPlan()
+        with span("collect_folders"):
+            folders.add_folders(self._collect_all_folders())
+        steps = [("folders", folders)]
         if self._backend:
-            print(f"  Backend: {self._backend.get_name()}")
+            steps.append((f"files:{self._backend.get_name()}", self._plan_backend(config, BuildPlan())))
         if self._frontend:
-            print(f"  Frontend: {self._frontend.get_name()}")
+            steps.append((f"files:{self._frontend.get_name()}", self._plan_frontend(config, BuildPlan())))
+        if self._git is not None:
+            patterns = [pattern for strategy in (self._backend, self._frontend) if strategy
+                        for pattern in strategy.get_ignore_patterns()]
+            steps.append(("files:git", BuildPlan().add_file(GITIGNORE, gitignore(patterns))))
+        return steps
+
+    def _apply(
+        self,
+        plan: BuildPlan,
+        steps: list[tuple[str, BuildPlan]],
+        target: Path | OutputBackend,
+        config: ProjectConfig,
+        journal: StepJournal | None,
+    ) -> ApplyResult | None:
+        """Apply the plan unless a resumed journal has it as done; returns None when skipped."""
+        executor = PlanExecutor(self._workers, processes=self._render_processes)
+        # The initial git commit is written from the rendered contents rather than from disk.
+        keep_content = self._git is not None and self._output is None
+        if journal is None:
+            return executor.apply(plan, target, config_hash=hash_config(config), keep_content=keep_content)
+        from skelly.core.template_cache import templates_checksum
+
+        templates = templates_checksum()
+        completed = [(name, plan_fingerprint(part, templates)) for name, part in steps]
+        if all(journal.done(name, inputs) for name, inputs in completed):
+            emit(Message("Folders and files unchanged since the interrupted build, skipped.", "dim"))
+            return None
+        result = executor.apply(plan, target, config_hash=hash_config(config), keep_content=keep_content)
+        journal.record(*completed)
+        return result
+
+    def _commit(self, base_path: Path, plan: BuildPlan, applied: ApplyResult | None) -> None:
+        if (base_path / ".git").exists():
+            emit(Message(f"'{base_path}' already is a git repository; no initial commit created.", "yellow"))
+            return
+        contents = applied.contents if applied is not None else {}
+
+        def files():
+            for planned in plan.files:
+                data = contents.get(planned.path)
+                if data is None:
+                    # Not rendered in this run (kept local changes, resumed build): commit what is on disk.
+                    data = (base_path / planned.path).read_bytes()
+                yield planned.path, data
 
+        try:
+            commit = initialize_repository(base_path, files(), self._git)
+        except BuildError as e:
+            emit(Message(f"Could not create the git repository: {e}", "red"))
+            return
+        emit(Message(f"Initialized git repository with commit {commit[:12]} on '{self._git.branch}'.", "green"))
+
+    def _build_dry_run(self, config: ProjectConfig) -> ProjectConfig:
+        """Preview what would be created without writing any files."""
         base_path = Path(config.output_path) / config.name
+        emit(self._build_started(config, base_path))
         all_folders = self._collect_all_folders()
 
-        print(f"\n[bold]Would create {len(all_folders)} folders under {base_path}:[/bold]")
+        emit(Message(f"\nWould create {len(all_folders)} folders under {base_path}:", "bold"))
         for folder in sorted(all_folders):
-            print(f"  [dim]{folder}/[/dim]")
+            emit(Message(f"  {folder}/", "dim"))
 
         if config.backend_libraries:
-            print(f"\n[bold]Backend libraries:[/bold] {', '.join(config.backend_libraries)}")
+            emit(Message(f"\nBackend libraries: {', '.join(config.backend_libraries)}", "bold"))
         if config.frontend_libraries:
-            print(f"[bold]Frontend libraries:[/bold] {', '.join(config.frontend_libraries)}")
+            emit(Message(f"Frontend libraries: {', '.join(config.frontend_libraries)}", "bold"))
 
         return config
 
+    def diff(self) -> PlanDiff:
+        """
+        Compare the whole planned project (folders and rendered files) with what is
+        already in its directory, without writing anything.
+        """
+        self._validate()
+        config = self._create_config()
+        base_path = Path(config.output_path) / config.name
+        emit(self._build_started(config, base_path))
+        with span("diff", project=config.name):
+            with span("plan"):
+                plan = BuildPlan.merged(part for _, part in self._plan_steps(config))
+            return diff_plan(plan, base_path, processes=self._render_processes)
+
     def _create_root_directory(self, base_path: Path) -> None:
         if not base_path.exists():
             os.makedirs(base_path)
-            print(f"[green]Created project root at: {base_path.absolute()}[/green]")
+            emit(Message(f"Created project root at: {base_path.absolute()}", "green"))
         else:
-            print(f"[yellow]Warning: Project folder '{base_path}' already exists.[/yellow]")
-
-    def _create_folder_structure(self, base_path: Path) -> None:
-        all_folders = self._collect_all_folders()
-        print(f"\n[dim]Creating {len(all_folders)} folders...[/dim]")
-        for folder in all_folders:
-            full_path = base_path / folder
-            os.makedirs(full_path, exist_ok=True)
-            (full_path / ".gitkeep").touch()
-        print("[green]Folder structure created successfully.[/green]")
-
-    def _setup_backend(self, config: ProjectConfig, base_path: Path) -> None:
-        if not self._backend:
-            return
-        print(f"\n[bold]Setting up {self._backend.get_name()} backend...[/bold]")
-        self._backend.create_config_files(config, base_path)
-        self._backend.install_dependencies(base_path)
-
-    def _setup_frontend(self, config: ProjectConfig, base_path: Path) -> None:
-        if not self._frontend:
-            return
-        print(f"\n[bold]Setting up {self._frontend.get_name()} frontend...[/bold]")
-        self._frontend.create_config_files(config, base_path)
-        self._frontend.install_dependencies(base_path)
+            emit(Message(f"Project folder '{base_path}' already exists; only changed files will be written.", "yellow"))
+
+    def _plan_backend(self, config: ProjectConfig, plan: BuildPlan) -> BuildPlan:
+        emit(Message(f"\nSetting up {self._backend.get_name()} backend...", "bold"))
+        with span("create_config_files", "strategy", strategy=self._backend.get_name()):
+            self._backend.create_config_files(config, plan)
+        return plan
+
+    def _plan_frontend(self, config: ProjectConfig, plan: BuildPlan) -> BuildPlan:
+        emit(Message(f"\nSetting up {self._frontend.get_name()} frontend...", "bold"))
+        with span("create_config_files", "strategy", strategy=self._frontend.get_name()):
+            self._frontend.create_config_files(config, plan)
+        return plan
+
+    def _install_dependencies(
+        self, base_path: Path, config: ProjectConfig, journal: StepJournal | None = None
+    ) -> list[StepResult]:
+        """
+        Run the backend and frontend installs concurrently; each strategy's own steps stay in order.
+        With defer_install the steps are only added to the install queue for `skelly install-worker`.
+        """
+        if self._defer_install:
+            # The worker runs from a different working directory.
+            base_path = base_path.resolve()
+        sequences = []
+        if self._workspace is not None:
+            sequences = self._workspace.install_steps(base_path, config)
+        for strategy, libraries in ((self._backend, config.backend_libraries),
+                                    (self._frontend, config.frontend_libraries)):
+            if strategy:
+                with span("get_install_steps", "strategy", strategy=strategy.get_name()):
+                    sequences.append(strategy.get_install_steps(base_path, libraries))
+        if not any(sequences):
+            return []
+
+        if self._defer_install:
+            queue = InstallQueue()
+            jobs = queue.enqueue(base_path, sequences)
+            emit(Message(f"\nQueued {len(jobs)} install job(s) in {queue.path}; run 'skelly install-worker' to install.",
+                         "yellow"))
+            return []
+
+        emit(Message("\nInstalling dependencies...", "bold"))
+        runner = InstallRunner(
+            timeout=self._install_timeout,
+            node_cache=NodeModulesCache.from_env(),
+            lockfiles=LockfileStore.from_env(),
+            journal=journal,
+        )
+        return runner.run(sequences)
 
     def _collect_all_folders(self) -> list[str]:
+        if self._workspace is not None:
+            return self._workspace.folders(self._architecture)
         folders = list(self._architecture.get_folders())
         if self._backend:
             folders.extend(self._backend.get_folders())
@@ -0,0 +1,163 @@
+import hashlib
+import os
+from dataclasses import dataclass
+from pathlib import Path
+
+from skelly.core.executor import render_in_processes
+from skelly.core.manifest import MANIFEST_DIR, MANIFEST_PATH, Manifest, content_hash
+from skelly.core.output import FileSystemOutput
+from skelly.core.plan import BuildPlan, PlannedFile
+from skelly.core.tracing import span
+
+ADD = "add"
+MODIFY = "modify"
+UNCHANGED = "unchanged"
+CONFLICT = "conflict"
+STATUSES = (ADD, MODIFY, UNCHANGED, CONFLICT)
+
+FOLDER = "folder"
+FILE = "file"
+
+
+@dataclass(frozen=True)
+class DiffEntry:
+    """What applying the plan would do to one folder or file."""
+
+    path: str
+    kind: str
+    status: str
+    #: Why a conflicting path would not be written as planned.
+    reason: str | None = None
+
+    def to_dict(self) -> dict:
+        data = {"path": self.path, "type": self.kind, "status": self.status}
+        if self.reason:
+            data["reason"] = self.reason
+        return data
+
+
+@dataclass
+class PlanDiff:
+    """The planned project compared with an existing directory, entry by entry."""
+
+    root: str
+    entries: list[DiffEntry]
+
+    def counts(self) -> dict[str, int]:
+        counts = dict.fromkeys(STATUSES, 0)
+        for entry in self.entries:
+            counts[entry.status] += 1
+        return counts
+
+    def to_dict(self) -> dict:
+        return {"root": self.root, "counts": self.counts(), "entries": [entry.to_dict() for entry in self.entries]}
+
+
+def index_tree(root: Path, directories: set[str]) -> dict[str, os.DirEntry]:
+    """
+    Every entry of the root and of the given directories below it, by project-relative path.
+
+    A single os.scandir walk that only descends into the given directories,
+    so the cost follows the size of the plan rather than that of the tree
+    (node_modules, build output). Missing directories are simply absent.
+    """
+    index = {}
+    pending = [("", os.fspath(root))]
+    while pending:
+        prefix, directory = pending.pop()
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    path = prefix + entry.name
+                    index[path] = entry
+                    if path in directories and entry.is_dir():
+                        pending.append((path + "/", entry.path))
+        except (FileNotFoundError, NotADirectoryError):
+            continue
+    return index
+
+
+def _directories(paths: list[str]) -> set[str]:
+    """The directories whose listings contain the given paths, plus the manifest's."""
+    directories = {MANIFEST_DIR}
+    for path in paths:
+        parent = path.rpartition("/")[0]
+        while parent and parent not in directories:
+            directories.add(parent)
+            parent = parent.rpartition("/")[0]
+    return directories
+
+
+def _digest(planned: PlannedFile) -> str:
+    digest = hashlib.sha256()
+    for block in planned.stream():
+        digest.update(block)
+    return digest.hexdigest()
+
+
+def _digests(files: list[PlannedFile], processes: int) -> dict[str, str]:
+    """Hashes of the rendered files, rendered in a process pool when processes > 1."""
+    if processes == 1:
+        return {planned.path: _digest(planned) for planned in files}
+    return {
+        planned.path: content_hash(data) if data is not None else _digest(planned)
+        for planned, data in render_in_processes(files, processes)
+    }
+
+
+def diff_plan(plan: BuildPlan, root: Path, processes: int = 1) -> PlanDiff:
+    """
+    Compare a plan with the directory it would be applied to, without writing anything.
+
+    Statuses follow PlanExecutor: files that are not on disk yet are added
+    (and not rendered at all), files with other content than the rendering
+    are modified, and files the user edited since the last generation
+    (according to .skelly/manifest.json) are conflicts because they would be
+    kept. A file where a folder is planned, or the other way round, is a
+    conflict as well.
+    """
+    root = Path(root)
+    files = plan.files
+    directories = _directories([*plan.folders, *(planned.path for planned in files)])
+    with span("index_tree", directories=len(directories)):
+        index = index_tree(root, directories)
+    previous = Manifest.load(FileSystemOutput(root)) if MANIFEST_PATH in index else None
+
+    entries = []
+    for folder in plan.folders:
+        entry = index.get(folder)
+        if entry is None:
+            entries.append(DiffEntry(folder, FOLDER, ADD))
+        elif entry.is_dir():
+            entries.append(DiffEntry(folder, FOLDER, UNCHANGED))
+        else:
+            entries.append(DiffEntry(folder, FOLDER, CONFLICT, "a file is in its place"))
+
+    existing = [planned for planned in files if planned.path in index and not index[planned.path].is_dir()]
+    with span("hash_files", count=len(existing), processes=processes):
+        digests = _digests(existing, processes)
+
+    for planned in files:
+        entry = index.get(planned.path)
+        if entry is None:
+            entries.append(DiffEntry(planned.path, FILE, ADD))
+        elif planned.path not in digests:
+            entries.append(DiffEntry(planned.path, FILE, CONFLICT, "a directory is in its place"))
+        else:
+            entries.append(_compare(planned.path, entry, digests[planned.path], previous))
+    entries.sort(key=lambda entry: entry.path)
+    return PlanDiff(str(root), entries)
+
+
+def _compare(path: str, entry: os.DirEntry, new_hash: str, previous: Manifest | None) -> DiffEntry:
+    recorded = previous.files.get(path) if previous else None
+    if recorded and recorded.matches_stat(entry.stat()):
+        disk_hash = recorded.sha256
+    else:
+        with open(entry.path, "rb") as f:
+            disk_hash = content_hash(f.read())
+    if disk_hash == new_hash:
+        return DiffEntry(path, FILE, UNCHANGED)
+    if previous is not None and (recorded is None or recorded.sha256 != disk_hash):
+        return DiffEntry(path, FILE, CONFLICT, "modified since it was generated")
+    return DiffEntry(path, FILE, MODIFY)
@@ -0,0 +1,187 @@
+import json
+import re
+from dataclasses import dataclass
+from pathlib import Path
+
+from skelly.core.exceptions import BuildError
+
+#: Schema field types with their Java type and the JSDoc type used in the Express templates.
+FIELD_TYPES = {
+    "string": ("String", "string"),
+    "text": ("String", "string"),
+    "integer": ("Integer", "number"),
+    "long": ("Long", "number"),
+    "decimal": ("java.math.BigDecimal", "number"),
+    "number": ("Double", "number"),
+    "boolean": ("Boolean", "boolean"),
+    "date": ("java.time.LocalDate", "string"),
+    "datetime": ("java.time.Instant", "string"),
+    "uuid": ("java.util.UUID", "string"),
+}
+
+_IDENTIFIER = re.compile(r"^[A-Za-z][A-Za-z0-9_]*$")
+_WORDS = re.compile(r"[A-Z]+(?![a-z])|[A-Z]?[a-z0-9]+")
+# Java and JavaScript keywords that cannot be used as field names.
+_RESERVED = {
+    "abstract", "boolean", "break", "case", "catch", "class", "const", "continue", "default", "delete", "do",
+    "double", "else", "enum", "export", "extends", "final", "finally", "for", "function", "if", "implements",
+    "import", "in", "instanceof", "int", "interface", "let", "long", "new", "package", "private", "protected",
+    "public", "return", "static", "super", "switch", "this", "throw", "try", "typeof", "var", "void", "while",
+}
+
+
+def _words(name: str) -> list[str]:
+    return [word.lower() for word in _WORDS.findall(name)]
+
+
+def _camel(words: list[str]) -> str:
+    return words[0] + "".join(word.capitalize() for word in words[1:])
+
+
+def pluralize(word: str) -> str:
+    if re.search(r"[^aeiou]y$", word):
+        return word[:-1] + "ies"
+    if re.search(r"(s|x|z|ch|sh)$", word):
+        return word + "es"
+    return word + "s"
+
+
+@dataclass(frozen=True)
+class Field:
+    name: str
+    type: str
+
+    @property
+    def java_type(self) -> str:
+        return FIELD_TYPES[self.type][0]
+
+    @property
+    def js_type(self) -> str:
+        return FIELD_TYPES[self.type][1]
+
+    @property
+    def capitalized(self) -> str:
+        return self.name[0].upper() + self.name[1:]
+
+
+@dataclass(frozen=True)
+class Entity:
+    """
+    A domain entity of the schema. The name is PascalCase ("OrderItem");
+    the other spellings templates need are derived from it.
+    """
+
+    name: str
+    fields: tuple[Field, ...]
+
+    @property
+    def var_name(self) -> str:
+        """camelCase: orderItem."""
+        return _camel(_words(self.name))
+
+    @property
+    def route(self) -> str:
+        """Plural kebab-case path segment: order-items."""
+        words = _words(self.name)
+        return "-".join([*words[:-1], pluralize(words[-1])])
+
+    @property
+    def plural_var_name(self) -> str:
+        """Plural camelCase: orderItems."""
+        words = _words(self.name)
+        return _camel([*words[:-1], pluralize(words[-1])])
+
+    def context(self) -> dict[str, object]:
+        """Plain, picklable template context for this entity."""
+        return {
+            "name": self.name,
+            "var_name": self.var_name,
+            "plural_var_name": self.plural_var_name,
+            "route": self.route,
+            "fields": [
+                {"name": f.name, "capitalized": f.capitalized, "java_type": f.java_type, "js_type": f.js_type}
+                for f in self.fields
+            ],
+        }
+
+
+@dataclass(frozen=True)
+class DomainSchema:
+    """The entities to generate code for in hexagonal projects."""
+
+    entities: tuple[Entity, ...]
+
+    @classmethod
+    def from_dict(cls, data: object) -> "DomainSchema":
+        """
+        Parse {"entities": [{"name": "Order", "fields": {"total": "decimal"}}]}.
+        Fields may also be given as a list of {"name": ..., "type": ...} objects.
+        """
+        if not isinstance(data, dict) or not isinstance(data.get("entities"), list) or not data["entities"]:
+            raise ValueError("Schema must be an object with a non-empty 'entities' list")
+        entities = []
+        seen = set()
+        for index, raw in enumerate(data["entities"]):
+            if not isinstance(raw, dict) or not isinstance(raw.get("name"), str):
+                raise ValueError(f"Entity #{index + 1} needs a 'name'")
+            name = raw["name"]
+            if not _IDENTIFIER.match(name) or not name[0].isupper():
+                raise ValueError(f"Entity name must be a PascalCase identifier: {name!r}")
+            if name in seen:
+                raise ValueError(f"Duplicate entity: {name}")
+            seen.add(name)
+            entity = Entity(name, _parse_fields(name, raw.get("fields", {})))
+            if entity.var_name in _RESERVED:
+                raise ValueError(f"Entity name {name!r} is a reserved word in Java or JavaScript")
+            entities.append(entity)
+        return cls(tuple(entities))
+
+    def __len__(self) -> int:
+        return len(self.entities)
+
+
+def _parse_fields(entity: str, raw: object) -> tuple[Field, ...]:
+    if isinstance(raw, dict):
+        pairs = list(raw.items())
+    elif isinstance(raw, list):
+        pairs = [(item.get("name"), item.get("type", "string")) for item in raw if isinstance(item, dict)]
+    else:
+        raise ValueError(f"{entity}: 'fields' must be an object or a list")
+    fields = []
+    for name, type_name in pairs:
+        if not isinstance(name, str) or not _IDENTIFIER.match(name) or name in _RESERVED or name == "id":
+            raise ValueError(f"{entity}: invalid field name {name!r}")
+        if type_name not in FIELD_TYPES:
+            raise ValueError(f"{entity}.{name}: unknown type {type_name!r}. Expected one of: {', '.join(FIELD_TYPES)}")
+        fields.append(Field(name, type_name))
+    return tuple(fields)
+
+
+def load_schema(path: Path) -> DomainSchema:
+    """
+    Read a domain schema from a .json, .yaml or .yml file.
+    YAML needs the optional PyYAML package (pip install skelly[yaml]).
+    """
+    path = Path(path)
+    try:
+        text = path.read_text()
+    except OSError as e:
+        raise BuildError(f"Cannot read schema {path}: {e.strerror}") from e
+    if path.suffix.lower() in (".yaml", ".yml"):
+        try:
+            import yaml
+        except ImportError:
+            raise BuildError("YAML schemas need PyYAML: pip install 'skelly[yaml]' (or use JSON)") from None
+        try:
+            data = yaml.safe_load(text)
+        except yaml.YAMLError as e:
+            raise BuildError(f"{path}: invalid YAML ({e})") from e
+    else:
+        try:
+            data = json.loads(text)
+        except json.JSONDecodeError as e:
+            raise BuildError(f"{path}: invalid JSON ({e.msg})") from e
+    try:
+        return DomainSchema.from_dict(data)
+    except ValueError as e:
+        raise BuildError(f"{path}: {e}") from e
@@ -0,0 +1,273 @@
+import contextlib
+import dataclasses
+import json
+import sys
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, TextIO
+
+
+@dataclass(frozen=True, slots=True)
+class Message:
+    """Free-form progress note; style is a rich style such as "cyan" or "bold"."""
+
+    text: str
+    style: str = ""
+
+
+@dataclass(frozen=True, slots=True)
+class BuildStarted:
+    name: str
+    path: str
+    architecture: str
+    backend: str | None = None
+    frontend: str | None = None
+    dry_run: bool = False
+
+
+@dataclass(frozen=True, slots=True)
+class BuildFinished:
+    name: str
+    path: str
+    config: object
+
+
+@dataclass(frozen=True, slots=True)
+class ApplyStarted:
+    folders: int
+    files: int
+
+
+@dataclass(frozen=True, slots=True)
+class FolderCreated:
+    path: str
+
+
+@dataclass(frozen=True, slots=True)
+class FileWritten:
+    path: str
+    size: int
+
+
+@dataclass(frozen=True, slots=True)
+class FileSkipped:
+    """A planned file that was not written; reason is "unchanged" or "user_modified"."""
+
+    path: str
+    reason: str
+
+
+@dataclass(frozen=True, slots=True)
+class ApplyFinished:
+    written: int
+    unchanged: int
+    user_modified: int
+
+
+@dataclass(frozen=True, slots=True)
+class InstallStarted:
+    label: str
+    cmd: tuple[str, ...]
+    cwd: str
+
+
+@dataclass(frozen=True, slots=True)
+class InstallOutput:
+    label: str
+    line: str
+
+
+@dataclass(frozen=True, slots=True)
+class InstallFinished:
+    label: str
+    cmd: tuple[str, ...]
+    ok: bool
+    duration: float
+    message: str
+    returncode: int | None = None
+    cached: bool = False
+    timed_out: bool = False
+    error: str | None = None
+
+
+Sink = Callable[[object], None]
+
+
+class EventBus:
+    """
+    Delivers build events to the subscribed sinks, in the emitting thread.
+
+    With no sinks, emit() returns immediately, so library users and batch
+    workers pay next to nothing for progress reporting.
+    """
+
+    def __init__(self):
+        self._sinks: tuple[Sink, ...] = ()
+        self._lock = threading.Lock()
+
+    def subscribe(self, sink: Sink) -> Sink:
+        with self._lock:
+            self._sinks = (*self._sinks, sink)
+        return sink
+
+    def unsubscribe(self, sink: Sink) -> None:
+        with self._lock:
+            self._sinks = tuple(s for s in self._sinks if s is not sink)
+
+    @property
+    def active(self) -> bool:
+        return bool(self._sinks)
+
+    def emit(self, event: object) -> None:
+        for sink in self._sinks:
+            sink(event)
+
+
+bus = EventBus()
+
+
+def emit(event: object) -> None:
+    """Send event to the sinks of the process-wide bus."""
+    bus.emit(event)
+
+
+@contextlib.contextmanager
+def subscribed(*sinks: Sink, target: EventBus | None = None):
+    """Subscribe sinks to the bus (the process-wide one by default) for the duration of the block."""
+    target = target if target is not None else bus
+    for sink in sinks:
+        target.subscribe(sink)
+    try:
+        yield
+    finally:
+        for sink in sinks:
+            target.unsubscribe(sink)
+            if hasattr(sink, "close"):
+                sink.close()
+
+
+def to_dict(event: object) -> dict:
+    """JSON-ready representation of an event with its type under "event"."""
+    return {"event": type(event).__name__, **dataclasses.asdict(event)}
+
+
+def null_sink(event: object) -> None:
+    """Discards every event."""
+
+
+class JsonLinesSink:
+    """Writes every event as one JSON object per line, with a wall-clock timestamp."""
+
+    def __init__(self, stream: TextIO | None = None):
+        self.stream = stream
+        self._lock = threading.Lock()
+
+    def __call__(self, event: object) -> None:
+        line = json.dumps({"time": time.time(), **to_dict(event)}, default=str)
+        stream = self.stream or sys.stdout
+        with self._lock:
+            stream.write(line + "\n")
+
+    def close(self) -> None:
+        (self.stream or sys.stdout).flush()
+
+
+class ConsoleSink:
+    """
+    Renders events on a rich console. Individual files and folders are
+    not printed; applying a plan is summarized instead.
+    """
+
+    def __init__(self, console=None):
+        if console is None:
+            from rich.console import Console
+            console = Console()
+        self.console = console
+
+    def __call__(self, event: object) -> None:
+        from rich.markup import escape
+
+        write = self.console.print
+        match event:
+            case Message(text, style):
+                write(f"[{style}]{escape(text)}[/{style}]" if style else escape(text))
+            case BuildStarted():
+                if event.dry_run:
+                    write("\n[bold yellow]DRY RUN — No files will be created.[/bold yellow]")
+                    write(f"\n[bold]Project: '{escape(event.name)}'[/bold]")
+                else:
+                    write(f"\n[bold]Building project '{escape(event.name)}'...[/bold]")
+                write(f"  Architecture: {escape(event.architecture)}")
+                if event.backend:
+                    write(f"  Backend: {escape(event.backend)}")
+                if event.frontend:
+                    write(f"  Frontend: {escape(event.frontend)}")
+            case BuildFinished():
+                write("\n[bold]Final Configuration:[/bold]")
+                write(escape(str(event.config)))
+            case ApplyStarted(folders, files):
+                write(f"\n[dim]Creating {folders} folders and {files} files...[/dim]")
+            case FileSkipped(path, "user_modified"):
+                write(f"[yellow]Kept local changes in {escape(path)}[/yellow]")
+            case ApplyFinished(written, unchanged, user_modified):
+                if unchanged or user_modified:
+                    write(f"[dim]{unchanged} files unchanged, {written} written.[/dim]")
+                write("[green]Project files written successfully.[/green]")
+            case InstallStarted(label, cmd):
+                write(f"[yellow]{escape(label)}: running {escape(' '.join(cmd))}...[/yellow]")
+            case InstallOutput(label, line):
+                write(f"{escape(label)} | {escape(line)}", highlight=False)
+            case InstallFinished():
+                self._install_finished(event)
+
+    def _install_finished(self, event: InstallFinished) -> None:
+        from rich.markup import escape
+
+        if event.ok:
+            source = ", from cache" if event.cached else ""
+            self.console.print(
+                f"[green]{escape(event.message)}[/green] [dim]({escape(event.label)}{source}, {event.duration:.1f}s)[/dim]"
+            )
+        elif event.timed_out:
+            self.console.print(f"[red]{escape(event.message)} (timed out after {event.duration:.0f}s)[/red]")
+        elif event.returncode is None:
+            self.console.print(f"[red]{escape(event.message)}[/red]")
+        else:
+            self.console.print(
+                f"[red]{escape(event.message)}[/red] [dim]({escape(event.label)}, exit code {event.returncode})[/dim]"
+            )
+
+
+class ProgressSink(ConsoleSink):
+    """ConsoleSink that shows a live progress bar while a plan is applied."""
+
+    def __init__(self, console=None):
+        super().__init__(console)
+        self._progress = None
+        self._task = None
+
+    def __call__(self, event: object) -> None:
+        match event:
+            case ApplyStarted(folders, files):
+                from rich.progress import BarColumn, MofNCompleteColumn, Progress, TextColumn
+
+                self._progress = Progress(
+                    TextColumn("Writing project"), BarColumn(), MofNCompleteColumn(),
+                    console=self.console, transient=True,
+                )
+                self._task = self._progress.add_task("write", total=folders + files)
+                self._progress.start()
+            case FolderCreated() | FileWritten() | FileSkipped() if self._progress is not None:
+                self._progress.advance(self._task)
+                super().__call__(event)
+            case ApplyFinished():
+                self.close()
+                super().__call__(event)
+            case _:
+                super().__call__(event)
+
+    def close(self) -> None:
+        if self._progress is not None:
+            self._progress.stop()
+            self._progress = None
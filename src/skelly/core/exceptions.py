@@ -12,3 +12,7 @@ class TemplateRenderError(SkellyError):
 
 class BuildError(SkellyError):
     """Raised when project build fails."""
+
+
+class ServiceBusyError(SkellyError):
+    """Raised when the scaffold daemon's request queue is full."""
@@ -0,0 +1,313 @@
+import hashlib
+import itertools
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterable, Iterator
+
+from skelly.core.events import ApplyFinished, ApplyStarted, FileSkipped, FileWritten, FolderCreated, bus, emit
+from skelly.core.manifest import FileRecord, Manifest, content_hash
+from skelly.core.output import FileSystemOutput, OutputBackend
+from skelly.core.plan import BuildPlan, PlannedFile
+from skelly.core.template_renderer import render_template
+from skelly.core.tracing import span
+
+
+DEFAULT_WORKERS = min(32, (os.cpu_count() or 1) + 4)
+
+#: Files rendered per task when rendering in worker processes.
+RENDER_CHUNK = 64
+
+#: Rendered files larger than this are streamed to the output instead of being rendered into memory first.
+STREAM_THRESHOLD = 256 * 1024
+
+WRITTEN = "written"
+UNCHANGED = "unchanged"
+USER_MODIFIED = "user_modified"
+
+
+@dataclass
+class ApplyResult:
+    """Paths of an applied plan, grouped by what happened to them."""
+
+    written: list[str] = field(default_factory=list)
+    unchanged: list[str] = field(default_factory=list)
+    user_modified: list[str] = field(default_factory=list)
+    manifest_written: bool = False
+    #: Generated content of written and unchanged files, when apply() was asked to keep it.
+    contents: dict[str, bytes] = field(default_factory=dict)
+
+
+class PlanExecutor:
+    """
+    Applies a BuildPlan to a target directory or another OutputBackend.
+
+    Directories are created first, then every planned file is rendered and
+    written. Both phases are fanned out over a thread pool so slow
+    filesystems (NFS, network shares) overlap their round trips; with
+    workers=1 everything runs sequentially in the calling thread.
+
+    Regeneration is incremental: the .skelly/manifest.json left by the
+    previous run tells which files skelly wrote and with what content.
+    Files whose rendered content is unchanged are not touched, and files
+    the user edited since the last run are left alone.
+
+    With processes > 1 the templates are rendered in that many worker
+    processes instead, which pays off for plans with hundreds of templated
+    files (large domain schemas). Rendered chunks are written in plan order
+    as they arrive, with only a few chunks in flight at any time.
+
+    Templates are rendered incrementally; once a file's output passes
+    stream_threshold bytes it is streamed to the output block by block, so
+    large aggregate files (route tables, DI wiring for many entities) never
+    exist in memory as a whole. stream_threshold=None renders every file
+    into memory first.
+    """
+
+    def __init__(
+        self,
+        workers: int = DEFAULT_WORKERS,
+        processes: int = 1,
+        stream_threshold: int | None = STREAM_THRESHOLD,
+    ):
+        if workers < 1:
+            raise ValueError(f"workers must be at least 1, got {workers}")
+        if processes < 1:
+            raise ValueError(f"processes must be at least 1, got {processes}")
+        self.workers = workers
+        self.processes = processes
+        self.stream_threshold = stream_threshold
+
+    def apply(
+        self,
+        plan: BuildPlan,
+        target: Path | OutputBackend,
+        config_hash: str | None = None,
+        keep_content: bool = False,
+    ) -> ApplyResult:
+        """
+        Apply the plan to a directory or to any other OutputBackend.
+        With keep_content the rendered files are returned in ApplyResult.contents.
+        """
+        output = target if isinstance(target, OutputBackend) else FileSystemOutput(target)
+        directories = plan.directories()
+        files = plan.files
+        previous = Manifest.load(output)
+
+        emit(ApplyStarted(len(directories), len(files)))
+        if self.processes > 1:
+            with span("make_directories", count=len(directories)):
+                for directory in directories:
+                    self._make_directory(output, directory)
+            with span("write_files", count=len(files), processes=self.processes):
+                outcomes = [
+                    self._emit(output, planned, previous, keep_content, data)
+                    for planned, data in render_in_processes(files, self.processes)
+                ]
+        elif self.workers == 1 or not output.concurrent:
+            with span("make_directories", count=len(directories)):
+                for directory in directories:
+                    self._make_directory(output, directory)
+            with span("write_files", count=len(files)):
+                outcomes = [self._emit(output, planned, previous, keep_content) for planned in files]
+        else:
+            with ThreadPoolExecutor(max_workers=self.workers) as pool:
+                # All directories must exist before the first file is written.
+                with span("make_directories", count=len(directories)):
+                    for future in [pool.submit(self._make_directory, output, d) for d in directories]:
+                        future.result()
+                with span("write_files", count=len(files)):
+                    futures = [pool.submit(self._emit, output, planned, previous, keep_content) for planned in files]
+                    outcomes = [future.result() for future in futures]
+
+        result = ApplyResult()
+        manifest = Manifest(config_hash=config_hash)
+        for planned, (status, record, data) in zip(files, outcomes):
+            getattr(result, status).append(planned.path)
+            if record:
+                manifest.files[planned.path] = record
+            if data is not None:
+                result.contents[planned.path] = data
+        if output.incremental:
+            # Archives are never regenerated in place; a manifest in them would only be clutter.
+            with span("save_manifest"):
+                result.manifest_written = manifest.save(output)
+
+        emit(ApplyFinished(len(result.written), len(result.unchanged), len(result.user_modified)))
+        return result
+
+    def _make_directory(self, output: OutputBackend, directory: str) -> None:
+        with span("make_dir", "file", path=directory):
+            output.make_dir(directory)
+        if bus.active:
+            emit(FolderCreated(directory))
+
+    def _emit(
+        self,
+        output: OutputBackend,
+        planned: PlannedFile,
+        previous: Manifest | None,
+        keep_content: bool = False,
+        data: bytes | None = None,
+    ) -> tuple[str, FileRecord | None, bytes | None]:
+        """
+        Write one planned file if needed and return its status, manifest record and (if kept) content.
+        data is the file's content when it was already rendered elsewhere.
+        """
+        if data is None and (keep_content or self.stream_threshold is None):
+            with span("render", "file", path=planned.path, template=planned.template):
+                data = planned.render().encode()
+        elif data is None:
+            blocks = planned.stream()
+            with span("render", "file", path=planned.path, template=planned.template):
+                head = _take(blocks, self.stream_threshold)
+            if sum(map(len, head)) >= self.stream_threshold:
+                return self._emit_streamed(output, planned, previous, head, blocks)
+            data = b"".join(head)
+        new_hash = content_hash(data)
+        recorded = previous.files.get(planned.path) if previous else None
+
+        kept = data if keep_content else None
+
+        disk_hash = self._current_hash(output, planned.path, recorded)
+        settled = self._settle(output, planned.path, previous, recorded, disk_hash, new_hash, len(data))
+        if settled is not None:
+            status, record = settled
+            return status, record, kept if status == UNCHANGED else None
+
+        with span("write", "file", path=planned.path, size=len(data)):
+            self._write_file(output, planned, data)
+        if bus.active:
+            emit(FileWritten(planned.path, len(data)))
+        return WRITTEN, self._record(output, planned.path, new_hash, len(data)), kept
+
+    def _emit_streamed(
+        self,
+        output: OutputBackend,
+        planned: PlannedFile,
+        previous: Manifest | None,
+        head: list[bytes],
+        rest: Iterator[bytes],
+    ) -> tuple[str, FileRecord | None, None]:
+        """
+        Write a file whose rendering exceeded the stream threshold without holding all of it.
+
+        A file that does not exist yet is written while it is rendered. An
+        existing one has to be compared first: the rendering is only hashed,
+        and the template is rendered a second time if the file needs writing.
+        """
+        recorded = previous.files.get(planned.path) if previous else None
+        disk_hash = self._current_hash(output, planned.path, recorded)
+        digest = hashlib.sha256()
+        size = 0
+
+        def hashed(blocks: Iterable[bytes]) -> Iterator[bytes]:
+            nonlocal size
+            for block in blocks:
+                digest.update(block)
+                size += len(block)
+                yield block
+
+        if disk_hash is None:
+            with span("write", "file", path=planned.path, streamed=True):
+                output.write_stream(planned.path, hashed(itertools.chain(head, rest)))
+        else:
+            with span("render", "file", path=planned.path, template=planned.template, streamed=True):
+                for _ in hashed(itertools.chain(head, rest)):
+                    pass
+            settled = self._settle(output, planned.path, previous, recorded, disk_hash, digest.hexdigest(), size)
+            if settled is not None:
+                return (*settled, None)
+            with span("write", "file", path=planned.path, size=size, streamed=True):
+                output.write_stream(planned.path, planned.stream())
+        if bus.active:
+            emit(FileWritten(planned.path, size))
+        return WRITTEN, self._record(output, planned.path, digest.hexdigest(), size), None
+
+    def _settle(
+        self,
+        output: OutputBackend,
+        path: str,
+        previous: Manifest | None,
+        recorded: FileRecord | None,
+        disk_hash: str | None,
+        new_hash: str,
+        size: int,
+    ) -> tuple[str, FileRecord | None] | None:
+        """Status and record of a file that must not be written (unchanged or user-modified), else None."""
+        if disk_hash == new_hash:
+            if bus.active:
+                emit(FileSkipped(path, UNCHANGED))
+            if recorded and recorded.sha256 == new_hash:
+                return UNCHANGED, recorded
+            return UNCHANGED, self._record(output, path, new_hash, size)
+        if disk_hash is not None and previous is not None:
+            if recorded is None or recorded.sha256 != disk_hash:
+                # Edited (or created) by the user since the last generation.
+                if bus.active:
+                    emit(FileSkipped(path, USER_MODIFIED))
+                return USER_MODIFIED, recorded
+        return None
+
+    @staticmethod
+    def _current_hash(output: OutputBackend, path: str, recorded: FileRecord | None) -> str | None:
+        stat = output.stat(path)
+        if stat is not None and recorded and recorded.matches_stat(stat):
+            return recorded.sha256
+        current = output.read_file(path)
+        return content_hash(current) if current is not None else None
+
+    @staticmethod
+    def _record(output: OutputBackend, path: str, sha256: str, size: int) -> FileRecord:
+        stat = output.stat(path)
+        if stat is None:
+            return FileRecord(sha256=sha256, size=size, mtime_ns=0)
+        return FileRecord(sha256=sha256, size=stat.st_size, mtime_ns=stat.st_mtime_ns)
+
+    def _write_file(self, output: OutputBackend, planned: PlannedFile, data: bytes) -> None:
+        output.write_file(planned.path, data)
+
+
+def _take(blocks: Iterator[bytes], limit: int) -> list[bytes]:
+    """Blocks from the iterator until they add up to at least limit bytes or it is exhausted."""
+    taken = []
+    size = 0
+    for block in blocks:
+        taken.append(block)
+        size += len(block)
+        if size >= limit:
+            break
+    return taken
+
+
+def _render_chunk(chunk: list[tuple[str, dict[str, object]] | None]) -> list[bytes | None]:
+    """Render the templated entries of a chunk in a worker process; literal files stay None."""
+    return [render_template(entry[0], **entry[1]).encode() if entry else None for entry in chunk]
+
+
+def render_in_processes(
+    files: list[PlannedFile], processes: int, chunk_size: int = RENDER_CHUNK
+) -> Iterator[tuple[PlannedFile, bytes | None]]:
+    """
+    Yield every file with its rendered content, in order, rendering the templates in a process pool.
+
+    Each worker keeps its own template environment, so every template is
+    compiled at most once per process (and loaded from the bytecode cache
+    after the first build). At most two chunks per process are pending, so
+    memory stays bounded however many files the plan has. Literal files are
+    yielded with None; they need no rendering.
+    """
+    with ProcessPoolExecutor(max_workers=processes) as pool:
+        pending = deque()
+        for start in range(0, len(files), chunk_size):
+            chunk = files[start:start + chunk_size]
+            entries = [(planned.template, planned.context) if planned.content is None else None for planned in chunk]
+            pending.append((chunk, pool.submit(_render_chunk, entries)))
+            if len(pending) >= 2 * processes:
+                done, future = pending.popleft()
+                yield from zip(done, future.result())
+        while pending:
+            done, future = pending.popleft()
+            yield from zip(done, future.result())
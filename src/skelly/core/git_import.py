@@ -0,0 +1,124 @@
+import logging
+import shutil
+import subprocess
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, Iterator
+
+from skelly.core.exceptions import BuildError
+
+logger = logging.getLogger(__name__)
+
+GITIGNORE = ".gitignore"
+DEFAULT_AUTHOR = "Skelly <skelly@localhost>"
+
+#: Ignored in every project: skelly's own bookkeeping and editor/OS clutter.
+COMMON_IGNORES = (".skelly/", ".DS_Store", ".idea/", ".vscode/")
+
+
+@dataclass(frozen=True)
+class GitCommit:
+    """
+    Settings for the initial commit of a generated project.
+    author is "Name <email>"; without one, git's configured identity is used.
+    """
+
+    author: str | None = None
+    message: str = "Initial commit"
+    branch: str = "main"
+
+
+def gitignore(patterns: Iterable[str]) -> str:
+    """Content of a .gitignore with the common patterns followed by the given ones, without duplicates."""
+    lines = list(dict.fromkeys([*COMMON_IGNORES, *patterns]))
+    return "\n".join(lines) + "\n"
+
+
+def _quote(path: str) -> str:
+    """Quote a path for fast-import if it contains characters that need it."""
+    if not any(char in path for char in '"\\\n') and not path.startswith(" "):
+        return path
+    escaped = path.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+    return f'"{escaped}"'
+
+
+def fast_import_stream(
+    files: Iterable[tuple[str, bytes]],
+    author: str,
+    message: str,
+    branch: str,
+    timestamp: int | None = None,
+) -> Iterator[bytes]:
+    """
+    Yield a git fast-import stream that creates one commit on branch with the given files.
+    Each file becomes a blob referenced by mark, so no working tree is needed.
+    """
+    timestamp = int(time.time()) if timestamp is None else timestamp
+    paths = []
+    for mark, (path, data) in enumerate(files, start=1):
+        yield b"blob\nmark :%d\ndata %d\n" % (mark, len(data))
+        yield data
+        yield b"\n"
+        paths.append(path)
+    ident = f"{author} {timestamp} +0000".encode()
+    encoded = message.encode()
+    yield b"commit refs/heads/%s\n" % branch.encode()
+    yield b"author %s\ncommitter %s\n" % (ident, ident)
+    yield b"data %d\n%s\n" % (len(encoded), encoded)
+    for mark, path in enumerate(paths, start=1):
+        yield f"M 100644 :{mark} {_quote(path)}\n".encode()
+    yield b"done\n"
+
+
+def _git(*args: str, cwd: Path, stdin: bytes | None = None) -> str:
+    result = subprocess.run(["git", *args], cwd=cwd, input=stdin, capture_output=True)
+    if result.returncode != 0:
+        error = result.stderr.decode(errors="replace").strip()
+        raise BuildError(f"git {args[0]} failed: {error}")
+    return result.stdout.decode(errors="replace").strip()
+
+
+def resolve_author(author: str | None, cwd: Path) -> str:
+    """The given author, else git's own identity (config or GIT_AUTHOR_* variables), else a placeholder."""
+    if author:
+        return author
+    try:
+        ident = _git("var", "GIT_AUTHOR_IDENT", cwd=cwd)
+    except BuildError:
+        return DEFAULT_AUTHOR
+    # "Name <email> timestamp zone"
+    return ident.rsplit(" ", 2)[0]
+
+
+def initialize_repository(project: Path, files: Iterable[tuple[str, bytes]], commit: GitCommit) -> str:
+    """
+    Create a git repository in project whose first commit holds files.
+
+    The commit is written by a single `git fast-import` from the in-memory
+    contents and the index is then read from that commit, so git never
+    hashes the written tree. Returns the commit id.
+    """
+    if shutil.which("git") is None:
+        raise BuildError("git is not installed")
+    if (project / ".git").exists():
+        raise BuildError(f"{project} already is a git repository")
+    _git("init", "--quiet", f"--initial-branch={commit.branch}", ".", cwd=project)
+    author = resolve_author(commit.author, project)
+
+    process = subprocess.Popen(
+        ["git", "fast-import", "--quiet", "--done"],
+        cwd=project, stdin=subprocess.PIPE, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+    )
+    try:
+        for chunk in fast_import_stream(files, author, commit.message, commit.branch):
+            process.stdin.write(chunk)
+        process.stdin.close()
+    except BrokenPipeError:
+        pass
+    stderr = process.stderr.read().decode(errors="replace").strip()
+    if process.wait() != 0:
+        raise BuildError(f"git fast-import failed: {stderr}")
+
+    _git("read-tree", "HEAD", cwd=project)
+    return _git("rev-parse", "HEAD", cwd=project)
@@ -0,0 +1,375 @@
+import asyncio
+import json
+import os
+import time
+import uuid
+from contextlib import contextmanager
+from dataclasses import dataclass, field, replace
+from pathlib import Path
+from typing import Iterator
+
+from skelly.core.events import Message, emit
+from skelly.core.exceptions import BuildError
+from skelly.core.installer import DEFAULT_TIMEOUT, InstallRunner, InstallStep, StepResult
+from skelly.core.lockfiles import LockfileStore
+from skelly.core.node_cache import NodeModulesCache
+from skelly.core.paths import cache_root
+
+QUEUE_VERSION = 1
+
+PENDING = "pending"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+
+DEFAULT_CONCURRENCY = 4
+DEFAULT_ECOSYSTEM_LIMITS = {"maven": 2, "npm": 4}
+DEFAULT_RETRIES = 2
+RETRY_BACKOFF = 5.0
+
+
+def default_queue_path() -> Path:
+    """The install queue file: $SKELLY_INSTALL_QUEUE, else install-queue.json in the cache root."""
+    override = os.environ.get("SKELLY_INSTALL_QUEUE")
+    return Path(override) if override else cache_root() / "install-queue.json"
+
+
+def _step_to_dict(step: InstallStep) -> dict:
+    return {
+        "label": step.label,
+        "cmd": list(step.cmd),
+        "cwd": str(step.cwd),
+        "ecosystem": step.ecosystem,
+        "success_msg": step.success_msg,
+        "fail_msg": step.fail_msg,
+        "timeout": step.timeout,
+        "members": list(step.members),
+    }
+
+
+def _step_from_dict(data: dict) -> InstallStep:
+    return InstallStep(**dict(
+        data, cmd=tuple(data["cmd"]), cwd=Path(data["cwd"]), members=tuple(data.get("members", ())),
+    ))
+
+
+def _pid_alive(pid: int) -> bool:
+    if os.name == "nt":
+        # os.kill(pid, 0) would terminate the process on Windows; assume the worker is gone.
+        return False
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+@dataclass
+class InstallJob:
+    """The install steps of one strategy in one project, run in order by the install worker."""
+
+    id: str
+    project: str
+    steps: list[InstallStep]
+    status: str = PENDING
+    attempts: int = 0
+    enqueued_at: float = field(default_factory=time.time)
+    not_before: float = 0.0
+    worker: int | None = None
+    duration: float | None = None
+    error: str | None = None
+
+    @property
+    def ecosystem(self) -> str:
+        """The ecosystem the job is throttled under; that of its first step."""
+        return self.steps[0].ecosystem
+
+    @property
+    def label(self) -> str:
+        return f"{Path(self.project).name}/{self.steps[0].label}"
+
+    def to_dict(self) -> dict:
+        return {
+            "id": self.id,
+            "project": self.project,
+            "steps": [_step_to_dict(step) for step in self.steps],
+            "status": self.status,
+            "attempts": self.attempts,
+            "enqueued_at": self.enqueued_at,
+            "not_before": self.not_before,
+            "worker": self.worker,
+            "duration": self.duration,
+            "error": self.error,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "InstallJob":
+        return cls(**dict(data, steps=[_step_from_dict(step) for step in data["steps"]]))
+
+
+class _FileLock:
+    """
+    Cross-process lock based on exclusive creation of a lock file.
+    A lock file older than stale_after seconds is assumed to belong to a crashed process.
+    """
+
+    def __init__(self, path: Path, timeout: float = 30.0, stale_after: float = 60.0):
+        self.path = path
+        self.timeout = timeout
+        self.stale_after = stale_after
+
+    def __enter__(self) -> None:
+        deadline = time.monotonic() + self.timeout
+        while True:
+            try:
+                os.close(os.open(self.path, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+                return
+            except FileExistsError:
+                try:
+                    if time.time() - self.path.stat().st_mtime > self.stale_after:
+                        self.path.unlink()
+                        continue
+                except FileNotFoundError:
+                    continue
+            if time.monotonic() > deadline:
+                raise BuildError(f"Install queue is locked: {self.path}")
+            time.sleep(0.01)
+
+    def __exit__(self, *exc_info) -> None:
+        try:
+            self.path.unlink()
+        except FileNotFoundError:
+            pass
+
+
+class InstallQueue:
+    """
+    Persistent queue of install jobs in a JSON file.
+
+    Every change happens under a lock file and is written atomically, so
+    several scaffolding processes can enqueue while a worker drains.
+    """
+
+    def __init__(self, path: Path | None = None):
+        self.path = Path(path) if path else default_queue_path()
+        self._lock = _FileLock(self.path.with_name(self.path.name + ".lock"))
+
+    def _load(self) -> list[InstallJob]:
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return []
+        except (OSError, ValueError) as e:
+            raise BuildError(f"Cannot read install queue {self.path}: {e}") from e
+        if data.get("version") != QUEUE_VERSION:
+            raise BuildError(f"Unsupported install queue version in {self.path}")
+        return [InstallJob.from_dict(job) for job in data["jobs"]]
+
+    def _save(self, jobs: list[InstallJob]) -> None:
+        data = {"version": QUEUE_VERSION, "jobs": [job.to_dict() for job in jobs]}
+        tmp = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(data, indent=2), encoding="utf-8")
+        os.replace(tmp, self.path)
+
+    @contextmanager
+    def _transaction(self) -> Iterator[list[InstallJob]]:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._lock:
+            jobs = self._load()
+            before = [job.to_dict() for job in jobs]
+            yield jobs
+            # Polling (claim() with nothing runnable) must not rewrite the file every time.
+            if [job.to_dict() for job in jobs] != before:
+                self._save(jobs)
+
+    def jobs(self) -> list[InstallJob]:
+        """Snapshot of all jobs; the file is replaced atomically, so no lock is needed."""
+        return self._load()
+
+    def counts(self) -> dict[str, int]:
+        counts = {PENDING: 0, RUNNING: 0, DONE: 0, FAILED: 0}
+        for job in self.jobs():
+            counts[job.status] += 1
+        return counts
+
+    def enqueue(self, project: Path, sequences: list[list[InstallStep]]) -> list[InstallJob]:
+        """Add one job per non-empty step sequence of a project."""
+        new_jobs = [
+            InstallJob(id=uuid.uuid4().hex, project=str(project), steps=list(steps))
+            for steps in sequences
+            if steps
+        ]
+        if new_jobs:
+            with self._transaction() as jobs:
+                jobs.extend(new_jobs)
+        return new_jobs
+
+    def claim(self, exclude_ecosystems: set[str] = frozenset()) -> InstallJob | None:
+        """Mark the oldest runnable pending job as running for this process and return it."""
+        now = time.time()
+        with self._transaction() as jobs:
+            for job in jobs:
+                if job.status == PENDING and job.not_before <= now and job.ecosystem not in exclude_ecosystems:
+                    job.status = RUNNING
+                    job.worker = os.getpid()
+                    job.attempts += 1
+                    return job
+        return None
+
+    def next_retry_delay(self, exclude_ecosystems: set[str] = frozenset()) -> float | None:
+        """
+        Seconds until the next pending job becomes runnable, or None if nothing is pending.
+        Jobs of the excluded (full) ecosystems are left out; they can only start once a running job finishes.
+        """
+        pending = [
+            job.not_before for job in self.jobs()
+            if job.status == PENDING and job.ecosystem not in exclude_ecosystems
+        ]
+        if not pending:
+            return None
+        return max(0.0, min(pending) - time.time())
+
+    def finish(self, job_id: str, ok: bool, duration: float, error: str | None,
+               retries: int, backoff: float = RETRY_BACKOFF) -> InstallJob:
+        """Record the outcome of a claimed job; failed jobs go back to pending until retries are used up."""
+        with self._transaction() as jobs:
+            job = next(job for job in jobs if job.id == job_id)
+            job.worker = None
+            job.duration = duration
+            job.error = error
+            if ok:
+                job.status = DONE
+            elif job.attempts <= retries:
+                job.status = PENDING
+                job.not_before = time.time() + backoff * 2 ** (job.attempts - 1)
+            else:
+                job.status = FAILED
+            return job
+
+    def requeue_stale(self) -> int:
+        """Return running jobs whose worker process has died to the pending state."""
+        count = 0
+        with self._transaction() as jobs:
+            for job in jobs:
+                if job.status == RUNNING and (job.worker is None or not _pid_alive(job.worker)):
+                    job.status = PENDING
+                    job.worker = None
+                    count += 1
+        return count
+
+    def retry_failed(self) -> int:
+        """Give failed jobs a fresh set of attempts."""
+        count = 0
+        with self._transaction() as jobs:
+            for job in jobs:
+                if job.status == FAILED:
+                    job.status = PENDING
+                    job.attempts = 0
+                    job.not_before = 0.0
+                    count += 1
+        return count
+
+    def remove(self, statuses: set[str]) -> int:
+        """Drop all jobs in the given states and return how many were removed."""
+        with self._transaction() as jobs:
+            kept = [job for job in jobs if job.status not in statuses]
+            removed = len(jobs) - len(kept)
+            jobs[:] = kept
+        return removed
+
+
+class InstallWorker:
+    """
+    Drains an InstallQueue with a bounded number of concurrent installs.
+
+    At most `concurrency` jobs run at once, and at most limits[ecosystem]
+    of them per package manager (e.g. two Maven builds next to four npm
+    installs). Failed jobs are retried with exponential backoff.
+    """
+
+    def __init__(
+        self,
+        queue: InstallQueue,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        limits: dict[str, int] | None = None,
+        retries: int = DEFAULT_RETRIES,
+        timeout: float = DEFAULT_TIMEOUT,
+        backoff: float = RETRY_BACKOFF,
+    ):
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        self.queue = queue
+        self.concurrency = concurrency
+        self.limits = dict(DEFAULT_ECOSYSTEM_LIMITS if limits is None else limits)
+        self.retries = retries
+        self.backoff = backoff
+        self._runner = InstallRunner(
+            timeout=timeout, node_cache=NodeModulesCache.from_env(), lockfiles=LockfileStore.from_env()
+        )
+
+    def run(self) -> dict[str, int]:
+        """Process jobs until the queue has nothing pending; return the number of jobs done and failed."""
+        self.queue.requeue_stale()
+        return asyncio.run(self._drain())
+
+    def _full_ecosystems(self, running: dict[str, int]) -> set[str]:
+        return {
+            ecosystem
+            for ecosystem, count in running.items()
+            if count >= self.limits.get(ecosystem, self.concurrency)
+        }
+
+    async def _drain(self) -> dict[str, int]:
+        stats = {DONE: 0, FAILED: 0}
+        counts = self.queue.counts()
+        total = counts[PENDING] + counts[RUNNING]
+        finished = 0
+        running: dict[asyncio.Task, InstallJob] = {}
+        per_ecosystem: dict[str, int] = {}
+
+        while True:
+            while len(running) < self.concurrency:
+                job = self.queue.claim(self._full_ecosystems(per_ecosystem))
+                if job is None:
+                    break
+                per_ecosystem[job.ecosystem] = per_ecosystem.get(job.ecosystem, 0) + 1
+                emit(Message(f"Starting {job.label} (attempt {job.attempts})", "yellow"))
+                running[asyncio.create_task(self._run_job(job))] = job
+
+            delay = self.queue.next_retry_delay(self._full_ecosystems(per_ecosystem))
+            if not running:
+                if delay is None:
+                    return stats
+                await asyncio.sleep(delay)
+                continue
+
+            done, _ = await asyncio.wait(running, timeout=delay, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                job = running.pop(task)
+                per_ecosystem[job.ecosystem] -= 1
+                job = self._record(job, task.result())
+                if job.status == PENDING:
+                    retry_in = job.not_before - time.time()
+                    emit(Message(f"{job.label} failed, retrying in {retry_in:.0f}s: {job.error}", "yellow"))
+                    continue
+                finished += 1
+                stats[job.status] += 1
+                if job.status == DONE:
+                    emit(Message(f"[{finished}/{total}] {job.label} installed ({job.duration:.1f}s)", "green"))
+                else:
+                    emit(Message(f"[{finished}/{total}] {job.label} failed: {job.error}", "red"))
+
+    async def _run_job(self, job: InstallJob) -> list[StepResult]:
+        steps = [replace(step, label=f"{Path(job.project).name}/{step.label}") for step in job.steps]
+        return await self._runner.run_sequence(steps)
+
+    def _record(self, job: InstallJob, results: list[StepResult]) -> InstallJob:
+        ok = len(results) == len(job.steps) and all(result.ok for result in results)
+        duration = sum(result.duration for result in results)
+        error = None
+        if not ok:
+            last = results[-1]
+            error = last.error or f"{' '.join(last.step.cmd)} exited with {last.returncode}"
+        return self.queue.finish(job.id, ok, duration, error, self.retries, self.backoff)
@@ -0,0 +1,195 @@
+import asyncio
+import logging
+import shutil
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from skelly.core.events import InstallFinished, InstallOutput, InstallStarted, Message, emit
+from skelly.core.lockfiles import LockfileStore
+from skelly.core.node_cache import NodeModulesCache
+from skelly.core.tracing import span
+
+if TYPE_CHECKING:
+    from skelly.core.journal import StepJournal
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TIMEOUT = 900.0
+# Output is read in chunks of this size; longer lines are passed on in pieces of at most this size.
+OUTPUT_CHUNK = 1 << 16
+
+
+@dataclass(frozen=True)
+class InstallStep:
+    """A single dependency installation command, e.g. `npm install` in frontend/."""
+
+    label: str
+    cmd: tuple[str, ...]
+    cwd: Path
+    ecosystem: str
+    success_msg: str = "Dependencies installed!"
+    fail_msg: str = "Failed to install dependencies."
+    timeout: float | None = None
+    #: Workspace member directories below cwd that this step installs as well.
+    members: tuple[str, ...] = ()
+
+
+@dataclass(frozen=True)
+class StepResult:
+    """Outcome of an InstallStep with its wall-clock duration in seconds."""
+
+    step: InstallStep
+    returncode: int | None
+    duration: float
+    timed_out: bool = False
+    error: str | None = None
+    cached: bool = False
+    resumed: bool = False
+
+    @property
+    def ok(self) -> bool:
+        return self.returncode == 0
+
+
+class InstallRunner:
+    """
+    Runs dependency installations as asyncio subprocesses.
+
+    Each sequence of steps (one per strategy) runs in order and stops at
+    the first failure; separate sequences run concurrently, so a backend
+    and a frontend install take max(backend, frontend) instead of the sum.
+    Progress and output lines are emitted as events carrying the step label.
+
+    With a NodeModulesCache, npm steps whose dependency set was installed
+    before are served from the cache, and fresh installs are added to it.
+    With a LockfileStore, the lockfile of every successful npm install is
+    kept so later projects with the same dependencies can ship it.
+    With a StepJournal, every successful step is recorded, and the steps
+    a resumed journal already has are skipped up to the first one that
+    still has to run.
+    """
+
+    def __init__(
+        self,
+        timeout: float = DEFAULT_TIMEOUT,
+        node_cache: NodeModulesCache | None = None,
+        lockfiles: LockfileStore | None = None,
+        journal: "StepJournal | None" = None,
+    ):
+        self.timeout = timeout
+        self.node_cache = node_cache
+        self.lockfiles = lockfiles
+        self.journal = journal
+
+    def run(self, sequences: list[list[InstallStep]]) -> list[StepResult]:
+        """Run all sequences concurrently and return the results of the steps that ran."""
+        sequences = [sequence for sequence in sequences if sequence]
+        if not sequences:
+            return []
+        return asyncio.run(self.run_async(sequences))
+
+    async def run_async(self, sequences: list[list[InstallStep]]) -> list[StepResult]:
+        nested = await asyncio.gather(*(self.run_sequence(sequence) for sequence in sequences))
+        return [result for results in nested for result in results]
+
+    async def run_sequence(self, steps: list[InstallStep]) -> list[StepResult]:
+        """Run steps in order, stopping at the first failure."""
+        results = []
+        resuming = self.journal is not None
+        for position, step in enumerate(steps):
+            if resuming and self.journal.install_done(step, position):
+                emit(Message(f"{step.label}: {' '.join(step.cmd)} completed in an earlier run, skipped.", "dim"))
+                results.append(StepResult(step, 0, 0.0, resumed=True))
+                continue
+            # Everything after the first step that runs again has to run too.
+            resuming = False
+            if self.journal is not None:
+                self.journal.start_install(step, position)
+            result = await self.run_step(step)
+            results.append(result)
+            if not result.ok:
+                break
+            if self.journal is not None:
+                self.journal.record_install(step, position)
+        return results
+
+    async def run_step(self, step: InstallStep) -> StepResult:
+        # Concurrent steps share the event loop thread, so each label gets its own trace track.
+        emit(InstallStarted(step.label, step.cmd, str(step.cwd)))
+        with span(" ".join(step.cmd), "install", track=f"install: {step.label}", cwd=str(step.cwd)):
+            result = await self._run_step(step)
+        emit(InstallFinished(
+            label=step.label,
+            cmd=step.cmd,
+            ok=result.ok,
+            duration=result.duration,
+            message=step.success_msg if result.ok else step.fail_msg,
+            returncode=result.returncode,
+            cached=result.cached,
+            timed_out=result.timed_out,
+            error=result.error,
+        ))
+        return result
+
+    async def _run_step(self, step: InstallStep) -> StepResult:
+        cache_key = None
+        if self.node_cache is not None and step.ecosystem == "npm":
+            cache_key = self.node_cache.key_for(step.cwd)
+        if cache_key is not None:
+            start = time.perf_counter()
+            if await asyncio.to_thread(self.node_cache.materialize, cache_key, step.cwd / "node_modules"):
+                return StepResult(step, 0, time.perf_counter() - start, cached=True)
+
+        executable = shutil.which(step.cmd[0])
+        if executable is None:
+            logger.error("Command not found: %s", step.cmd[0])
+            return StepResult(step, None, 0.0, error=f"command not found: {step.cmd[0]}")
+
+        start = time.perf_counter()
+        process = await asyncio.create_subprocess_exec(
+            executable,
+            *step.cmd[1:],
+            cwd=step.cwd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.STDOUT,
+        )
+        timeout = step.timeout if step.timeout is not None else self.timeout
+        try:
+            await asyncio.wait_for(self._stream(step.label, process), timeout)
+            returncode = await process.wait()
+        except asyncio.TimeoutError:
+            process.kill()
+            await process.wait()
+            duration = time.perf_counter() - start
+            logger.warning("%s timed out after %.0fs", step.cmd, timeout)
+            return StepResult(step, None, duration, timed_out=True, error="timed out")
+
+        duration = time.perf_counter() - start
+        if returncode == 0:
+            if cache_key is not None:
+                await asyncio.to_thread(self.node_cache.store, cache_key, step.cwd / "node_modules")
+            if self.lockfiles is not None and step.ecosystem == "npm":
+                await asyncio.to_thread(self.lockfiles.save, step.cwd)
+        else:
+            logger.warning("Command %s failed with exit code %s", step.cmd, returncode)
+        return StepResult(step, returncode, duration)
+
+    @staticmethod
+    async def _stream(label: str, process: asyncio.subprocess.Process) -> None:
+        # StreamReader.readline() raises on lines over its 64 KiB limit (minified bundles, progress bars).
+        pending = b""
+        while True:
+            chunk = await process.stdout.read(OUTPUT_CHUNK)
+            if not chunk:
+                break
+            *lines, pending = (pending + chunk).split(b"\n")
+            if len(pending) >= OUTPUT_CHUNK:
+                lines.append(pending)
+                pending = b""
+            for line in lines:
+                emit(InstallOutput(label, line.decode(errors="replace").rstrip()))
+        if pending:
+            emit(InstallOutput(label, pending.decode(errors="replace").rstrip()))
+        await process.wait()
@@ -0,0 +1,114 @@
+import hashlib
+import json
+import os
+from pathlib import Path
+
+from skelly.core.installer import InstallStep
+from skelly.core.manifest import MANIFEST_DIR
+from skelly.core.plan import BuildPlan
+
+JOURNAL_PATH = f"{MANIFEST_DIR}/journal.json"
+JOURNAL_VERSION = 1
+
+# Files that decide what an install step installs.
+DEPENDENCY_FILES = ("package.json", "package-lock.json", "pom.xml", "requirements.txt", "pyproject.toml")
+
+
+def _digest(*parts: object) -> str:
+    return hashlib.sha256(json.dumps(parts, sort_keys=True, default=repr).encode()).hexdigest()
+
+
+def plan_fingerprint(plan: BuildPlan, templates: str = "") -> str:
+    """
+    Hash of everything a plan would write: folders, literal contents, and
+    template names with their context. templates identifies the template
+    set, so new templates invalidate the step without rendering anything.
+    """
+    files = [(planned.path, planned.content, planned.template, planned.context) for planned in plan.files]
+    return _digest(plan.folders, files, templates)
+
+
+def _command(step: InstallStep) -> tuple[str, ...]:
+    # `npm install` writes the lockfile, after which install_command() picks `npm ci` for the same
+    # install; the lockfile itself is part of the fingerprint.
+    return ("npm", "install") if tuple(step.cmd) == ("npm", "ci") else tuple(step.cmd)
+
+
+def install_fingerprint(step: InstallStep) -> str:
+    """Hash of an install step's command plus the dependency files in its working directory and members."""
+    manifests = {}
+    for directory in ("", *step.members):
+        for name in DEPENDENCY_FILES:
+            path = f"{directory}/{name}" if directory else name
+            try:
+                manifests[path] = hashlib.sha256((step.cwd / path).read_bytes()).hexdigest()
+            except OSError:
+                continue
+    return _digest(_command(step), str(step.cwd), manifests)
+
+
+def install_key(step: InstallStep, position: int = 0) -> str:
+    """
+    The journal entry of a step: its label, directory and position in its sequence. The
+    command is left out because it may change between runs (`npm install`, then `npm ci`).
+    """
+    return f"install:{step.label}:{step.cwd}:{position}"
+
+
+class StepJournal:
+    """
+    Record of the build steps completed in a project, with the hash of their inputs.
+
+    Stored in .skelly/journal.json and updated after every step, so a
+    build interrupted during a long install knows what already finished.
+    A step is forgotten when it starts running again and recorded once it
+    completes. done() only reports completed steps when resuming; other
+    builds redo every step but keep the journal up to date.
+    """
+
+    def __init__(self, base_path: Path, resume: bool = False):
+        self.path = Path(base_path) / JOURNAL_PATH
+        self.resume = resume
+        self.steps: dict[str, str] = self._load()
+
+    def _load(self) -> dict[str, str]:
+        try:
+            data = json.loads(self.path.read_text())
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(data, dict) or data.get("version") != JOURNAL_VERSION:
+            return {}
+        return dict(data.get("steps", {}))
+
+    def done(self, step: str, inputs: str) -> bool:
+        return self.resume and self.steps.get(step) == inputs
+
+    def record(self, *completed: tuple[str, str]) -> None:
+        """Mark (step, inputs) pairs as completed and persist the journal."""
+        # Unchanged journals are never rewritten, so a no-op rebuild leaves the project untouched.
+        changed = False
+        for step, inputs in completed:
+            changed |= self.steps.get(step) != inputs
+            self.steps[step] = inputs
+        if changed:
+            self._save()
+
+    def forget(self, step: str) -> None:
+        """Mark a step as incomplete before it runs, so an interruption is not mistaken for success."""
+        if self.steps.pop(step, None) is not None:
+            self._save()
+
+    def _save(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        tmp.write_text(json.dumps({"version": JOURNAL_VERSION, "steps": self.steps}, indent=2, sort_keys=True) + "\n")
+        os.replace(tmp, self.path)
+
+    def install_done(self, step: InstallStep, position: int = 0) -> bool:
+        return self.done(install_key(step, position), install_fingerprint(step))
+
+    def start_install(self, step: InstallStep, position: int = 0) -> None:
+        self.forget(install_key(step, position))
+
+    def record_install(self, step: InstallStep, position: int = 0) -> None:
+        self.record((install_key(step, position), install_fingerprint(step)))
@@ -0,0 +1,105 @@
+import json
+import os
+import uuid
+from pathlib import Path
+
+from skelly.core.node_cache import dependency_key
+from skelly.core.paths import cache_root
+from skelly.core.plan import BuildPlan
+
+LOCKFILE = "package-lock.json"
+
+# package.json fields npm copies into the root entry of the lockfile.
+ROOT_FIELDS = ("dependencies", "devDependencies", "optionalDependencies", "peerDependencies")
+
+
+def install_command(project_dir: Path) -> tuple[str, ...]:
+    """`npm ci` when the project has a lockfile, else `npm install`."""
+    return ("npm", "ci") if (project_dir / LOCKFILE).is_file() else ("npm", "install")
+
+
+class LockfileStore:
+    """
+    Resolved dependency graphs of npm installs, keyed by dependency_key().
+
+    After a successful install the "packages" section of the project's
+    package-lock.json is kept in <root>/<key>.json. A later project with
+    the same dependency set gets a lockfile assembled from that graph, so
+    npm can skip resolution and run `npm ci` against exact versions.
+    """
+
+    def __init__(self, root: Path | None = None):
+        self.root = Path(root) if root else cache_root() / "lockfiles"
+
+    @classmethod
+    def from_env(cls) -> "LockfileStore | None":
+        """The default store, or None when disabled with SKELLY_LOCKFILES=0."""
+        if os.environ.get("SKELLY_LOCKFILES", "1") in ("0", "false", "no", "off"):
+            return None
+        return cls()
+
+    def _path(self, key: str) -> Path:
+        return self.root / f"{key}.json"
+
+    def graph(self, key: str) -> dict | None:
+        """The cached graph for key, or None on a miss."""
+        try:
+            return json.loads(self._path(key).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+
+    def save(self, project_dir: Path) -> bool:
+        """
+        Keep the resolution graph of the package-lock.json in project_dir.
+
+        Returns False when there is nothing to keep: no lockfile, a graph
+        for the same dependency set already stored, or a lockfile with
+        local (file: or workspace) packages whose paths only make sense
+        in that project.
+        """
+        try:
+            package = json.loads((project_dir / "package.json").read_text(encoding="utf-8"))
+            lock = json.loads((project_dir / LOCKFILE).read_text(encoding="utf-8"))
+            packages = lock["packages"]
+        except (OSError, ValueError, KeyError, TypeError):
+            return False
+        key = dependency_key(package)
+        if self._path(key).exists():
+            return False
+
+        graph = {path: entry for path, entry in packages.items() if path}
+        for entry in graph.values():
+            if entry.get("link") or str(entry.get("resolved", "")).startswith("file:"):
+                return False
+
+        self.root.mkdir(parents=True, exist_ok=True)
+        tmp = self.root / f".{key}.{uuid.uuid4().hex}.tmp"
+        data = {"lockfileVersion": lock.get("lockfileVersion", 3), "packages": graph}
+        tmp.write_text(json.dumps(data, separators=(",", ":")), encoding="utf-8")
+        os.replace(tmp, self._path(key))
+        return True
+
+    def lockfile_for(self, package: dict) -> str | None:
+        """A package-lock.json for package built from the cached graph of its dependency set, or None."""
+        graph = self.graph(dependency_key(package))
+        if graph is None:
+            return None
+        identity = {field: package[field] for field in ("name", "version") if field in package}
+        root = {**identity, **{field: package[field] for field in ROOT_FIELDS if package.get(field)}}
+        lock = {
+            **identity,
+            "lockfileVersion": graph["lockfileVersion"],
+            "requires": True,
+            "packages": {"": root, **graph["packages"]},
+        }
+        return json.dumps(lock, indent=2) + "\n"
+
+
+def add_package_json(plan: BuildPlan, directory: str, package: dict, lockfiles: LockfileStore | None) -> bool:
+    """Add directory/package.json and, when its dependency set was resolved before, package-lock.json."""
+    plan.add_file(f"{directory}/package.json", json.dumps(package, indent=2))
+    lockfile = lockfiles.lockfile_for(package) if lockfiles is not None else None
+    if lockfile is None:
+        return False
+    plan.add_file(f"{directory}/{LOCKFILE}", lockfile)
+    return True
@@ -0,0 +1,80 @@
+import hashlib
+import json
+import os
+from dataclasses import asdict, dataclass, field
+
+from skelly.core.models import ProjectConfig
+from skelly.core.output import OutputBackend
+
+
+MANIFEST_DIR = ".skelly"
+MANIFEST_PATH = f"{MANIFEST_DIR}/manifest.json"
+MANIFEST_VERSION = 1
+
+
+def content_hash(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def hash_config(config: ProjectConfig) -> str:
+    """Hash the configuration that produced a project; the output location is not part of it."""
+    values = asdict(config)
+    values.pop("output_path")
+    return content_hash(json.dumps(values, sort_keys=True).encode())
+
+
+@dataclass(frozen=True)
+class FileRecord:
+    """Hash of a generated file plus the stat data seen right after it was written."""
+
+    sha256: str
+    size: int
+    mtime_ns: int
+
+    def matches_stat(self, stat: os.stat_result) -> bool:
+        return stat.st_size == self.size and stat.st_mtime_ns == self.mtime_ns
+
+
+@dataclass
+class Manifest:
+    """
+    Record of what skelly generated into a project directory.
+    Stored in .skelly/manifest.json and used to regenerate incrementally.
+    """
+
+    config_hash: str | None = None
+    files: dict[str, FileRecord] = field(default_factory=dict)
+
+    @classmethod
+    def load(cls, output: OutputBackend) -> "Manifest | None":
+        """Return the manifest stored in the output, or None if there is no usable one."""
+        raw = output.read_file(MANIFEST_PATH)
+        if raw is None:
+            return None
+        try:
+            data = json.loads(raw)
+        except ValueError:
+            return None
+        if data.get("version") != MANIFEST_VERSION:
+            return None
+        files = {path: FileRecord(**record) for path, record in data.get("files", {}).items()}
+        return cls(config_hash=data.get("config_hash"), files=files)
+
+    def to_json(self) -> str:
+        return json.dumps(
+            {
+                "version": MANIFEST_VERSION,
+                "config_hash": self.config_hash,
+                "files": {path: asdict(self.files[path]) for path in sorted(self.files)},
+            },
+            indent=2,
+        ) + "\n"
+
+    def save(self, output: OutputBackend) -> bool:
+        """Write the manifest unless an identical one is already there. Returns True if written."""
+        content = self.to_json().encode()
+        if output.read_file(MANIFEST_PATH) == content:
+            return False
+        output.make_dir(MANIFEST_DIR)
+        output.write_file(MANIFEST_PATH, content)
+        return True
@@ -0,0 +1,135 @@
+import json
+import os
+import shutil
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+
+from skelly.core.exceptions import DependencyInstallError
+from skelly.core.installer import DEFAULT_TIMEOUT, InstallRunner, InstallStep
+from skelly.core.paths import cache_root
+
+PREFETCH_MARKER = ".skelly-prefetch.json"
+
+
+@dataclass(frozen=True, order=True)
+class Coordinate:
+    """Maven artifact coordinate groupId:artifactId:version."""
+
+    group_id: str
+    artifact_id: str
+    version: str
+
+    def __str__(self) -> str:
+        return f"{self.group_id}:{self.artifact_id}:{self.version}"
+
+    @classmethod
+    def parse(cls, text: str) -> "Coordinate":
+        parts = text.split(":")
+        if len(parts) != 3 or not all(parts):
+            raise ValueError(f"Invalid Maven coordinate: {text}")
+        return cls(*parts)
+
+    def pom_path(self) -> str:
+        """Location of the artifact's POM inside a repository using the Maven 2 layout."""
+        group = self.group_id.replace(".", "/")
+        return f"{group}/{self.artifact_id}/{self.version}/{self.artifact_id}-{self.version}.pom"
+
+
+class MavenRepository:
+    """
+    Local Maven repository managed by skelly for offline builds.
+
+    `skelly prefetch java` resolves the dependency closure of every
+    supported library into it and records the root artifacts in a marker
+    file. Projects whose artifacts are all covered are built with
+    `mvn -o` against this repository.
+    """
+
+    def __init__(self, path: Path | None = None):
+        self.path = Path(path) if path else cache_root() / "maven-repository"
+
+    @classmethod
+    def from_env(cls) -> "MavenRepository":
+        """The managed repository at $SKELLY_MAVEN_REPO, else maven-repository in the cache root."""
+        override = os.environ.get("SKELLY_MAVEN_REPO")
+        return cls(Path(override) if override else None)
+
+    def prefetched(self) -> set[Coordinate]:
+        """Root artifacts whose closure was resolved by a previous prefetch."""
+        try:
+            data = json.loads((self.path / PREFETCH_MARKER).read_text(encoding="utf-8"))
+            return {Coordinate.parse(text) for text in data["artifacts"]}
+        except (OSError, ValueError, KeyError):
+            return set()
+
+    def has_artifact(self, coordinate: Coordinate) -> bool:
+        return (self.path / coordinate.pom_path()).is_file()
+
+    def has_closure(self, coordinates: list[Coordinate]) -> bool:
+        """Whether every coordinate was prefetched and is still in the repository."""
+        prefetched = self.prefetched()
+        return all(c in prefetched and self.has_artifact(c) for c in coordinates)
+
+    def offline_args(self) -> tuple[str, ...]:
+        """mvn options that build a project offline against this repository."""
+        return ("-o", f"-Dmaven.repo.local={self.path.resolve()}")
+
+    def prefetch(
+        self,
+        pom: str,
+        coordinates: list[Coordinate],
+        source: Path | None = None,
+        timeout: float = DEFAULT_TIMEOUT,
+    ) -> None:
+        """
+        Populate the repository with the closure of a POM.
+
+        Without a source, Maven resolves it (dependency:go-offline, which
+        includes plugins). With a source, the artifacts are mirrored from
+        an existing repository directory instead, e.g. one copied from a
+        machine with network access.
+        """
+        self.path.mkdir(parents=True, exist_ok=True)
+        if source is not None:
+            self._mirror(Path(source))
+        else:
+            self._resolve(pom, timeout)
+
+        missing = [str(c) for c in coordinates if not self.has_artifact(c)]
+        if missing:
+            raise DependencyInstallError(f"Artifacts missing after prefetch: {', '.join(missing)}")
+        self._record(coordinates)
+
+    def _resolve(self, pom: str, timeout: float) -> None:
+        with tempfile.TemporaryDirectory(prefix="skelly-prefetch-") as tmp:
+            Path(tmp, "pom.xml").write_text(pom, encoding="utf-8")
+            step = InstallStep(
+                label="prefetch",
+                cmd=("mvn", "-B", f"-Dmaven.repo.local={self.path.resolve()}", "dependency:go-offline"),
+                cwd=Path(tmp),
+                ecosystem="maven",
+                success_msg="Maven dependencies resolved!",
+                fail_msg="Maven prefetch failed. Is 'mvn' installed and is the network reachable?",
+            )
+            [result] = InstallRunner(timeout=timeout).run([[step]])
+        if not result.ok:
+            raise DependencyInstallError(result.error or f"mvn exited with {result.returncode}")
+
+    def _mirror(self, source: Path) -> None:
+        if not source.is_dir():
+            raise DependencyInstallError(f"Source repository not found: {source}")
+        for root, _, files in os.walk(source):
+            target_dir = self.path / Path(root).relative_to(source)
+            target_dir.mkdir(parents=True, exist_ok=True)
+            for name in files:
+                target = target_dir / name
+                if not target.exists():
+                    shutil.copy2(Path(root) / name, target)
+
+    def _record(self, coordinates: list[Coordinate]) -> None:
+        artifacts = sorted(str(c) for c in self.prefetched() | set(coordinates))
+        marker = self.path / PREFETCH_MARKER
+        tmp = marker.with_name(f"{PREFETCH_MARKER}.{os.getpid()}.tmp")
+        tmp.write_text(json.dumps({"artifacts": artifacts}, indent=2), encoding="utf-8")
+        os.replace(tmp, marker)
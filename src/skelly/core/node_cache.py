@@ -0,0 +1,210 @@
+import hashlib
+import json
+import os
+import platform
+import shutil
+import sys
+import time
+import uuid
+from dataclasses import dataclass
+from pathlib import Path
+
+from skelly.core.paths import cache_root, link_or_copy
+
+# Only these package.json fields influence what `npm install` puts into node_modules.
+DEPENDENCY_FIELDS = (
+    "dependencies",
+    "devDependencies",
+    "optionalDependencies",
+    "peerDependencies",
+    "overrides",
+)
+
+DEFAULT_MAX_BYTES = 5 * 1024 ** 3
+META_FILE = "meta.json"
+
+_SIZE_UNITS = {"": 1, "K": 1024, "M": 1024 ** 2, "G": 1024 ** 3, "T": 1024 ** 4}
+
+
+def parse_size(value: str) -> int:
+    """Parse a size such as '500M', '2G' or '1048576' into bytes."""
+    text = value.strip().upper().removesuffix("B")
+    unit = text[-1:] if text[-1:] in _SIZE_UNITS else ""
+    number = text[: len(text) - len(unit)]
+    try:
+        size = float(number) * _SIZE_UNITS[unit]
+    except ValueError:
+        raise ValueError(f"Invalid size: {value}") from None
+    if size < 0:
+        raise ValueError(f"Invalid size: {value}")
+    return int(size)
+
+
+def format_size(size: int) -> str:
+    for unit in ("B", "KiB", "MiB", "GiB"):
+        if size < 1024 or unit == "GiB":
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+
+
+def dependency_key(package: dict) -> str:
+    """
+    Cache key for the node_modules tree of a package.json.
+
+    Name, version, scripts and key order do not matter; the platform does,
+    because packages may ship native binaries.
+    """
+    normalized = {
+        name: dict(sorted(package[name].items())) if isinstance(package[name], dict) else package[name]
+        for name in DEPENDENCY_FIELDS
+        if package.get(name)
+    }
+    normalized["platform"] = f"{sys.platform}-{platform.machine()}"
+    data = json.dumps(normalized, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(data.encode("utf-8")).hexdigest()
+
+
+def _tree_size(path: Path) -> int:
+    total = 0
+    for root, _, files in os.walk(path):
+        for name in files:
+            try:
+                total += os.lstat(os.path.join(root, name)).st_size
+            except OSError:
+                pass
+    return total
+
+
+@dataclass(frozen=True)
+class CacheEntry:
+    key: str
+    size: int
+    created: float
+    last_used: float
+
+
+class NodeModulesCache:
+    """
+    Content-addressed store of installed node_modules trees.
+
+    Entries live in <root>/<key>/node_modules and are materialized into
+    projects with hardlinks, so a hit costs one link per file instead of
+    an `npm install`. Least recently used entries are evicted once the
+    total size exceeds max_bytes.
+    """
+
+    def __init__(self, root: Path | None = None, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.root = Path(root) if root else cache_root() / "node_modules"
+        self.max_bytes = max_bytes
+
+    @classmethod
+    def from_env(cls) -> "NodeModulesCache | None":
+        """The default cache, or None when disabled with SKELLY_NODE_CACHE=0; SKELLY_NODE_CACHE_SIZE sets the limit."""
+        if os.environ.get("SKELLY_NODE_CACHE", "1") in ("0", "false", "no", "off"):
+            return None
+        size = os.environ.get("SKELLY_NODE_CACHE_SIZE")
+        return cls(max_bytes=parse_size(size) if size else DEFAULT_MAX_BYTES)
+
+    def key_for(self, project_dir: Path) -> str | None:
+        """
+        Cache key for the package.json in project_dir, or None if there is none.
+        Workspace roots are not cached: their node_modules links into the members.
+        """
+        try:
+            package = json.loads((project_dir / "package.json").read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if not isinstance(package, dict) or "workspaces" in package:
+            return None
+        return dependency_key(package)
+
+    def _entry_dir(self, key: str) -> Path:
+        return self.root / key
+
+    def _read_meta(self, key: str) -> CacheEntry | None:
+        try:
+            meta = json.loads((self._entry_dir(key) / META_FILE).read_text(encoding="utf-8"))
+            return CacheEntry(key, meta["size"], meta["created"], meta["last_used"])
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def _write_meta(self, entry: CacheEntry) -> None:
+        meta = {"size": entry.size, "created": entry.created, "last_used": entry.last_used}
+        path = self._entry_dir(entry.key) / META_FILE
+        tmp = path.with_name(f"{META_FILE}.{uuid.uuid4().hex}.tmp")
+        tmp.write_text(json.dumps(meta), encoding="utf-8")
+        os.replace(tmp, path)
+
+    def entries(self) -> list[CacheEntry]:
+        """All complete entries, least recently used first."""
+        if not self.root.is_dir():
+            return []
+        entries = [
+            self._read_meta(path.name)
+            for path in self.root.iterdir()
+            if path.is_dir() and not path.name.startswith(".")
+        ]
+        return sorted((entry for entry in entries if entry), key=lambda entry: entry.last_used)
+
+    def total_size(self) -> int:
+        return sum(entry.size for entry in self.entries())
+
+    def materialize(self, key: str, target: Path) -> bool:
+        """Link the cached node_modules for key into target; returns False on a cache miss."""
+        entry = self._read_meta(key)
+        if entry is None:
+            return False
+        if target.exists():
+            shutil.rmtree(target)
+        try:
+            shutil.copytree(self._entry_dir(key) / "node_modules", target,
+                            symlinks=True, copy_function=link_or_copy)
+        except (OSError, shutil.Error):
+            # Evicted or damaged underneath us; let npm do the work instead.
+            shutil.rmtree(target, ignore_errors=True)
+            return False
+        self._write_meta(CacheEntry(key, entry.size, entry.created, time.time()))
+        return True
+
+    def store(self, key: str, node_modules: Path) -> CacheEntry | None:
+        """Add an installed node_modules tree under key and evict old entries beyond the size limit."""
+        if self._read_meta(key) is not None or not node_modules.is_dir():
+            return None
+        self.root.mkdir(parents=True, exist_ok=True)
+        staging = self.root / f".staging-{uuid.uuid4().hex}"
+        try:
+            shutil.copytree(node_modules, staging / "node_modules", symlinks=True, copy_function=link_or_copy)
+            now = time.time()
+            entry = CacheEntry(key, _tree_size(staging), now, now)
+            meta = {"size": entry.size, "created": entry.created, "last_used": entry.last_used}
+            (staging / META_FILE).write_text(json.dumps(meta), encoding="utf-8")
+            os.rename(staging, self._entry_dir(key))
+        except OSError:
+            # Another process stored the same key first, or the cache is not writable.
+            shutil.rmtree(staging, ignore_errors=True)
+            return None
+        self.prune(self.max_bytes)
+        return entry
+
+    def prune(self, max_bytes: int | None = None) -> list[CacheEntry]:
+        """Evict least recently used entries until the cache fits into max_bytes (default: the limit)."""
+        limit = self.max_bytes if max_bytes is None else max_bytes
+        entries = self.entries()
+        total = sum(entry.size for entry in entries)
+        removed = []
+        for entry in entries:
+            if total <= limit:
+                break
+            self._remove(entry.key)
+            total -= entry.size
+            removed.append(entry)
+        return removed
+
+    def _remove(self, key: str) -> None:
+        # Rename first so that a concurrent materialize never sees a half-deleted entry.
+        trash = self.root / f".trash-{uuid.uuid4().hex}"
+        try:
+            os.rename(self._entry_dir(key), trash)
+        except OSError:
+            return
+        shutil.rmtree(trash, ignore_errors=True)
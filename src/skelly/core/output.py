@@ -0,0 +1,231 @@
+import io
+import os
+import threading
+import time
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import BinaryIO, Iterable
+
+
+class OutputBackend(ABC):
+    """
+    Destination for the folders and files of a build.
+    Paths are always project-relative POSIX paths as stored in a BuildPlan.
+    """
+
+    #: Whether make_dir/write_file may be called from several threads at once.
+    concurrent: bool = False
+    #: Whether the next build can read this build's files back, so a manifest makes it incremental.
+    incremental: bool = False
+
+    @abstractmethod
+    def make_dir(self, path: str) -> None:
+        """Create a directory (and its parents)."""
+        pass
+
+    @abstractmethod
+    def write_file(self, path: str, data: bytes) -> None:
+        """Write a file; its parent directory has already been created."""
+        pass
+
+    def write_stream(self, path: str, blocks: Iterable[bytes]) -> None:
+        """Write a file from blocks of content; backends that can append write them without joining."""
+        self.write_file(path, b"".join(blocks))
+
+    def read_file(self, path: str) -> bytes | None:
+        """Return the current content of a file, or None if it does not exist or cannot be read back."""
+        return None
+
+    def stat(self, path: str) -> os.stat_result | None:
+        """Return stat data for an existing file, or None."""
+        return None
+
+    def close(self) -> None:
+        """Flush and finalize the output."""
+        pass
+
+    def __enter__(self) -> "OutputBackend":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class FileSystemOutput(OutputBackend):
+    """Writes the project below a directory on disk."""
+
+    concurrent = True
+    incremental = True
+
+    def __init__(self, base_path: Path):
+        self.base_path = Path(base_path)
+
+    def make_dir(self, path: str) -> None:
+        os.makedirs(self.base_path / path, exist_ok=True)
+
+    def write_file(self, path: str, data: bytes) -> None:
+        with open(self.base_path / path, "wb") as f:
+            f.write(data)
+
+    def write_stream(self, path: str, blocks: Iterable[bytes]) -> None:
+        """
+        Write the blocks to a temporary file next to the target and move it into place,
+        so a render error or interruption never leaves a truncated file behind.
+        """
+        target = self.base_path / path
+        tmp = target.with_name(f"{target.name}.{os.getpid()}.tmp")
+        try:
+            with open(tmp, "wb") as f:
+                for block in blocks:
+                    f.write(block)
+            os.replace(tmp, target)
+        except BaseException:
+            tmp.unlink(missing_ok=True)
+            raise
+
+    def read_file(self, path: str) -> bytes | None:
+        try:
+            return (self.base_path / path).read_bytes()
+        except FileNotFoundError:
+            return None
+
+    def stat(self, path: str) -> os.stat_result | None:
+        try:
+            return (self.base_path / path).stat()
+        except FileNotFoundError:
+            return None
+
+
+class MemoryOutput(OutputBackend):
+    """Keeps the project in memory, e.g. for previews, tests or embedding."""
+
+    concurrent = True
+    incremental = True
+
+    def __init__(self):
+        self.directories: set[str] = set()
+        self.files: dict[str, bytes] = {}
+
+    def make_dir(self, path: str) -> None:
+        self.directories.add(path)
+
+    def write_file(self, path: str, data: bytes) -> None:
+        self.files[path] = data
+
+    def read_file(self, path: str) -> bytes | None:
+        return self.files.get(path)
+
+
+class _ArchiveOutput(OutputBackend):
+    """
+    Common handling for archive streams: entry prefix, timestamps, serialized writes.
+    tarfile and zipfile are imported on use; they pull in the compression modules.
+    """
+
+    DIR_MODE = 0o755
+    FILE_MODE = 0o644
+
+    def __init__(self, stream: BinaryIO, prefix: str = ""):
+        self.stream = stream
+        self.prefix = prefix.strip("/")
+        self.mtime = int(time.time())
+        self._lock = threading.Lock()
+
+    def _name(self, path: str) -> str:
+        return f"{self.prefix}/{path}" if self.prefix else path
+
+
+class TarStreamOutput(_ArchiveOutput):
+    """
+    Streams the project into a gzip-compressed tar archive.
+    Uses tarfile's stream mode, so the target may be a pipe (e.g. stdout).
+    """
+
+    def __init__(self, stream: BinaryIO, prefix: str = ""):
+        import tarfile
+
+        super().__init__(stream, prefix)
+        self._tar = tarfile.open(fileobj=stream, mode="w|gz", format=tarfile.PAX_FORMAT)
+        self._dirs: set[str] = set()
+
+    def make_dir(self, path: str) -> None:
+        import tarfile
+
+        with self._lock:
+            parts = self._name(path).split("/")
+            for depth in range(1, len(parts) + 1):
+                name = "/".join(parts[:depth])
+                if name in self._dirs:
+                    continue
+                info = tarfile.TarInfo(name)
+                info.type = tarfile.DIRTYPE
+                info.mode = self.DIR_MODE
+                info.mtime = self.mtime
+                self._tar.addfile(info)
+                self._dirs.add(name)
+
+    def write_file(self, path: str, data: bytes) -> None:
+        import tarfile
+
+        info = tarfile.TarInfo(self._name(path))
+        info.size = len(data)
+        info.mode = self.FILE_MODE
+        info.mtime = self.mtime
+        with self._lock:
+            self._tar.addfile(info, io.BytesIO(data))
+
+    def close(self) -> None:
+        self._tar.close()
+
+
+class ZipStreamOutput(_ArchiveOutput):
+    """
+    Streams the project into a zip archive.
+    Works on unseekable streams; zipfile then writes data descriptors after each entry.
+    """
+
+    def __init__(self, stream: BinaryIO, prefix: str = ""):
+        import zipfile
+
+        super().__init__(stream, prefix)
+        self._zip = zipfile.ZipFile(stream, mode="w", compression=zipfile.ZIP_DEFLATED)
+        self._date_time = time.localtime(self.mtime)[:6]
+
+    def make_dir(self, path: str) -> None:
+        import zipfile
+
+        info = zipfile.ZipInfo(self._name(path) + "/", date_time=self._date_time)
+        info.external_attr = (0o40000 | self.DIR_MODE) << 16
+        with self._lock:
+            self._zip.writestr(info, b"")
+
+    def write_file(self, path: str, data: bytes) -> None:
+        import zipfile
+
+        info = zipfile.ZipInfo(self._name(path), date_time=self._date_time)
+        info.compress_type = zipfile.ZIP_DEFLATED
+        info.external_attr = (0o100000 | self.FILE_MODE) << 16
+        with self._lock:
+            self._zip.writestr(info, data)
+
+    def close(self) -> None:
+        self._zip.close()
+
+
+ARCHIVE_FORMATS = {
+    "tar.gz": TarStreamOutput,
+    "zip": ZipStreamOutput,
+}
+
+
+def archive_format_for(path: str) -> str:
+    """Guess the archive format from a file name; defaults to tar.gz (also for '-')."""
+    return "zip" if path.lower().endswith(".zip") else "tar.gz"
+
+
+def open_archive(stream: BinaryIO, archive_format: str, prefix: str = "") -> OutputBackend:
+    try:
+        cls = ARCHIVE_FORMATS[archive_format]
+    except KeyError:
+        raise ValueError(f"Unknown archive format: {archive_format}") from None
+    return cls(stream, prefix)
@@ -0,0 +1,21 @@
+import os
+import shutil
+from pathlib import Path
+
+
+def cache_root() -> Path:
+    """Root of skelly's on-disk caches: $SKELLY_CACHE_DIR, else $XDG_CACHE_HOME/skelly, else ~/.cache/skelly."""
+    override = os.environ.get("SKELLY_CACHE_DIR")
+    if override:
+        return Path(override)
+    xdg = os.environ.get("XDG_CACHE_HOME")
+    base = Path(xdg) if xdg else Path.home() / ".cache"
+    return base / "skelly"
+
+
+def link_or_copy(src: str, dst: str) -> None:
+    """Hardlink a file, falling back to a copy across filesystems or where links are not supported."""
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
@@ -0,0 +1,212 @@
+import re
+from typing import Iterable, Iterator
+
+_RANGE = re.compile(r"^(-?\d+|[A-Za-z])\.\.(-?\d+|[A-Za-z])$")
+_DRIVE = re.compile(r"^[A-Za-z]:")
+_INVALID = re.compile(r"[*?\[\]\x00]")
+
+# Most paths a brace pattern, or the folders of a custom architecture together, may expand to.
+MAX_PATHS = 100_000
+
+
+def _matching_brace(pattern: str, start: int) -> tuple[int, list[int]]:
+    """Index of the brace closing pattern[start] and the positions of its top-level commas."""
+    depth = 0
+    commas = []
+    for index in range(start, len(pattern)):
+        char = pattern[index]
+        if char == "{":
+            depth += 1
+        elif char == "}":
+            depth -= 1
+            if depth == 0:
+                return index, commas
+        elif char == "," and depth == 1:
+            commas.append(index)
+    raise ValueError(f"Unbalanced braces in {pattern!r}")
+
+
+def _range_bounds(body: str) -> tuple[int, int, int] | None:
+    """First and last code and zero-padding width of a range body, or None if body is not a range."""
+    match = _RANGE.match(body)
+    if not match:
+        return None
+    first, last = match.groups()
+    if first.lstrip("-").isdigit() and last.lstrip("-").isdigit():
+        width = max(len(first), len(last)) if first.startswith("0") or last.startswith("0") else 0
+        return int(first), int(last), width
+    if first.isalpha() and last.isalpha():
+        return ord(first), ord(last), -1
+    return None
+
+
+def _range(body: str) -> list[str] | None:
+    """Items of a {1..3}, {01..10} or {a..e} range, or None if body is not a range."""
+    bounds = _range_bounds(body)
+    if bounds is None:
+        return None
+    first, last, width = bounds
+    step = 1 if last >= first else -1
+    codes = range(first, last + step, step)
+    if width < 0:
+        return [chr(code) for code in codes]
+    return [str(number).zfill(width) for number in codes]
+
+
+def count_braces(pattern: str) -> int:
+    """
+    Number of paths expand_braces(pattern) gives, without building them.
+
+    Alternatives of a group are balanced, so a pattern's count is the
+    group's count (the sum over its alternatives, or the size of its
+    range) times the count of the rest of the pattern.
+    """
+    start = pattern.find("{")
+    while start != -1:
+        end, commas = _matching_brace(pattern, start)
+        suffix = pattern[end + 1:]
+        if commas:
+            bounds = [start, *commas, end]
+            alternatives = sum(count_braces(pattern[bounds[i] + 1:bounds[i + 1]]) for i in range(len(bounds) - 1))
+            return alternatives * count_braces(suffix)
+        range_bounds = _range_bounds(pattern[start + 1:end])
+        if range_bounds is not None:
+            first, last, _ = range_bounds
+            return (abs(last - first) + 1) * count_braces(suffix)
+        start = pattern.find("{", end + 1)
+    if pattern.count("{") != pattern.count("}"):
+        raise ValueError(f"Unbalanced braces in {pattern!r}")
+    return 1
+
+
+def expand_braces(pattern: str, limit: int = MAX_PATHS) -> list[str]:
+    """
+    Shell-style brace expansion: 'services/{a,b}/src/{api,domain}' gives
+    four paths. Groups nest, and {1..3}, {01..10} and {a..e} expand to
+    ranges. A group without a comma or range, such as '{x}', is literal.
+    Patterns that expand to more than limit paths raise ValueError before
+    anything is expanded.
+    """
+    if count_braces(pattern) > limit:
+        raise ValueError(f"{pattern!r} expands to more than {limit} paths")
+    return _expand(pattern)
+
+
+def _expand(pattern: str) -> list[str]:
+    start = pattern.find("{")
+    while start != -1:
+        end, commas = _matching_brace(pattern, start)
+        body = pattern[start + 1:end]
+        if commas:
+            bounds = [start, *commas, end]
+            alternatives = [pattern[bounds[i] + 1:bounds[i + 1]] for i in range(len(bounds) - 1)]
+        else:
+            alternatives = _range(body)
+        if alternatives is not None:
+            prefix, suffix = pattern[:start], pattern[end + 1:]
+            return [path for alternative in alternatives for path in _expand(prefix + alternative + suffix)]
+        start = pattern.find("{", end + 1)
+    if pattern.count("{") != pattern.count("}"):
+        raise ValueError(f"Unbalanced braces in {pattern!r}")
+    return [pattern]
+
+
+def split_paths(text: str) -> list[str]:
+    """Split a comma-separated list of paths, keeping commas inside brace groups."""
+    paths = []
+    depth = 0
+    current = []
+    for char in text:
+        if char == "," and depth == 0:
+            paths.append("".join(current))
+            current = []
+            continue
+        if char == "{":
+            depth += 1
+        elif char == "}" and depth:
+            depth -= 1
+        current.append(char)
+    paths.append("".join(current))
+    return [path.strip() for path in paths if path.strip()]
+
+
+def split_path(path: str) -> list[str]:
+    """
+    Normalize a project-relative folder path into its segments.
+
+    Backslashes count as separators; empty and '.' segments are dropped.
+    Absolute paths, drive letters, '..' segments and glob wildcards raise
+    ValueError, since they would escape the project or cannot match
+    folders that do not exist yet.
+    """
+    text = path.strip().replace("\\", "/")
+    if text.startswith("/") or _DRIVE.match(text):
+        raise ValueError(f"Folder paths must be relative to the project: {path!r}")
+    # Checks run on the whole string rather than per segment; this is the hot path for large layouts.
+    invalid = _INVALID.search(text)
+    if invalid and invalid.group() == "\0":
+        raise ValueError(f"Invalid character in folder path: {path!r}")
+    if invalid:
+        raise ValueError(f"Wildcards cannot be expanded for folders that do not exist yet: {path!r}")
+    segments = [segment for segment in text.split("/") if segment and segment != "."]
+    if not segments:
+        raise ValueError(f"Empty folder path: {path!r}")
+    if ".." in segments:
+        raise ValueError(f"Folder paths must not leave the project: {path!r}")
+    return segments
+
+
+class PathSet:
+    """
+    Set of folder paths stored as a trie of path segments.
+
+    Adding a path walks one node per segment, so duplicates and paths that
+    are ancestors of others cost nothing extra, and the leaves are the
+    minimal set of directories whose creation creates every path.
+    """
+
+    def __init__(self, paths: Iterable[str] = ()):
+        self._root: dict[str, dict] = {}
+        self._count = 0
+        self.update(paths)
+
+    def add(self, path: str) -> None:
+        node = self._root
+        for segment in split_path(path):
+            child = node.get(segment)
+            if child is None:
+                child = node[segment] = {}
+                self._count += 1
+            node = child
+
+    def update(self, paths: Iterable[str]) -> None:
+        for path in paths:
+            self.add(path)
+
+    def __contains__(self, path: str) -> bool:
+        node = self._root
+        for segment in split_path(path):
+            node = node.get(segment)
+            if node is None:
+                return False
+        return True
+
+    def __len__(self) -> int:
+        """Number of distinct folders, ancestors included."""
+        return self._count
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.leaves())
+
+    def leaves(self) -> list[str]:
+        """Folders without subfolders in the set, in sorted order."""
+        leaves = []
+        # Children are pushed in reverse so that the stack pops them in sorted order.
+        stack = [(name, self._root[name]) for name in sorted(self._root, reverse=True)]
+        while stack:
+            path, node = stack.pop()
+            if not node:
+                leaves.append(path)
+                continue
+            stack.extend((f"{path}/{name}", node[name]) for name in sorted(node, reverse=True))
+        return leaves
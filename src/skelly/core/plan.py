@@ -0,0 +1,153 @@
+from dataclasses import dataclass, field, replace
+from typing import Iterable, Iterator
+
+from skelly.core.template_renderer import render_template, stream_template
+
+
+GITKEEP = ".gitkeep"
+
+
+def normalize_path(path: str) -> str:
+    """Return a project-relative POSIX path without leading './' or trailing '/'."""
+    text = str(path).replace("\\", "/")
+    # Plain string operations: PurePosixPath dominates plans with many thousands of folders.
+    normalized = "/".join(segment for segment in text.split("/") if segment and segment != ".")
+    if text.startswith("/"):
+        normalized = "/" + normalized
+    if not normalized:
+        raise ValueError(f"Invalid project path: {path!r}")
+    return normalized
+
+
+def _parent(path: str) -> str:
+    """Parent of a normalized path, '' for top-level entries."""
+    return path.rpartition("/")[0]
+
+
+@dataclass(frozen=True)
+class PlannedFile:
+    """
+    A single file in a BuildPlan.
+    Holds either literal content or a template reference that is rendered on demand.
+    """
+
+    path: str
+    content: str | None = None
+    template: str | None = None
+    context: dict[str, object] = field(default_factory=dict)
+
+    def render(self) -> str:
+        if self.content is not None:
+            return self.content
+        return render_template(self.template, **self.context)
+
+    def stream(self) -> Iterator[bytes]:
+        """The encoded content in blocks, rendering templates incrementally."""
+        if self.content is not None:
+            yield self.content.encode()
+        else:
+            yield from stream_template(self.template, **self.context)
+
+
+class BuildPlan:
+    """
+    In-memory manifest of every folder and file a build produces.
+
+    Strategies only register entries here; nothing touches the disk until
+    the plan is handed to a PlanExecutor. All paths are relative to the
+    project root.
+    """
+
+    def __init__(self):
+        self._folders: set[str] = set()
+        self._files: dict[str, PlannedFile] = {}
+
+    @classmethod
+    def merged(cls, plans: Iterable["BuildPlan"]) -> "BuildPlan":
+        """One plan with the folders and files of all plans; later plans win for the same file path."""
+        merged = cls()
+        for plan in plans:
+            merged._folders.update(plan._folders)
+            merged._files.update(plan._files)
+        return merged
+
+    def relocated(self, source: str, target: str) -> "BuildPlan":
+        """A copy with every folder and file below source moved below target; other entries keep their paths."""
+        source, target = normalize_path(source), normalize_path(target)
+
+        def move(path: str) -> str:
+            if path == source or path.startswith(source + "/"):
+                return target + path[len(source):]
+            return path
+
+        moved = BuildPlan()
+        moved._folders = {move(path) for path in self._folders}
+        moved._files = {move(path): replace(planned, path=move(path)) for path, planned in self._files.items()}
+        return moved
+
+    def get_file(self, path: str) -> PlannedFile | None:
+        return self._files.get(normalize_path(path))
+
+    def remove_file(self, path: str) -> PlannedFile | None:
+        """Drop a planned file and return it, or None if it was not planned."""
+        return self._files.pop(normalize_path(path), None)
+
+    def add_folder(self, path: str) -> "BuildPlan":
+        self._folders.add(normalize_path(path))
+        return self
+
+    def add_folders(self, paths: list[str]) -> "BuildPlan":
+        for path in paths:
+            self.add_folder(path)
+        return self
+
+    def add_file(self, path: str, content: str) -> "BuildPlan":
+        path = normalize_path(path)
+        self._files[path] = PlannedFile(path, content=content)
+        return self
+
+    def add_template(self, path: str, template: str, **context: object) -> "BuildPlan":
+        path = normalize_path(path)
+        self._files[path] = PlannedFile(path, template=template, context=context)
+        return self
+
+    @property
+    def folders(self) -> list[str]:
+        """Folders explicitly registered by the architecture and strategies."""
+        return sorted(self._folders)
+
+    @property
+    def files(self) -> list[PlannedFile]:
+        """All files to write, including a .gitkeep for every folder that would stay empty."""
+        files = dict(self._files)
+        for folder in self._empty_folders():
+            gitkeep = f"{folder}/{GITKEEP}"
+            files[gitkeep] = PlannedFile(gitkeep, content="")
+        return [files[path] for path in sorted(files)]
+
+    def directories(self) -> list[str]:
+        """Return the minimal set of directories to create (leaves only; parents come for free)."""
+        needed = set(self._folders)
+        needed.update(self._file_parents())
+        return sorted(needed - self._ancestors(needed))
+
+    def _file_parents(self) -> set[str]:
+        parents = {_parent(path) for path in self._files}
+        parents.discard("")
+        return parents
+
+    def _empty_folders(self) -> list[str]:
+        occupied = self._file_parents()
+        occupied.update(self._ancestors(self._folders | occupied))
+        return sorted(self._folders - occupied)
+
+    @staticmethod
+    def _ancestors(paths: set[str]) -> set[str]:
+        ancestors = set()
+        for path in paths:
+            parent = _parent(path)
+            # Once a parent is known, all of its own ancestors are too.
+            while parent and parent not in ancestors:
+                ancestors.add(parent)
+                parent = _parent(parent)
+        return ancestors
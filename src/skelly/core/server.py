@@ -0,0 +1,354 @@
+import io
+import json
+import logging
+import os
+import socket
+import socketserver
+import stat
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import replace
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlsplit
+
+from skelly.core.exceptions import ServiceBusyError, SkellyError
+from skelly.core.models import BackendStack, FrontendStack
+from skelly.core.output import ARCHIVE_FORMATS, open_archive
+from skelly.core.pathset import count_braces
+from skelly.core.spec import ProjectSpec
+from skelly.core.template_renderer import preload_templates
+from skelly.core.versions import get_version_index
+from skelly.factories.base import StrategyFactory
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+DEFAULT_QUEUE_SIZE = 16
+MAX_REQUEST_BYTES = 1 << 20
+# Custom folders one request may expand to, below the pathset cap since every workspace member gets them.
+MAX_REQUEST_FOLDERS = 10_000
+PERCENTILES = (50, 90, 95, 99)
+
+_ARCHIVE_TYPES = {"tar.gz": "application/gzip", "zip": "application/zip"}
+
+
+def percentile(values: list[float], q: float) -> float:
+    """Nearest-rank percentile of already sorted values (0.0 for no values)."""
+    if not values:
+        return 0.0
+    rank = max(1, -(-len(values) * q // 100))
+    return values[int(rank) - 1]
+
+
+class LatencyStats:
+    """Request counters plus the latencies of the most recent requests."""
+
+    def __init__(self, window: int = 1024):
+        self._latencies: deque[float] = deque(maxlen=window)
+        self._lock = threading.Lock()
+        self._started = time.time()
+        self.counts = {"ok": 0, "failed": 0, "rejected": 0}
+
+    def record(self, outcome: str, duration: float | None = None) -> None:
+        with self._lock:
+            self.counts[outcome] += 1
+            if duration is not None:
+                self._latencies.append(duration)
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            latencies = sorted(self._latencies)
+            counts = dict(self.counts)
+        summary = {f"p{q}": round(percentile(latencies, q) * 1000, 2) for q in PERCENTILES}
+        summary["max"] = round(latencies[-1] * 1000, 2) if latencies else 0.0
+        summary["mean"] = round(sum(latencies) / len(latencies) * 1000, 2) if latencies else 0.0
+        return {
+            "uptime": round(time.time() - self._started, 1),
+            "requests": counts,
+            "latency_ms": {"samples": len(latencies), **summary},
+        }
+
+
+class ScaffoldService:
+    """
+    Builds projects for the daemon on a fixed pool of worker threads.
+
+    At most workers + queue_size builds are admitted at a time; submit()
+    raises ServiceBusyError beyond that, which the HTTP layer turns into a 503
+    so that clients back off instead of piling up requests.
+    """
+
+    def __init__(self, workers: int | None = None, queue_size: int = DEFAULT_QUEUE_SIZE, root: Path | None = None):
+        self.workers = workers or min(4, os.cpu_count() or 1)
+        self.queue_size = queue_size
+        self.root = Path(root or os.getcwd()).resolve()
+        self.stats = LatencyStats()
+        self._executor = ThreadPoolExecutor(self.workers, thread_name_prefix="skelly-build")
+        self._slots = threading.BoundedSemaphore(self.workers + queue_size)
+        self._admitted = 0
+        self._running = 0
+        self._lock = threading.Lock()
+
+    def warm(self) -> int:
+        """Load templates, the version snapshot and every strategy module ahead of the first request."""
+        for backend in BackendStack:
+            StrategyFactory.create_backend(backend, "warm-up")
+        for frontend in FrontendStack:
+            StrategyFactory.create_frontend(frontend)
+        for architecture in ("layered", "hexagonal"):
+            StrategyFactory.create_architecture(architecture, "warm-up", BackendStack.JAVA)
+        get_version_index()
+        return preload_templates()
+
+    def submit(self, func, *args) -> Future:
+        if not self._slots.acquire(blocking=False):
+            self.stats.record("rejected")
+            raise ServiceBusyError(f"Build queue is full ({self.workers} running, {self.queue_size} queued)")
+        with self._lock:
+            self._admitted += 1
+        try:
+            future = self._executor.submit(self._run, func, args)
+        except BaseException:
+            self._release()
+            raise
+        future.add_done_callback(lambda _: self._release())
+        return future
+
+    def _run(self, func, args):
+        with self._lock:
+            self._running += 1
+        try:
+            return func(*args)
+        finally:
+            with self._lock:
+                self._running -= 1
+
+    def _release(self) -> None:
+        with self._lock:
+            self._admitted -= 1
+        self._slots.release()
+
+    def metrics(self) -> dict:
+        with self._lock:
+            running, queued = self._running, self._admitted - self._running
+        return {
+            **self.stats.snapshot(),
+            "workers": self.workers,
+            "running": running,
+            "queued": queued,
+            "queue_size": self.queue_size,
+        }
+
+    def build_archive(self, spec: ProjectSpec, archive_format: str) -> bytes:
+        """Build the project in memory and return it as an archive."""
+        buffer = io.BytesIO()
+        builder = spec.create_builder(workers=1, install=False)
+        with open_archive(buffer, archive_format, prefix=spec.name) as output:
+            builder.with_output(output).build()
+        return buffer.getvalue()
+
+    def build_directory(self, spec: ProjectSpec, defer_install: bool = False) -> dict:
+        """Write the project below the service root; installs can only be deferred to the install worker."""
+        output_path = self.target_dir(spec)
+        builder = spec.create_builder(workers=1, install=defer_install, defer_install=defer_install)
+        config = builder.set_output_path(str(output_path)).build()
+        return {"name": config.name, "path": str(output_path / config.name)}
+
+    def diff_directory(self, spec: ProjectSpec) -> dict:
+        """Compare the project with its directory below the root; nothing is written."""
+        output_path = self.target_dir(spec)
+        builder = spec.create_builder(workers=1, install=False, dry_run=True)
+        return {"name": spec.name, **builder.set_output_path(str(output_path)).diff().to_dict()}
+
+    def target_dir(self, spec: ProjectSpec) -> Path:
+        """
+        Resolve a spec's output_path against the root. It and the project
+        directory below it must stay inside the root.
+        """
+        target = self._inside(spec.output_path, "output_path")
+        self._inside(target / spec.name, "The project directory")
+        return target
+
+    def confine(self, spec: ProjectSpec) -> ProjectSpec:
+        """
+        The spec with its schema resolved against the root; clients cannot make the
+        daemon read other files. Custom folders beyond MAX_REQUEST_FOLDERS raise ValueError.
+        """
+        if sum(count_braces(folder) for folder in spec.custom_folders) > MAX_REQUEST_FOLDERS:
+            raise ValueError(f"custom_folders expand to more than {MAX_REQUEST_FOLDERS} paths")
+        if spec.schema is None:
+            return spec
+        return replace(spec, schema=str(self._inside(spec.schema, "schema")))
+
+    def _inside(self, path: str | Path, what: str) -> Path:
+        resolved = (self.root / path).resolve()
+        if not resolved.is_relative_to(self.root):
+            raise ValueError(f"{what} must stay inside {self.root}")
+        return resolved
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=True)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """
+    HTTP API of the daemon:
+
+      POST /scaffold   body: project spec; returns a tar.gz (?format=zip for zip),
+                       or with ?output=dir writes below the root and returns JSON;
+                       ?output=diff returns what that would add, modify or conflict with
+      GET  /metrics    request counts, queue depth and latency percentiles
+      GET  /health     liveness check
+    """
+
+    server_version = "skelly"
+    protocol_version = "HTTP/1.1"
+
+    @property
+    def service(self) -> ScaffoldService:
+        return self.server.service
+
+    def do_GET(self) -> None:
+        path = urlsplit(self.path).path
+        if path == "/metrics":
+            self._send_json(HTTPStatus.OK, self.service.metrics())
+        elif path == "/health":
+            self._send_json(HTTPStatus.OK, {"status": "ok"})
+        else:
+            self._send_json(HTTPStatus.NOT_FOUND, {"error": f"Unknown path {path}"})
+
+    def do_POST(self) -> None:
+        url = urlsplit(self.path)
+        if url.path != "/scaffold":
+            self._send_json(HTTPStatus.NOT_FOUND, {"error": f"Unknown path {url.path}"})
+            return
+        start = time.perf_counter()
+        query = {key: values[-1] for key, values in parse_qs(url.query).items()}
+        try:
+            spec = self.service.confine(ProjectSpec.from_dict(self._read_json()))
+            output = query.get("output", "archive")
+            if output == "dir":
+                self.service.target_dir(spec)
+                future = self.service.submit(self.service.build_directory, spec, query.get("defer_install") == "1")
+            elif output == "diff":
+                self.service.target_dir(spec)
+                future = self.service.submit(self.service.diff_directory, spec)
+            else:
+                archive_format = query.get("format", "tar.gz")
+                if archive_format not in ARCHIVE_FORMATS:
+                    raise ValueError(f"Unknown archive format: {archive_format}")
+                future = self.service.submit(self.service.build_archive, spec, archive_format)
+        except ServiceBusyError as e:
+            self._send_json(HTTPStatus.SERVICE_UNAVAILABLE, {"error": str(e)}, {"Retry-After": "1"})
+            return
+        except ValueError as e:
+            self.service.stats.record("failed")
+            self._send_json(HTTPStatus.BAD_REQUEST, {"error": str(e)})
+            return
+
+        try:
+            result = future.result()
+        except ValueError as e:
+            self.service.stats.record("failed", time.perf_counter() - start)
+            self._send_json(HTTPStatus.BAD_REQUEST, {"error": str(e)})
+            return
+        except (OSError, SkellyError) as e:
+            self.service.stats.record("failed", time.perf_counter() - start)
+            self._send_json(HTTPStatus.INTERNAL_SERVER_ERROR, {"error": str(e)})
+            return
+        except Exception:
+            # Still answer (and count) the request instead of dropping the connection.
+            logger.exception("Unexpected error while building %s", spec.name)
+            self.service.stats.record("failed", time.perf_counter() - start)
+            self._send_json(HTTPStatus.INTERNAL_SERVER_ERROR, {"error": "Internal error"})
+            return
+        duration = time.perf_counter() - start
+        self.service.stats.record("ok", duration)
+        if isinstance(result, bytes):
+            self._send(HTTPStatus.OK, result, _ARCHIVE_TYPES[archive_format], {
+                "Content-Disposition": f'attachment; filename="{spec.name}.{archive_format}"',
+                "X-Build-Duration": f"{duration * 1000:.1f}ms",
+            })
+        else:
+            self._send_json(HTTPStatus.OK, {**result, "duration_ms": round(duration * 1000, 1)})
+
+    def _read_json(self) -> dict:
+        length = int(self.headers.get("Content-Length") or 0)
+        if not 0 < length <= MAX_REQUEST_BYTES:
+            raise ValueError(f"Request body must be between 1 and {MAX_REQUEST_BYTES} bytes")
+        try:
+            data = json.loads(self.rfile.read(length))
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Invalid JSON ({e.msg})") from e
+        if not isinstance(data, dict):
+            raise ValueError("Expected a JSON object")
+        return data
+
+    def _send_json(self, status: HTTPStatus, data: dict, headers: dict | None = None) -> None:
+        self._send(status, json.dumps(data).encode() + b"\n", "application/json", headers)
+
+    def _send(self, status: HTTPStatus, body: bytes, content_type: str, headers: dict | None = None) -> None:
+        if status >= 400 and self.command == "POST":
+            # The request body may not have been read; do not reuse the connection.
+            self.close_connection = True
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def address_string(self) -> str:
+        # Unix socket peers have no address.
+        return self.client_address[0] if self.client_address else "unix"
+
+    def log_message(self, format: str, *args) -> None:
+        logger.info("%s %s", self.address_string(), format % args)
+
+
+class _TCPServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+
+class _UnixServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+    def server_bind(self) -> None:
+        # Replace a socket left behind by a previous daemon, but never a regular file.
+        try:
+            if stat.S_ISSOCK(os.stat(self.server_address).st_mode):
+                os.unlink(self.server_address)
+        except FileNotFoundError:
+            pass
+        super().server_bind()
+        os.chmod(self.server_address, 0o600)
+
+    def server_close(self) -> None:
+        super().server_close()
+        try:
+            os.unlink(self.server_address)
+        except FileNotFoundError:
+            pass
+
+
+def create_server(
+    service: ScaffoldService,
+    socket_path: Path | None = None,
+    host: str = DEFAULT_HOST,
+    port: int = DEFAULT_PORT,
+) -> socketserver.BaseServer:
+    """HTTP server for service on a Unix socket, or on host:port when no socket path is given."""
+    if socket_path is not None:
+        if not hasattr(socket, "AF_UNIX"):
+            raise SkellyError("Unix sockets are not supported on this platform; use --port instead")
+        server = _UnixServer(str(socket_path), _Handler)
+    else:
+        server = _TCPServer((host, port), _Handler)
+    server.service = service
+    return server
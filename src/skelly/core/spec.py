@@ -0,0 +1,196 @@
+from dataclasses import dataclass, fields
+from enum import Enum
+from typing import TYPE_CHECKING
+
+from skelly.core.builder import ProjectBuilder
+from skelly.core.models import BackendStack, FrontendStack
+from skelly.core.workspace import member_directory
+from skelly.factories.base import StrategyFactory
+
+if TYPE_CHECKING:
+    from skelly.core.domain import DomainSchema
+
+
+def _parse_enum(enum_cls: type[Enum], value: object) -> Enum:
+    """Accept an enum member, its value ("React") or its name ("REACT")."""
+    if isinstance(value, enum_cls):
+        return value
+    for member in enum_cls:
+        if value == member.value or (isinstance(value, str) and value.upper() == member.name):
+            return member
+    choices = ", ".join(member.value for member in enum_cls)
+    raise ValueError(f"Unknown {enum_cls.__name__} {value!r}. Expected one of: {choices}")
+
+
+def _string(data: dict, key: str) -> None:
+    if key in data and data[key] is not None and not isinstance(data[key], str):
+        raise ValueError(f"Spec field '{key}' must be a string")
+
+
+def _strings(value: object, field_name: str) -> tuple[str, ...]:
+    """A list of strings as a tuple; anything else is a ValueError rather than a TypeError later on."""
+    if not isinstance(value, (list, tuple)) or not all(isinstance(item, str) for item in value):
+        raise ValueError(f"Spec field '{field_name}' must be a list of strings")
+    return tuple(value)
+
+
+def _project_name(name: object) -> str:
+    """The project becomes a directory of that name below output_path, so it must be a single segment."""
+    if not isinstance(name, str) or not name:
+        raise ValueError("Spec field 'name' is required and must be a string")
+    if "/" in name or "\\" in name or name in (".", ".."):
+        raise ValueError(f"Invalid project name {name!r}: it must not contain path separators or be '.' or '..'")
+    return name
+
+
+@dataclass(frozen=True)
+class MemberSpec:
+    """
+    A workspace member: a directory with its stack and, optionally, its own libraries.
+    Without them the member uses the spec's stack and libraries.
+    """
+
+    directory: str
+    stack: BackendStack | FrontendStack | None = None
+    libraries: tuple[str, ...] | None = None
+
+
+def _parse_members(data: object, enum_cls: type[Enum], field_name: str) -> tuple[MemberSpec, ...]:
+    """Members given as "dir", "dir=Stack" or {"directory": ..., "stack": ..., "libraries": [...]}."""
+    if not isinstance(data, (list, tuple)):
+        raise ValueError(f"Spec field '{field_name}' must be a list")
+    members = []
+    for item in data:
+        if isinstance(item, MemberSpec):
+            members.append(item)
+            continue
+        if isinstance(item, str):
+            directory, _, stack = item.partition("=")
+            item = {"directory": directory, "stack": stack or None}
+        if not isinstance(item, dict) or not item.get("directory"):
+            raise ValueError(f"Every entry of '{field_name}' needs a 'directory'")
+        stack = item.get("stack")
+        libraries = item.get("libraries")
+        members.append(MemberSpec(
+            directory=member_directory(item["directory"]),
+            stack=_parse_enum(enum_cls, stack) if stack else None,
+            libraries=_strings(libraries, f"{field_name}.libraries") if libraries is not None else None,
+        ))
+    return tuple(members)
+
+
+def split_members(entries: list[str]) -> tuple[tuple[MemberSpec, ...], tuple[MemberSpec, ...]]:
+    """
+    Sort "dir" and "dir=Stack" entries (from --member) into backend and frontend members.
+    An entry is a frontend member when its stack is a frontend stack; without a stack it is a backend.
+    """
+    backends, frontends = [], []
+    for entry in entries:
+        _, _, stack = entry.partition("=")
+        try:
+            _parse_enum(FrontendStack, stack)
+        except ValueError:
+            backends.append(entry)
+        else:
+            frontends.append(entry)
+    return _parse_members(backends, BackendStack, "backends"), _parse_members(frontends, FrontendStack, "frontends")
+
+
+@dataclass(frozen=True)
+class ProjectSpec:
+    """
+    Non-interactive description of a project: everything the CLI prompts for.
+    Turns into a fully wired ProjectBuilder via create_builder().
+    """
+
+    name: str
+    backend_stack: BackendStack
+    frontend_stack: FrontendStack = FrontendStack.NONE
+    architecture: str = "layered"
+    custom_folders: tuple[str, ...] = ()
+    backend_libraries: tuple[str, ...] = ()
+    frontend_libraries: tuple[str, ...] = ()
+    output_path: str = "./"
+    #: Path of a domain schema (JSON or YAML) for hexagonal Java and Express projects.
+    schema: str | None = None
+    #: Workspace members; with any of them the project is a workspace (see ProjectBuilder.add_backend()).
+    backends: tuple[MemberSpec, ...] = ()
+    frontends: tuple[MemberSpec, ...] = ()
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "ProjectSpec":
+        """Create a spec from plain JSON data, e.g. one line of a batch file."""
+        known = {f.name for f in fields(cls)}
+        unknown = set(data) - known
+        if unknown:
+            raise ValueError(f"Unknown spec fields: {', '.join(sorted(unknown))}")
+        if "backend_stack" not in data:
+            raise ValueError("Spec field 'backend_stack' is required")
+        for key in ("architecture", "output_path", "schema"):
+            _string(data, key)
+
+        values = dict(data)
+        values["name"] = _project_name(data.get("name"))
+        values["backend_stack"] = _parse_enum(BackendStack, data["backend_stack"])
+        values["frontend_stack"] = _parse_enum(FrontendStack, data.get("frontend_stack", FrontendStack.NONE))
+        for key in ("custom_folders", "backend_libraries", "frontend_libraries"):
+            values[key] = _strings(data.get(key, ()), key)
+        values["backends"] = _parse_members(data.get("backends", ()), BackendStack, "backends")
+        values["frontends"] = _parse_members(data.get("frontends", ()), FrontendStack, "frontends")
+        return cls(**values)
+
+    @property
+    def is_workspace(self) -> bool:
+        return bool(self.backends or self.frontends)
+
+    def create_builder(self, **builder_options: object) -> ProjectBuilder:
+        """Resolve the strategies for this spec and return a configured builder."""
+        architecture = StrategyFactory.create_architecture(
+            self.architecture, self.name, self.backend_stack, list(self.custom_folders)
+        )
+        schema = None
+        if self.schema:
+            if self.architecture != "hexagonal":
+                raise ValueError("A domain schema needs the hexagonal architecture")
+            from skelly.core.domain import load_schema
+
+            schema = load_schema(self.schema)
+        builder = ProjectBuilder(**builder_options)
+        builder.set_meta_data(self.name)\
+               .set_output_path(self.output_path)\
+               .set_frontend_stack(self.frontend_stack.value)\
+               .set_backend_stack(self.backend_stack.value)\
+               .set_architecture(architecture.get_name())\
+               .add_frontend_libraries(list(self.frontend_libraries))\
+               .add_backend_libraries(list(self.backend_libraries))\
+               .with_architecture_strategy(architecture)
+        if self.is_workspace:
+            self._add_members(builder, schema)
+            return builder
+        builder.with_backend_strategy(StrategyFactory.create_backend(self.backend_stack, self.name, schema))\
+               .with_frontend_strategy(StrategyFactory.create_frontend(self.frontend_stack))
+        return builder
+
+    def _add_members(self, builder: ProjectBuilder, schema: "DomainSchema | None") -> None:
+        """
+        Add the workspace members. Each backend gets strategies named after its directory,
+        so Java members get their own artifact and package. A frontend_stack without
+        frontend members becomes a member in frontend/.
+        """
+        for member in self.backends:
+            stack = member.stack or self.backend_stack
+            architecture = StrategyFactory.create_architecture(
+                self.architecture, member.directory, stack, list(self.custom_folders)
+            )
+            strategy = StrategyFactory.create_backend(stack, member.directory, schema)
+            libraries = list(member.libraries) if member.libraries is not None else None
+            builder.add_backend(member.directory, strategy, architecture, libraries)
+        frontends = self.frontends
+        if not frontends and self.frontend_stack != FrontendStack.NONE:
+            frontends = (MemberSpec("frontend"),)
+        for member in frontends:
+            strategy = StrategyFactory.create_frontend(member.stack or self.frontend_stack)
+            if strategy is None:
+                raise ValueError(f"Workspace frontend {member.directory!r} needs a frontend stack")
+            libraries = list(member.libraries) if member.libraries is not None else None
+            builder.add_frontend(member.directory, strategy, libraries)
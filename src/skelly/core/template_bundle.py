@@ -0,0 +1,141 @@
+import hashlib
+import json
+import mmap
+import os
+import struct
+from importlib import resources
+from pathlib import Path
+
+from jinja2 import BaseLoader, Environment, TemplateNotFound
+
+from skelly import __version__
+from skelly.core.template_cache import TEMPLATES_DIR
+
+MAGIC = b"SKLYTPL1"
+_HEADER = struct.Struct("<8sQ")
+
+BUNDLE_NAME = "templates.bundle"
+DEFAULT_BUNDLE = TEMPLATES_DIR.parent / BUNDLE_NAME
+
+
+def bundle_path() -> Path | None:
+    """The bundle to load: $SKELLY_TEMPLATE_BUNDLE, else templates.bundle in the package; None when disabled."""
+    override = os.environ.get("SKELLY_TEMPLATE_BUNDLE")
+    if override in ("0", "false", "no", "off"):
+        return None
+    return Path(override) if override else DEFAULT_BUNDLE
+
+
+def build_bundle(target: Path | None = None, templates_dir: Path = TEMPLATES_DIR) -> Path:
+    """
+    Pack every .j2 file under templates_dir into one bundle file.
+
+    Layout: magic, index length, a JSON index mapping template names to
+    (offset, length) in the data section plus the skelly version and a
+    checksum of the template contents, then the UTF-8 sources back to back.
+    """
+    target = Path(target) if target else DEFAULT_BUNDLE
+    entries = {}
+    chunks = []
+    offset = 0
+    digest = hashlib.sha256()
+    for path in sorted(templates_dir.rglob("*.j2")):
+        data = path.read_bytes()
+        name = path.relative_to(templates_dir).as_posix()
+        entries[name] = [offset, len(data)]
+        digest.update(f"{name}\0{len(data)}\0".encode())
+        digest.update(data)
+        chunks.append(data)
+        offset += len(data)
+    index = json.dumps(
+        {"version": __version__, "checksum": digest.hexdigest(), "templates": entries},
+        separators=(",", ":"),
+    ).encode("utf-8")
+
+    target.parent.mkdir(parents=True, exist_ok=True)
+    tmp = target.with_name(f"{target.name}.{os.getpid()}.tmp")
+    with open(tmp, "wb") as f:
+        f.write(_HEADER.pack(MAGIC, len(index)))
+        f.write(index)
+        f.writelines(chunks)
+    os.replace(tmp, target)
+    return target
+
+
+class BundleLoader(BaseLoader):
+    """
+    Jinja loader serving template sources from a bundle by offset.
+
+    The bundle is memory-mapped once, so a process opens a single file no
+    matter how many templates it renders. The bundle never changes while
+    mapped, so loaded templates are always up to date.
+    """
+
+    def __init__(self, data: bytes | mmap.mmap, origin: str):
+        if len(data) < _HEADER.size:
+            raise ValueError(f"Not a template bundle: {origin}")
+        magic, index_length = _HEADER.unpack_from(data, 0)
+        if magic != MAGIC:
+            raise ValueError(f"Not a template bundle: {origin}")
+        index = json.loads(bytes(data[_HEADER.size:_HEADER.size + index_length]))
+        self._data = data
+        self._base = _HEADER.size + index_length
+        self._templates: dict[str, list[int]] = index["templates"]
+        #: skelly version the bundle was built with; it is only used by that version.
+        self.version: str | None = index.get("version")
+        self.checksum: str = index["checksum"]
+        self.origin = origin
+
+    @classmethod
+    def open(cls, path: Path) -> "BundleLoader":
+        with open(path, "rb") as f:
+            # The mapping stays valid after the file is closed.
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return cls(data, str(path))
+
+    def get_source(self, environment: Environment, template: str):
+        entry = self._templates.get(template)
+        if entry is None:
+            raise TemplateNotFound(template)
+        offset, length = entry
+        start = self._base + offset
+        source = self._data[start:start + length].decode("utf-8")
+        return source, f"{self.origin}/{template}", lambda: True
+
+    def list_templates(self) -> list[str]:
+        return sorted(self._templates)
+
+
+def load_bundle(path: Path | None = None) -> BundleLoader | None:
+    """
+    The loader for a bundle, or None when there is none (or it is unreadable)
+    and the package loader should be used instead. A bundle inside a zipapp
+    cannot be mapped and is read into memory in one go.
+
+    Each bundle is opened at most once per process.
+    """
+    path = Path(path) if path else bundle_path()
+    if path is None:
+        return None
+    loader = _loaded.get(path)
+    if loader is None:
+        loader = _open(path)
+        if loader is not None:
+            _loaded[path] = loader
+    return loader
+
+
+_loaded: dict[Path, BundleLoader] = {}
+
+
+def _open(path: Path) -> BundleLoader | None:
+    try:
+        if path.is_file():
+            return BundleLoader.open(path)
+        if path == DEFAULT_BUNDLE:
+            resource = resources.files("skelly").joinpath(BUNDLE_NAME)
+            if resource.is_file():
+                return BundleLoader(resource.read_bytes(), f"skelly/{BUNDLE_NAME}")
+    except (OSError, ValueError, KeyError):
+        pass
+    return None
@@ -0,0 +1,78 @@
+import hashlib
+import os
+from pathlib import Path
+
+import jinja2
+from jinja2 import FileSystemBytecodeCache
+
+from skelly.core.paths import cache_root
+
+
+TEMPLATES_DIR = Path(__file__).resolve().parent.parent / "templates"
+TEMPLATE_EXTENSIONS = ["j2"]
+
+
+def cache_enabled() -> bool:
+    """Template caching can be switched off with SKELLY_TEMPLATE_CACHE=0."""
+    return os.environ.get("SKELLY_TEMPLATE_CACHE", "1") not in ("0", "false", "no", "off")
+
+
+def templates_checksum(templates_dir: Path = TEMPLATES_DIR) -> str:
+    """
+    Fingerprint of the packaged templates built from their paths, sizes and mtimes.
+    Only stats the files, so it is cheap enough to compute on every start-up.
+    """
+    digest = hashlib.sha256()
+    for root, dirs, files in os.walk(templates_dir):
+        dirs.sort()
+        for name in sorted(files):
+            if not name.endswith(".j2"):
+                continue
+            path = Path(root) / name
+            stat = path.stat()
+            rel = path.relative_to(templates_dir).as_posix()
+            digest.update(f"{rel}\0{stat.st_size}\0{stat.st_mtime_ns}\n".encode())
+    return digest.hexdigest()
+
+
+def compiled_templates_dir(checksum: str | None = None) -> Path:
+    """Location of the ahead-of-time compiled template modules for the current templates and Jinja version."""
+    checksum = checksum or templates_checksum()
+    return cache_root() / f"compiled-jinja{jinja2.__version__}-{checksum[:16]}"
+
+
+def bytecode_cache_dir() -> Path:
+    """Bytecode cache directory; Jinja validates each entry against its template's source checksum."""
+    return cache_root() / f"bytecode-jinja{jinja2.__version__}"
+
+
+class SafeBytecodeCache(FileSystemBytecodeCache):
+    """FileSystemBytecodeCache that never fails a render because the cache is not writable."""
+
+    def dump_bytecode(self, bucket) -> None:
+        try:
+            super().dump_bytecode(bucket)
+        except OSError:
+            pass
+
+
+def create_bytecode_cache() -> SafeBytecodeCache | None:
+    if not cache_enabled():
+        return None
+    directory = bytecode_cache_dir()
+    try:
+        directory.mkdir(parents=True, exist_ok=True)
+    except OSError:
+        return None
+    return SafeBytecodeCache(str(directory))
+
+
+def compile_templates(env: jinja2.Environment, target: Path | None = None) -> Path:
+    """
+    Compile every packaged template into importable Python modules.
+    Returns the target directory, which the renderer picks up via a ModuleLoader.
+    """
+    target = target or compiled_templates_dir()
+    target.mkdir(parents=True, exist_ok=True)
+    env.compile_templates(str(target), extensions=TEMPLATE_EXTENSIONS, zip=None, ignore_errors=False)
+    return target
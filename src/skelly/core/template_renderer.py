@@ -1,26 +1,131 @@
+from functools import lru_cache
 from pathlib import Path
+from typing import TYPE_CHECKING, Iterator
 
-from jinja2 import Environment, PackageLoader, select_autoescape
+if TYPE_CHECKING:
+    from jinja2 import BaseLoader, Environment
 
+# jinja2 is imported inside the functions below so that importing this
+# module (and everything that plans files) does not pay for it.
 
-_env = Environment(
-    loader=PackageLoader("skelly", "templates"),
-    autoescape=select_autoescape([]),
-    keep_trailing_newline=True,
-    trim_blocks=True,
-    lstrip_blocks=True,
-)
+#: Streamed output is encoded and written in blocks of this many rendering events
+#: (text segments and expression values), a few dozen KiB for typical templates.
+STREAM_BLOCK = 4096
+
+
+def _environment_options() -> dict:
+    from jinja2 import select_autoescape
+
+    return dict(
+        autoescape=select_autoescape([]),
+        keep_trailing_newline=True,
+        trim_blocks=True,
+        lstrip_blocks=True,
+    )
+
+
+def _package_loader() -> "BaseLoader":
+    """
+    The template bundle when one is installed (see `skelly bundle-templates`)
+    and was built by this version of skelly, otherwise the package loader
+    reading templates/ file by file.
+    """
+    from jinja2 import PackageLoader
+
+    from skelly import __version__
+    from skelly.core.template_bundle import load_bundle
+
+    bundle = load_bundle()
+    # Checking the version read from the bundle's header costs nothing; comparing it with the
+    # templates would mean visiting every file, which is what the bundle is there to avoid.
+    if bundle is not None and bundle.version == __version__:
+        return bundle
+    return PackageLoader("skelly", "templates")
+
+
+def create_environment(use_cache: bool = True) -> "Environment":
+    """
+    Create the Jinja2 environment for the packaged templates.
+
+    Templates are served from ahead-of-time compiled modules when
+    `skelly compile-templates` has been run for the current templates and
+    Jinja version; everything else goes through the template bundle or the
+    package loader, backed by an on-disk bytecode cache.
+    """
+    from jinja2 import ChoiceLoader, Environment, ModuleLoader
+
+    from skelly.core import template_cache
+
+    if not use_cache or not template_cache.cache_enabled():
+        return Environment(loader=_package_loader(), **_environment_options())
+
+    loader = _package_loader()
+    # A bundle carries the checksum of the templates it was built from.
+    compiled = template_cache.compiled_templates_dir(getattr(loader, "checksum", None))
+    if compiled.is_dir():
+        loader = ChoiceLoader([ModuleLoader(str(compiled)), loader])
+    return Environment(
+        loader=loader,
+        bytecode_cache=template_cache.create_bytecode_cache(),
+        **_environment_options(),
+    )
+
+
+@lru_cache(maxsize=None)
+def get_environment() -> "Environment":
+    """Return the process-wide environment, created on first use."""
+    return create_environment()
+
+
+def list_templates() -> list[str]:
+    return _package_loader().list_templates()
 
 
 def render_template(template_path: str, **context: object) -> str:
     """Render a Jinja2 template with the given context variables."""
-    template = _env.get_template(template_path)
+    template = get_environment().get_template(template_path)
     return template.render(**context)
 
 
+def stream_template(template_path: str, **context: object) -> Iterator[bytes]:
+    """
+    Render a Jinja2 template piece by piece.
+
+    Jinja's generate() events are joined into UTF-8 blocks of
+    STREAM_BLOCK events, so the whole output is never held in memory and
+    writes happen in reasonably sized blocks. Batching by event count keeps
+    the per-event work in C; sizing blocks by characters would cost a
+    Python-level step per event.
+    """
+    from itertools import islice
+
+    events = get_environment().get_template(template_path).generate(**context)
+    while batch := list(islice(events, STREAM_BLOCK)):
+        yield "".join(batch).encode()
+
+
 def render_to_file(template_path: str, output_path: Path, **context: object) -> None:
-    """Render a Jinja2 template and write the result to a file."""
-    content = render_template(template_path, **context)
+    """Render a Jinja2 template straight into a file, block by block."""
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(output_path, "w") as f:
-        f.write(content)
+    with open(output_path, "wb") as f:
+        for block in stream_template(template_path, **context):
+            f.write(block)
+
+
+def preload_templates() -> int:
+    """Compile every packaged template into the environment cache and return how many were loaded."""
+    env = get_environment()
+    names = [name for name in list_templates() if name.endswith(".j2")]
+    for name in names:
+        env.get_template(name)
+    return len(names)
+
+
+def compile_templates(target: Path | None = None) -> Path:
+    """Compile all packaged templates into Python modules (see template_cache.compile_templates)."""
+    from skelly.core import template_cache
+
+    env = create_environment(use_cache=False)
+    if target is None:
+        target = template_cache.compiled_templates_dir(getattr(env.loader, "checksum", None))
+    return template_cache.compile_templates(env, target)
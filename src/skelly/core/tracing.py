@@ -0,0 +1,98 @@
+import contextlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+
+_NULL_SPAN = contextlib.nullcontext()
+
+_active: "Tracer | None" = None
+
+
+class Tracer:
+    """
+    Collects timing spans as Chrome trace events.
+
+    Every span becomes a complete ("X") event on the track of the thread
+    it ran in, so spans from the PlanExecutor's pool show up side by side.
+    Work that interleaves on one thread, such as concurrent install
+    subprocesses driven by asyncio, can name its own track instead. The
+    result loads in chrome://tracing, Perfetto or speedscope.
+    """
+
+    def __init__(self):
+        self.events: list[dict] = []
+        self._origin = time.perf_counter_ns()
+        self._pid = os.getpid()
+        self._tracks: dict[tuple, int] = {}
+        self._lock = threading.Lock()
+
+    def _track_id(self, track: str | None) -> int:
+        """Small integer id of a named track or of the current thread, announced with a thread_name event."""
+        key = ("thread", threading.get_ident()) if track is None else ("track", track)
+        tid = self._tracks.get(key)
+        if tid is not None:
+            return tid
+        with self._lock:
+            if key not in self._tracks:
+                self._tracks[key] = len(self._tracks) + 1
+                self.events.append({
+                    "name": "thread_name",
+                    "ph": "M",
+                    "pid": self._pid,
+                    "tid": self._tracks[key],
+                    "args": {"name": track or threading.current_thread().name},
+                })
+            return self._tracks[key]
+
+    @contextlib.contextmanager
+    def span(self, name: str, category: str, track: str | None, args: dict):
+        tid = self._track_id(track)
+        start = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            end = time.perf_counter_ns()
+            event = {
+                "name": name,
+                "cat": category,
+                "ph": "X",
+                "ts": (start - self._origin) / 1000,
+                "dur": (end - start) / 1000,
+                "pid": self._pid,
+                "tid": tid,
+            }
+            if args:
+                event["args"] = args
+            self.events.append(event)
+
+    def spans(self, name: str | None = None) -> list[dict]:
+        """Recorded spans, optionally only those with the given name."""
+        return [event for event in self.events if event["ph"] == "X" and (name is None or event["name"] == name)]
+
+    def save(self, path: Path) -> Path:
+        path = Path(path)
+        data = {"traceEvents": self.events, "displayTimeUnit": "ms"}
+        path.write_text(json.dumps(data), encoding="utf-8")
+        return path
+
+
+def span(name: str, category: str = "build", track: str | None = None, **args: object):
+    """Time the enclosed block while tracing is active; a shared no-op context otherwise."""
+    tracer = _active
+    if tracer is None:
+        return _NULL_SPAN
+    return tracer.span(name, category, track, args)
+
+
+@contextlib.contextmanager
+def tracing(tracer: Tracer | None = None):
+    """Record spans into tracer (a new one by default) for the duration of the block."""
+    global _active
+    tracer = tracer if tracer is not None else Tracer()
+    previous, _active = _active, tracer
+    try:
+        yield tracer
+    finally:
+        _active = previous
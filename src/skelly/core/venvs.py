@@ -0,0 +1,193 @@
+import argparse
+import hashlib
+import json
+import os
+import re
+import shutil
+import sys
+import uuid
+from pathlib import Path
+
+from skelly.core.exceptions import DependencyInstallError
+from skelly.core.installer import DEFAULT_TIMEOUT, InstallRunner, InstallStep
+from skelly.core.paths import cache_root, link_or_copy
+
+PREFETCH_MARKER = ".skelly-prefetch.json"
+
+
+def requirement_name(requirement: str) -> str:
+    """Normalized distribution name of a requirement line, e.g. 'Django>=4.2' -> 'django'."""
+    match = re.match(r"\s*([A-Za-z0-9][A-Za-z0-9._-]*)", requirement)
+    if not match:
+        raise ValueError(f"Invalid requirement: {requirement}")
+    return re.sub(r"[-_.]+", "_", match.group(1)).lower()
+
+
+def requirements_key(requirements: list[str]) -> str:
+    """Key of an environment: the requirement set plus the interpreter it is built for."""
+    normalized = sorted({" ".join(line.split()).lower() for line in requirements if line.strip()})
+    data = json.dumps({
+        "requirements": normalized,
+        "python": f"{sys.implementation.name}-{sys.version_info[0]}.{sys.version_info[1]}",
+        "platform": sys.platform,
+    }, sort_keys=True)
+    return hashlib.sha256(data.encode("utf-8")).hexdigest()
+
+
+def bin_dir(venv: Path) -> Path:
+    return venv / ("Scripts" if os.name == "nt" else "bin")
+
+
+def venv_python(venv: Path) -> Path:
+    return bin_dir(venv) / ("python.exe" if os.name == "nt" else "python")
+
+
+def _rewrite(path: Path, old: bytes, new: bytes) -> None:
+    """Replace a (possibly hardlinked) file by a copy with old replaced by new."""
+    data = path.read_bytes()
+    if old not in data:
+        return
+    mode = path.stat().st_mode
+    path.unlink()
+    path.write_bytes(data.replace(old, new))
+    os.chmod(path, mode)
+
+
+def _relocate(venv: Path, old: Path, new: Path) -> None:
+    candidates = [venv / "pyvenv.cfg", *venv.rglob("*.pth")]
+    candidates += [path for path in bin_dir(venv).iterdir() if path.is_file() and not path.is_symlink()]
+    for path in candidates:
+        _rewrite(path, str(old).encode(), str(new).encode())
+
+
+def clone_venv(source: Path, target: Path) -> None:
+    """
+    Copy a virtual environment to another location.
+
+    Installed packages are hardlinked. Scripts, pyvenv.cfg and .pth files
+    contain the absolute path of the environment, so those are copied and
+    rewritten to point at the target.
+    """
+    source, target = Path(source).absolute(), Path(target).absolute()
+    shutil.copytree(source, target, symlinks=True, copy_function=link_or_copy)
+    _relocate(target, source, target)
+
+
+class VenvStore:
+    """Installed environments keyed by requirements_key(), cloned into projects with the same requirements."""
+
+    def __init__(self, path: Path | None = None):
+        self.path = Path(path) if path else cache_root() / "venvs"
+
+    def template(self, key: str) -> Path | None:
+        venv = self.path / key
+        return venv if (venv / "pyvenv.cfg").is_file() else None
+
+    def store(self, venv: Path, key: str) -> bool:
+        """Keep a copy of venv under key; returns False if one already exists or it could not be stored."""
+        if self.template(key) is not None:
+            return False
+        self.path.mkdir(parents=True, exist_ok=True)
+        staging = self.path / f".staging-{uuid.uuid4().hex}"
+        final = self.path / key
+        try:
+            clone_venv(venv, staging)
+            os.rename(staging, final)
+        except OSError:
+            shutil.rmtree(staging, ignore_errors=True)
+            return False
+        _relocate(final, staging.absolute(), final.absolute())
+        return True
+
+
+class Wheelhouse:
+    """
+    Shared directory of built wheels; project environments install from it without an index.
+    A marker file lists the requirements it was built for.
+    """
+
+    def __init__(self, path: Path | None = None):
+        self.path = Path(path) if path else cache_root() / "wheelhouse"
+
+    @classmethod
+    def from_env(cls) -> "Wheelhouse":
+        """The wheelhouse at $SKELLY_WHEELHOUSE, else wheelhouse in the cache root."""
+        override = os.environ.get("SKELLY_WHEELHOUSE")
+        return cls(Path(override) if override else None)
+
+    def prefetched(self) -> set[str]:
+        try:
+            data = json.loads((self.path / PREFETCH_MARKER).read_text(encoding="utf-8"))
+            return set(data["requirements"])
+        except (OSError, ValueError, KeyError):
+            return set()
+
+    def wheel_names(self) -> set[str]:
+        if not self.path.is_dir():
+            return set()
+        return {requirement_name(path.name.split("-")[0]) for path in self.path.glob("*.whl")}
+
+    def covers(self, requirements: list[str]) -> bool:
+        """Whether every requirement was built into the wheelhouse and its wheel is still there."""
+        prefetched = self.prefetched()
+        wheels = self.wheel_names()
+        return all(req in prefetched and requirement_name(req) in wheels for req in requirements)
+
+    def build(self, requirements: list[str], source: Path | None = None, timeout: float = DEFAULT_TIMEOUT) -> None:
+        """
+        Build wheels for requirements and their dependencies with `pip wheel`,
+        or copy prebuilt wheels from a source directory.
+        """
+        self.path.mkdir(parents=True, exist_ok=True)
+        if source is not None:
+            if not Path(source).is_dir():
+                raise DependencyInstallError(f"Wheel directory not found: {source}")
+            for wheel in Path(source).glob("*.whl"):
+                if not (self.path / wheel.name).exists():
+                    shutil.copy2(wheel, self.path / wheel.name)
+        else:
+            step = InstallStep(
+                label="wheelhouse",
+                cmd=(sys.executable, "-m", "pip", "wheel", "--wheel-dir", str(self.path), *requirements),
+                cwd=self.path,
+                ecosystem="pip",
+                success_msg="Wheels built!",
+                fail_msg="Building wheels failed. Is the package index reachable?",
+            )
+            [result] = InstallRunner(timeout=timeout).run([[step]])
+            if not result.ok:
+                raise DependencyInstallError(result.error or f"pip wheel exited with {result.returncode}")
+
+        wheels = self.wheel_names()
+        missing = [req for req in requirements if requirement_name(req) not in wheels]
+        if missing:
+            raise DependencyInstallError(f"No wheels for: {', '.join(missing)}")
+        marker = self.path / PREFETCH_MARKER
+        marker.write_text(json.dumps({"requirements": sorted(self.prefetched() | set(requirements))}, indent=2),
+                          encoding="utf-8")
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Entry point for the install steps: `python -m skelly.core.venvs clone|store ...`."""
+    parser = argparse.ArgumentParser(prog="python -m skelly.core.venvs")
+    commands = parser.add_subparsers(dest="command", required=True)
+    clone = commands.add_parser("clone")
+    clone.add_argument("source", type=Path)
+    clone.add_argument("target", type=Path)
+    store = commands.add_parser("store")
+    store.add_argument("venv", type=Path)
+    store.add_argument("key")
+    store.add_argument("--store", type=Path, default=None)
+    args = parser.parse_args(argv)
+
+    if args.command == "clone":
+        if args.target.exists():
+            shutil.rmtree(args.target)
+        clone_venv(args.source, args.target)
+        print(f"Cloned environment into {args.target}")
+    elif VenvStore(args.store).store(args.venv, args.key):
+        print("Stored environment for projects with the same requirements")
+
+
+if __name__ == "__main__":
+    main()
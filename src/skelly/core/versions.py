@@ -0,0 +1,138 @@
+import json
+import os
+import time
+import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+from urllib.parse import urlparse
+
+from skelly.core.exceptions import SkellyError
+from skelly.core.paths import cache_root
+
+INDEX_VERSION = 1
+LATEST = "latest"
+
+NPM = "npm"
+MAVEN = "maven"
+PYPI = "pypi"
+
+DEFAULT_REGISTRIES = {
+    NPM: "https://registry.npmjs.org",
+    MAVEN: "https://repo.maven.apache.org/maven2",
+    PYPI: "https://pypi.org/pypi",
+}
+
+
+def default_index_path() -> Path:
+    """The version snapshot: $SKELLY_VERSION_INDEX, else versions.json in the cache root."""
+    override = os.environ.get("SKELLY_VERSION_INDEX")
+    return Path(override) if override else cache_root() / "versions.json"
+
+
+class VersionIndex:
+    """
+    Snapshot of the newest version of every package skelly can add.
+
+    Package names are keyed per ecosystem (npm, maven as group:artifact,
+    pypi) in plain dicts, so pinning a package is a single lookup.
+    """
+
+    def __init__(self, versions: dict[str, dict[str, str]] | None = None, generated_at: float | None = None):
+        self.versions = {ecosystem: dict(names) for ecosystem, names in (versions or {}).items()}
+        self.generated_at = generated_at
+
+    @classmethod
+    def load(cls, path: Path | None = None) -> "VersionIndex":
+        """Read a snapshot; a missing or unreadable file gives an empty index."""
+        path = Path(path) if path else default_index_path()
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return cls()
+        if data.get("version") != INDEX_VERSION:
+            return cls()
+        return cls(data.get("packages", {}), data.get("generated_at"))
+
+    def save(self, path: Path | None = None) -> Path:
+        path = Path(path) if path else default_index_path()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        data = {"version": INDEX_VERSION, "generated_at": self.generated_at, "packages": self.versions}
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(data, indent=2, sort_keys=True), encoding="utf-8")
+        os.replace(tmp, path)
+        return path
+
+    def pin(self, ecosystem: str, name: str, default: str | None = LATEST) -> str | None:
+        """The snapshot version of a package, or default when it is not in the snapshot."""
+        return self.versions.get(ecosystem, {}).get(name, default)
+
+    def __len__(self) -> int:
+        return sum(len(names) for names in self.versions.values())
+
+
+@lru_cache(maxsize=None)
+def get_version_index() -> VersionIndex:
+    """The process-wide snapshot, loaded on first use."""
+    return VersionIndex.load()
+
+
+class Registry:
+    """
+    Reads package metadata from registries with the public URL layouts.
+    A base may be an http(s) URL or a local directory with the same layout,
+    e.g. <dir>/npm/<name>, <dir>/maven/<group path>/<artifact>/maven-metadata.xml
+    and <dir>/pypi/<name>/json.
+    """
+
+    def __init__(self, bases: dict[str, str] | None = None, timeout: float = 10.0):
+        self.bases = dict(DEFAULT_REGISTRIES if bases is None else bases)
+        self.timeout = timeout
+
+    @classmethod
+    def from_directory(cls, directory: Path) -> "Registry":
+        return cls({ecosystem: str(Path(directory) / ecosystem) for ecosystem in DEFAULT_REGISTRIES})
+
+    def _read(self, ecosystem: str, relative: str) -> bytes:
+        base = self.bases[ecosystem]
+        if urlparse(base).scheme in ("http", "https"):
+            from urllib.request import urlopen
+
+            with urlopen(f"{base.rstrip('/')}/{relative}", timeout=self.timeout) as response:
+                return response.read()
+        return (Path(base) / relative).read_bytes()
+
+    def latest(self, ecosystem: str, name: str) -> str | None:
+        """Newest release of a package, or None if the registry does not know it."""
+        try:
+            if ecosystem == NPM:
+                return json.loads(self._read(NPM, name))["dist-tags"]["latest"]
+            if ecosystem == PYPI:
+                return json.loads(self._read(PYPI, f"{name}/json"))["info"]["version"]
+            if ecosystem == MAVEN:
+                group_id, artifact_id = name.split(":")
+                relative = f"{group_id.replace('.', '/')}/{artifact_id}/maven-metadata.xml"
+                versioning = ET.fromstring(self._read(MAVEN, relative)).find("versioning")
+                release = versioning.findtext("release") or versioning.findtext("latest")
+                return release.strip() if release else None
+        except (OSError, ValueError, KeyError, AttributeError, ET.ParseError):
+            return None
+        raise ValueError(f"Unknown ecosystem: {ecosystem}")
+
+
+def refresh_index(packages: dict[str, list[str]], registry: Registry, workers: int = 16) -> tuple[VersionIndex, list[str]]:
+    """Look up the latest version of every package; returns the new index and the packages that were not found."""
+    lookups = [(ecosystem, name) for ecosystem, names in packages.items() for name in sorted(set(names))]
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        results = list(pool.map(lambda lookup: registry.latest(*lookup), lookups))
+
+    versions: dict[str, dict[str, str]] = {}
+    missing = []
+    for (ecosystem, name), version in zip(lookups, results):
+        if version is None:
+            missing.append(f"{ecosystem}:{name}")
+        else:
+            versions.setdefault(ecosystem, {})[name] = version
+    if not versions and lookups:
+        raise SkellyError("No package metadata could be fetched; is the registry reachable?")
+    return VersionIndex(versions, generated_at=time.time()), missing
@@ -0,0 +1,200 @@
+import json
+import re
+from dataclasses import dataclass, replace
+from pathlib import Path
+
+from skelly.core.events import Message, emit
+from skelly.core.exceptions import BuildError
+from skelly.core.installer import InstallStep
+from skelly.core.lockfiles import LOCKFILE, install_command
+from skelly.core.models import ProjectConfig
+from skelly.core.plan import BuildPlan
+from skelly.core.tracing import span
+from skelly.strategies.base import ArchitectureStrategy, BackendStrategy, FrontendStrategy
+
+# Where the strategies put their files in a single project; members move them to their own directory.
+BACKEND_DIR = "server"
+FRONTEND_DIR = "frontend"
+
+NPM = "npm"
+MAVEN = "maven"
+
+# Journal step of the files at the root; members get files:<directory>.
+WORKSPACE_STEP = "workspace"
+_MEMBER_DIRECTORY = re.compile(r"[A-Za-z0-9][A-Za-z0-9._-]*")
+
+
+@dataclass(frozen=True)
+class WorkspaceMember:
+    """
+    A backend or frontend project in its own directory of a workspace.
+    architecture and libraries default to the ones of the build.
+    """
+
+    directory: str
+    strategy: BackendStrategy | FrontendStrategy
+    architecture: ArchitectureStrategy | None = None
+    libraries: tuple[str, ...] | None = None
+
+    @property
+    def is_backend(self) -> bool:
+        return isinstance(self.strategy, BackendStrategy)
+
+    @property
+    def source(self) -> str:
+        """The directory the strategy writes to in a single project."""
+        return BACKEND_DIR if self.is_backend else FRONTEND_DIR
+
+    def folders(self, architecture: ArchitectureStrategy) -> list[str]:
+        folders = list(self.strategy.get_folders())
+        if self.is_backend:
+            folders.extend((self.architecture or architecture).get_folders())
+        return folders
+
+    def config(self, config: ProjectConfig) -> ProjectConfig:
+        """
+        The build's config as this member sees it: named after its directory (package names
+        must be unique within a workspace), with its own libraries if it has any.
+        """
+        name = config.name if self.directory == self.source else f"{config.name}-{self.directory}"
+        member = replace(config, name=name)
+        if self.libraries is None:
+            return member
+        if self.is_backend:
+            return replace(member, backend_libraries=self.libraries)
+        return replace(member, frontend_libraries=self.libraries)
+
+    def ignore_patterns(self) -> list[str]:
+        prefix = f"/{self.source}/"
+        return [
+            f"/{self.directory}/{pattern[len(prefix):]}" if pattern.startswith(prefix) else pattern
+            for pattern in self.strategy.get_ignore_patterns()
+        ]
+
+
+class Workspace:
+    """
+    Several backend and frontend projects under one root that share their dependency installs.
+
+    Every member is planned like a single project and then moved into its
+    own directory. npm members become npm workspaces of a root
+    package.json, Maven members modules of a root aggregator pom.xml, so a
+    single `npm install` and a single `mvn install` at the root resolve the
+    dependencies of all members at once. Other stacks (Django) cannot be
+    members.
+    """
+
+    def __init__(self, members: list[WorkspaceMember]):
+        directories = [member.directory for member in members]
+        duplicates = sorted({d for d in directories if directories.count(d) > 1})
+        if duplicates:
+            raise BuildError(f"Workspace directories must be unique: {', '.join(duplicates)}")
+        self.members = members
+        #: Member directories per ecosystem, known once the workspace is planned.
+        self.ecosystems: dict[str, list[str]] = {}
+
+    def folders(self, architecture: ArchitectureStrategy) -> list[str]:
+        """The folders of all members, in their directories."""
+        folders = []
+        for member in self.members:
+            plan = BuildPlan().add_folders(member.folders(architecture))
+            folders.extend(plan.relocated(member.source, member.directory).folders)
+        return folders
+
+    def plan(self, config: ProjectConfig, architecture: ArchitectureStrategy) -> list[tuple[str, BuildPlan]]:
+        """Journal steps: one per member, then the shared files at the root."""
+        steps = []
+        npm, maven = [], []
+        for member in self.members:
+            emit(Message(f"\nSetting up {member.strategy.get_name()} in {member.directory}/...", "bold"))
+            plan = BuildPlan().add_folders(member.folders(architecture))
+            with span("create_config_files", "strategy", strategy=member.strategy.get_name(), member=member.directory):
+                member.strategy.create_config_files(member.config(config), plan)
+            plan = plan.relocated(member.source, member.directory)
+            if plan.get_file(f"{member.directory}/package.json"):
+                # npm keeps a single lockfile for the whole workspace at the root.
+                plan.remove_file(f"{member.directory}/{LOCKFILE}")
+                npm.append(member.directory)
+            elif plan.get_file(f"{member.directory}/pom.xml"):
+                maven.append(member.directory)
+            else:
+                raise BuildError(f"{member.strategy.get_name()} cannot be part of a workspace; "
+                                 "only npm and Maven projects can share their installs")
+            steps.append((f"files:{member.directory}", plan))
+
+        root = BuildPlan()
+        if npm:
+            package = {
+                "name": config.name.lower().replace(" ", "-"),
+                "version": "0.1.0",
+                "private": True,
+                "description": "Generated by Skelly",
+                "workspaces": npm,
+            }
+            root.add_file("package.json", json.dumps(package, indent=2))
+            emit(Message(f"Created package.json with npm workspaces: {', '.join(npm)}", "cyan"))
+        if maven:
+            root.add_template(
+                "pom.xml", "java_spring/aggregator_pom.xml.j2",
+                project_name=config.name.lower().replace(" ", ""), modules=maven,
+            )
+            emit(Message(f"Created pom.xml with Maven modules: {', '.join(maven)}", "cyan"))
+        self.ecosystems = {ecosystem: members for ecosystem, members in ((NPM, npm), (MAVEN, maven)) if members}
+        steps.append((f"files:{WORKSPACE_STEP}", root))
+        return steps
+
+    def ignore_patterns(self) -> list[str]:
+        patterns = ["/node_modules/"] if NPM in self.ecosystems else []
+        for member in self.members:
+            patterns.extend(member.ignore_patterns())
+        return patterns
+
+    def _maven_args(self, config: ProjectConfig) -> tuple[str, ...]:
+        """
+        mvn options for the root build: offline only when every module's libraries
+        were prefetched, since the modules share one repository.
+        """
+        args = [
+            member.strategy.maven_args(member.config(config).backend_libraries)
+            for member in self.members if member.directory in self.ecosystems[MAVEN]
+        ]
+        return args[0] if all(args) else ()
+
+    def install_steps(self, base_path: Path, config: ProjectConfig) -> list[list[InstallStep]]:
+        """One install per ecosystem at the workspace root; they run concurrently."""
+        sequences = []
+        if NPM in self.ecosystems:
+            sequences.append([InstallStep(
+                label="workspace",
+                cmd=install_command(base_path),
+                cwd=base_path,
+                ecosystem="npm",
+                success_msg="Workspace npm dependencies installed!",
+                fail_msg="Failed to install the workspace dependencies. Do you have 'npm' installed?",
+                members=tuple(self.ecosystems[NPM]),
+            )])
+        if MAVEN in self.ecosystems:
+            sequences.append([InstallStep(
+                label="modules",
+                cmd=("mvn", *self._maven_args(config), "install", "-DskipTests"),
+                cwd=base_path,
+                ecosystem="maven",
+                success_msg="Maven modules built!",
+                fail_msg="Maven build failed. Is 'mvn' installed and in PATH?",
+                members=tuple(self.ecosystems[MAVEN]),
+            )])
+        return sequences
+
+
+def member_directory(directory: str) -> str:
+    """
+    Validate a member directory: a single directory below the workspace root.
+    Its name becomes part of npm package names and Maven artifactIds, which allow no '/'.
+    """
+    if not isinstance(directory, str) or not _MEMBER_DIRECTORY.fullmatch(directory.rstrip("/")):
+        raise ValueError(f"Invalid workspace directory: {directory!r}. Use a single directory name "
+                         "of letters, digits, '.', '_' and '-'")
+    path = directory.rstrip("/")
+    if path == WORKSPACE_STEP:
+        raise ValueError(f"Invalid workspace directory: {directory!r} is reserved for the workspace root")
+    return path
@@ -1,40 +1,55 @@
-from questionary import Choice
+from typing import TYPE_CHECKING
 
 from skelly.core.models import BackendStack
 
+if TYPE_CHECKING:
+    from questionary import Choice
+
 
 class BackendFactory:
     """
     Liefert Choice-Objekte fuer Questionary zurueck.
     Title = Was der User sieht
     Value = Was im Code ankommt (der echte Paketname)
+
+    Die Choice-Objekte werden erst beim Abruf erzeugt, damit questionary
+    nicht schon beim Import geladen wird.
     """
 
     _AVAILABLE_LIBRARIES = {
         BackendStack.JAVA: [
-            Choice(title="Lombok (Boilerplate reduction)", value="lombok"),
-            Choice(title="Spring Security (Auth)", value="spring-boot-starter-security"),
-            Choice(title="Spring Data JPA (Database)", value="spring-boot-starter-data-jpa"),
-            Choice(title="Spring Boot Actuator (Monitoring)", value="spring-boot-starter-actuator"),
-            Choice(title="MapStruct (Mapper)", value="mapstruct"),
+            ("Lombok (Boilerplate reduction)", "lombok"),
+            ("Spring Security (Auth)", "spring-boot-starter-security"),
+            ("Spring Data JPA (Database)", "spring-boot-starter-data-jpa"),
+            ("Spring Boot Actuator (Monitoring)", "spring-boot-starter-actuator"),
+            ("MapStruct (Mapper)", "mapstruct"),
         ],
         BackendStack.EXPRESS: [
-            Choice(title="Helmet (Security Headers)", value="helmet"),
-            Choice(title="Morgan (Logging)", value="morgan"),
-            Choice(title="Cors (Cross-Origin Resource Sharing)", value="cors"),
-            Choice(title="Dotenv (Environment Variables)", value="dotenv"),
-            Choice(title="Joi (Validation)", value="joi"),
-            Choice(title="Zod (Validation)", value="zod"),
-            Choice(title="Mongoose (MongoDB ODM)", value="mongoose"),
+            ("Helmet (Security Headers)", "helmet"),
+            ("Morgan (Logging)", "morgan"),
+            ("Cors (Cross-Origin Resource Sharing)", "cors"),
+            ("Dotenv (Environment Variables)", "dotenv"),
+            ("Joi (Validation)", "joi"),
+            ("Zod (Validation)", "zod"),
+            ("Mongoose (MongoDB ODM)", "mongoose"),
         ],
         BackendStack.DJANGO: [
-            Choice(title="Django REST Framework (API)", value="djangorestframework"),
-            Choice(title="Django CORS Headers", value="django-cors-headers"),
-            Choice(title="Django Debug Toolbar", value="django-debug-toolbar"),
-            Choice(title="Celery (Async Tasks)", value="celery"),
+            ("Django REST Framework (API)", "djangorestframework"),
+            ("Django CORS Headers", "django-cors-headers"),
+            ("Django Debug Toolbar", "django-debug-toolbar"),
+            ("Celery (Async Tasks)", "celery"),
         ],
     }
 
     @staticmethod
-    def get_supported_libraries(stack: BackendStack) -> list[Choice]:
-        return BackendFactory._AVAILABLE_LIBRARIES.get(stack, [])
+    def get_supported_libraries(stack: BackendStack) -> list["Choice"]:
+        from questionary import Choice
+
+        return [
+            Choice(title=title, value=value)
+            for title, value in BackendFactory._AVAILABLE_LIBRARIES.get(stack, [])
+        ]
+
+    @staticmethod
+    def get_library_names(stack: BackendStack) -> list[str]:
+        return [value for _, value in BackendFactory._AVAILABLE_LIBRARIES.get(stack, [])]
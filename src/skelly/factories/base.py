@@ -1,24 +1,24 @@
+from importlib import import_module
+from typing import TYPE_CHECKING
+
 from skelly.core.models import Architecture, BackendStack, FrontendStack
 from skelly.strategies.base import ArchitectureStrategy, BackendStrategy, FrontendStrategy
-from skelly.strategies.architecture import (
-    HexagonalArchitecture,
-    LayeredArchitecture,
-    CustomArchitecture,
-)
-from skelly.strategies.backend import (
-    JavaSpringBackend,
-    ExpressBackend,
-    DjangoBackend,
-)
-from skelly.strategies.frontend import (
-    ReactFrontend,
-    LitFrontend,
-    AngularFrontend,
-)
+
+if TYPE_CHECKING:
+    from skelly.core.domain import DomainSchema
+
+
+def _load(path: str) -> type:
+    """Import a strategy class from a 'module:Class' path on first use."""
+    module, _, name = path.partition(":")
+    return getattr(import_module(module), name)
 
 
 class StrategyFactory:
-    """Creates strategy instances based on user selections."""
+    """
+    Creates strategy instances based on user selections.
+    Strategy modules are imported lazily, only for the stacks that are selected.
+    """
 
     @staticmethod
     def create_architecture(
@@ -28,24 +28,28 @@ class StrategyFactory:
         custom_folders: list[str] | None = None,
     ) -> ArchitectureStrategy:
         if choice == "custom":
-            return CustomArchitecture(custom_folders or [])
+            return _load("skelly.strategies.architecture.custom:CustomArchitecture")(custom_folders or [])
         if choice == "hexagonal":
             base_package = "java" if backend_stack == BackendStack.JAVA else "src"
-            return HexagonalArchitecture(project_name, base_package)
+            return _load("skelly.strategies.architecture.hexagonal:HexagonalArchitecture")(project_name, base_package)
         if choice == "layered":
-            return LayeredArchitecture()
+            return _load("skelly.strategies.architecture.layered:LayeredArchitecture")()
         raise ValueError(f"Unknown architecture choice: {choice}")
 
     @staticmethod
-    def create_backend(stack: BackendStack, project_name: str) -> BackendStrategy:
+    def create_backend(stack: BackendStack, project_name: str, schema: "DomainSchema | None" = None) -> BackendStrategy:
         backends = {
-            BackendStack.JAVA: lambda: JavaSpringBackend(project_name),
-            BackendStack.EXPRESS: lambda: ExpressBackend(),
-            BackendStack.DJANGO: lambda: DjangoBackend(),
+            BackendStack.JAVA: lambda: _load("skelly.strategies.backend.java_spring:JavaSpringBackend")(
+                project_name, schema=schema
+            ),
+            BackendStack.EXPRESS: lambda: _load("skelly.strategies.backend.express:ExpressBackend")(schema=schema),
+            BackendStack.DJANGO: lambda: _load("skelly.strategies.backend.django:DjangoBackend")(),
         }
         factory = backends.get(stack)
         if not factory:
             raise ValueError(f"Unknown backend stack: {stack}")
+        if schema is not None and stack == BackendStack.DJANGO:
+            raise ValueError(f"Domain schemas are not supported for {stack.value}")
         return factory()
 
     @staticmethod
@@ -53,11 +57,11 @@ class StrategyFactory:
         if stack == FrontendStack.NONE:
             return None
         frontends = {
-            FrontendStack.REACT: ReactFrontend,
-            FrontendStack.LIT: LitFrontend,
-            FrontendStack.ANGULAR: AngularFrontend,
+            FrontendStack.REACT: "skelly.strategies.frontend.react:ReactFrontend",
+            FrontendStack.LIT: "skelly.strategies.frontend.lit:LitFrontend",
+            FrontendStack.ANGULAR: "skelly.strategies.frontend.angular:AngularFrontend",
         }
-        cls = frontends.get(stack)
-        if not cls:
+        path = frontends.get(stack)
+        if not path:
             raise ValueError(f"Unknown frontend stack: {stack}")
-        return cls()
+        return _load(path)()
@@ -1,31 +1,46 @@
-from questionary import Choice
+from typing import TYPE_CHECKING
 
 from skelly.core.models import FrontendStack
 
+if TYPE_CHECKING:
+    from questionary import Choice
+
 
 class FrontendFactory:
     """
     Liefert Choice-Objekte fuer Questionary zurueck.
     Title = Was der User sieht
     Value = Was im Code ankommt (der echte Paketname)
+
+    Die Choice-Objekte werden erst beim Abruf erzeugt, damit questionary
+    nicht schon beim Import geladen wird.
     """
 
     _AVAILABLE_LIBRARIES = {
         FrontendStack.REACT: [
-            Choice(title="Redux Toolkit", value="@reduxjs/toolkit react-redux"),
-            Choice(title="React Router", value="react-router-dom"),
-            Choice(title="TanStack Query", value="@tanstack/react-query"),
-            Choice(title="Tailwind CSS", value="tailwindcss postcss autoprefixer"),
-            Choice(title="Material UI", value="@mui/material @emotion/react @emotion/styled"),
+            ("Redux Toolkit", "@reduxjs/toolkit react-redux"),
+            ("React Router", "react-router-dom"),
+            ("TanStack Query", "@tanstack/react-query"),
+            ("Tailwind CSS", "tailwindcss postcss autoprefixer"),
+            ("Material UI", "@mui/material @emotion/react @emotion/styled"),
         ],
         FrontendStack.LIT: [
-            Choice(title="Lit Router", value="@lit-labs/router"),
+            ("Lit Router", "@lit-labs/router"),
         ],
         FrontendStack.ANGULAR: [
-            Choice(title="Angular Material", value="@angular/material"),
+            ("Angular Material", "@angular/material"),
         ],
     }
 
     @staticmethod
-    def get_supported_libraries(stack: FrontendStack) -> list[Choice]:
-        return FrontendFactory._AVAILABLE_LIBRARIES.get(stack, [])
+    def get_supported_libraries(stack: FrontendStack) -> list["Choice"]:
+        from questionary import Choice
+
+        return [
+            Choice(title=title, value=value)
+            for title, value in FrontendFactory._AVAILABLE_LIBRARIES.get(stack, [])
+        ]
+
+    @staticmethod
+    def get_library_names(stack: FrontendStack) -> list[str]:
+        return [value for _, value in FrontendFactory._AVAILABLE_LIBRARIES.get(stack, [])]
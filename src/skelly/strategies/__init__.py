@@ -1,23 +1,31 @@
-from .base import ArchitectureStrategy, BackendStrategy, FrontendStrategy
-from .architecture import HexagonalArchitecture, LayeredArchitecture, CustomArchitecture
-from .backend import JavaSpringBackend, ExpressBackend, DjangoBackend
-from .frontend import ReactFrontend, LitFrontend, AngularFrontend
+from importlib import import_module
 
-__all__ = [
+# Strategy classes are imported on first access so that importing
+# skelly.strategies stays cheap; only the selected stacks get loaded.
+_EXPORTS = {
     # Base classes
-    "ArchitectureStrategy",
-    "BackendStrategy",
-    "FrontendStrategy",
+    "ArchitectureStrategy": "skelly.strategies.base",
+    "BackendStrategy": "skelly.strategies.base",
+    "FrontendStrategy": "skelly.strategies.base",
     # Architecture strategies
-    "HexagonalArchitecture",
-    "LayeredArchitecture",
-    "CustomArchitecture",
+    "HexagonalArchitecture": "skelly.strategies.architecture.hexagonal",
+    "LayeredArchitecture": "skelly.strategies.architecture.layered",
+    "CustomArchitecture": "skelly.strategies.architecture.custom",
     # Backend strategies
-    "JavaSpringBackend",
-    "ExpressBackend",
-    "DjangoBackend",
+    "JavaSpringBackend": "skelly.strategies.backend.java_spring",
+    "ExpressBackend": "skelly.strategies.backend.express",
+    "DjangoBackend": "skelly.strategies.backend.django",
     # Frontend strategies
-    "ReactFrontend",
-    "LitFrontend",
-    "AngularFrontend",
-]
+    "ReactFrontend": "skelly.strategies.frontend.react",
+    "LitFrontend": "skelly.strategies.frontend.lit",
+    "AngularFrontend": "skelly.strategies.frontend.angular",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(import_module(module), name)
@@ -1,5 +1,16 @@
-from .hexagonal import HexagonalArchitecture
-from .layered import LayeredArchitecture
-from .custom import CustomArchitecture
+from importlib import import_module
 
-__all__ = ["HexagonalArchitecture", "LayeredArchitecture", "CustomArchitecture"]
+_EXPORTS = {
+    "HexagonalArchitecture": ".hexagonal",
+    "LayeredArchitecture": ".layered",
+    "CustomArchitecture": ".custom",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(import_module(module, __name__), name)
@@ -1,3 +1,4 @@
+from skelly.core.pathset import MAX_PATHS, PathSet, count_braces, expand_braces
 from skelly.strategies.base import ArchitectureStrategy
 
 
@@ -5,10 +6,21 @@ class CustomArchitecture(ArchitectureStrategy):
     """
     Custom user-defined folder structure.
     Allows full flexibility while still benefiting from backend/frontend strategies.
+
+    Folders may use brace expansion ('services/{a,b}/src'). They are
+    normalized and deduplicated in a PathSet, and only leaf folders are
+    kept because creating them creates their parents. Absolute paths,
+    paths with '..' and folders that expand to more than MAX_PATHS paths
+    in total raise ValueError.
     """
 
     def __init__(self, folders: list[str]):
-        self.custom_folders = folders
+        if sum(count_braces(folder) for folder in folders) > MAX_PATHS:
+            raise ValueError(f"Custom folders expand to more than {MAX_PATHS} paths")
+        self.paths = PathSet()
+        for folder in folders:
+            self.paths.update(expand_braces(folder))
+        self.custom_folders = self.paths.leaves()
 
     def get_folders(self) -> list[str]:
         return self.custom_folders
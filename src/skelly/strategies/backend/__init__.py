@@ -1,5 +1,16 @@
-from .java_spring import JavaSpringBackend
-from .express import ExpressBackend
-from .django import DjangoBackend
+from importlib import import_module
 
-__all__ = ["JavaSpringBackend", "ExpressBackend", "DjangoBackend"]
+_EXPORTS = {
+    "JavaSpringBackend": ".java_spring",
+    "ExpressBackend": ".express",
+    "DjangoBackend": ".django",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(import_module(module, __name__), name)
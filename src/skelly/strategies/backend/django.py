@@ -1,11 +1,31 @@
+import sys
 from pathlib import Path
 
 from skelly.strategies.base import BackendStrategy
+from skelly.core.events import Message, emit
+from skelly.core.installer import InstallStep
 from skelly.core.models import ProjectConfig
+from skelly.core.plan import BuildPlan
+from skelly.core.versions import PYPI, VersionIndex, get_version_index
+from skelly.core.venvs import VenvStore, Wheelhouse, requirements_key, venv_python
 
 
 class DjangoBackend(BackendStrategy):
-    """Django backend with pip."""
+    """Django backend with pip, installed into a per-project virtualenv at server/.venv."""
+
+    # Package name and the specifier used when the version snapshot does not know it.
+    BASE_REQUIREMENTS = (("django", ">=4.2"),)
+    VENV_DIR = ".venv"
+
+    def __init__(
+        self,
+        wheelhouse: Wheelhouse | None = None,
+        venv_store: VenvStore | None = None,
+        versions: VersionIndex | None = None,
+    ):
+        self.wheelhouse = wheelhouse or Wheelhouse.from_env()
+        self.venv_store = venv_store or VenvStore()
+        self.versions = versions if versions is not None else get_version_index()
 
     def get_folders(self) -> list[str]:
         return []
@@ -13,23 +33,75 @@ class DjangoBackend(BackendStrategy):
     def get_name(self) -> str:
         return "Django"
 
-    def create_config_files(self, config: ProjectConfig, base_path: Path) -> None:
-        server_path = base_path / "server"
-        requirements = ["django>=4.2"]
-        requirements.extend(config.backend_libraries)
+    def get_ignore_patterns(self) -> list[str]:
+        return [f"/server/{self.VENV_DIR}/", "__pycache__/", "*.pyc", "/server/db.sqlite3", "/server/.env"]
+
+    def _pin(self, name: str, fallback: str = "") -> str:
+        version = self.versions.pin(PYPI, name, default=None)
+        return f"{name}=={version}" if version else f"{name}{fallback}"
+
+    def requirements(self, libraries: list[str]) -> list[str]:
+        """requirements.txt lines, pinned to the version snapshot where possible."""
+        base = [self._pin(name, fallback) for name, fallback in self.BASE_REQUIREMENTS]
+        return [*base, *(self._pin(lib) for lib in libraries)]
 
-        req_path = server_path / "requirements.txt"
-        with open(req_path, "w") as f:
-            f.write("\n".join(requirements))
+    def create_config_files(self, config: ProjectConfig, plan: BuildPlan) -> None:
+        requirements = self.requirements(list(config.backend_libraries))
 
-        print(f"[cyan]Created server/requirements.txt with: {', '.join(requirements)}[/cyan]")
+        plan.add_file("server/requirements.txt", "\n".join(requirements))
 
-    def install_dependencies(self, base_path: Path) -> None:
+        emit(Message(f"Created server/requirements.txt with: {', '.join(requirements)}", "cyan"))
+
+    def prefetch(self, libraries: list[str], source: Path | None = None) -> list[str]:
+        """Build wheels for Django and the given libraries into the shared wheelhouse."""
+        requirements = self.requirements(libraries)
+        self.wheelhouse.build(requirements, source=source)
+        return requirements
+
+    def get_install_steps(self, base_path: Path, libraries: tuple[str, ...] = ()) -> list[InstallStep]:
         server_path = base_path / "server"
-        print("[yellow]Installing server dependencies via pip...[/yellow]")
-        self._run_command(
-            ["pip", "install", "-r", "requirements.txt"],
-            cwd=server_path,
-            success_msg="Django dependencies installed!",
-            fail_msg="Failed to install dependencies. Is 'pip' installed?",
-        )
+        venv = server_path / self.VENV_DIR
+        requirements = self.requirements(list(libraries))
+        key = requirements_key(requirements)
+
+        def step(cmd: tuple[str, ...], success_msg: str, fail_msg: str) -> InstallStep:
+            return InstallStep(
+                label="server",
+                cmd=cmd,
+                cwd=server_path,
+                ecosystem="pip",
+                success_msg=success_msg,
+                fail_msg=fail_msg,
+            )
+
+        template = self.venv_store.template(key)
+        if template is not None:
+            # Same requirements were installed before: clone that environment.
+            return [step(
+                (sys.executable, "-m", "skelly.core.venvs", "clone", str(template), self.VENV_DIR),
+                "Django dependencies installed (cloned environment)!",
+                "Failed to clone the Django environment.",
+            )]
+
+        pip_args: tuple[str, ...] = ()
+        if self.wheelhouse.covers(requirements):
+            pip_args = ("--no-index", "--find-links", str(self.wheelhouse.path))
+        python = str(venv_python(venv.absolute()))
+        return [
+            step(
+                (sys.executable, "-m", "venv", self.VENV_DIR),
+                "Created server/.venv",
+                "Failed to create the virtual environment.",
+            ),
+            step(
+                (python, "-m", "pip", "install", "--disable-pip-version-check", *pip_args, "-r", "requirements.txt"),
+                "Django dependencies installed!",
+                "Failed to install dependencies into server/.venv.",
+            ),
+            step(
+                (sys.executable, "-m", "skelly.core.venvs", "store", self.VENV_DIR, key,
+                 "--store", str(self.venv_store.path)),
+                "Saved the environment for projects with the same requirements.",
+                "Could not save the environment for reuse.",
+            ),
+        ]
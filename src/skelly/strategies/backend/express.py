@@ -1,9 +1,16 @@
-import json
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from skelly.strategies.base import BackendStrategy
+from skelly.core.events import Message, emit
+from skelly.core.installer import InstallStep
+from skelly.core.lockfiles import LockfileStore, add_package_json, install_command
 from skelly.core.models import Architecture, ProjectConfig
-from skelly.core.template_renderer import render_to_file
+from skelly.core.plan import BuildPlan
+from skelly.core.versions import NPM, VersionIndex, get_version_index
+
+if TYPE_CHECKING:
+    from skelly.core.domain import DomainSchema
 
 
 # Template → output path mapping for hexagonal architecture
@@ -32,25 +39,49 @@ _HEXAGONAL_TEMPLATES = [
     ("express/hexagonal/config_index.js.j2", "src/infrastructure/config/index.js"),
 ]
 
+# Per-entity templates of a domain schema: template, folder, module and the symbol the
+# folder's index.js exports from it ({name} is the entity name).
+_ENTITY_TEMPLATES = [
+    ("Entity.js.j2", "src/domain/model", "{name}.js", "{name}"),
+    ("GetUseCase.js.j2", "src/application/port/in", "Get{name}UseCase.js", "Get{name}UseCase"),
+    ("CreateUseCase.js.j2", "src/application/port/in", "Create{name}UseCase.js", "Create{name}UseCase"),
+    ("Repository.js.j2", "src/application/port/out", "{name}Repository.js", "{name}RepositoryPort"),
+    ("Service.js.j2", "src/application/service", "{name}Service.js", "{name}Service"),
+    ("Controller.js.j2", "src/adapter/in/web", "{name}Controller.js", "create{name}Controller"),
+    ("PersistenceAdapter.js.j2", "src/adapter/out/persistence", "{name}PersistenceAdapter.js", "{name}PersistenceAdapter"),
+]
+
 
 class ExpressBackend(BackendStrategy):
     """Express.js backend with npm."""
 
+    def __init__(
+        self,
+        versions: VersionIndex | None = None,
+        lockfiles: LockfileStore | None = None,
+        schema: "DomainSchema | None" = None,
+    ):
+        self.versions = versions if versions is not None else get_version_index()
+        self.lockfiles = lockfiles if lockfiles is not None else LockfileStore.from_env()
+        self.schema = schema
+
     def get_folders(self) -> list[str]:
         return []
 
     def get_name(self) -> str:
         return "Express.js"
 
-    def create_config_files(self, config: ProjectConfig, base_path: Path) -> None:
-        server_path = base_path / "server"
+    def get_ignore_patterns(self) -> list[str]:
+        return ["/server/node_modules/", "/server/.env"]
+
+    def create_config_files(self, config: ProjectConfig, plan: BuildPlan) -> None:
         dependencies = {"express": "^4.18.2"}
 
         for lib_entry in config.backend_libraries:
             libs = lib_entry.split(" ")
             for lib in libs:
                 if lib.strip():
-                    dependencies[lib.strip()] = "latest"
+                    dependencies[lib.strip()] = self.versions.pin(NPM, lib.strip())
 
         package_json = {
             "name": f"{config.name.lower().replace(' ', '-')}-server",
@@ -65,36 +96,58 @@ class ExpressBackend(BackendStrategy):
             "dependencies": dependencies,
         }
 
-        package_json_path = server_path / "package.json"
-        with open(package_json_path, "w") as f:
-            json.dump(package_json, f, indent=2)
+        add_package_json(plan, "server", package_json, self.lockfiles)
 
-        print(f"[cyan]Created server/package.json with dependencies: {', '.join(dependencies.keys())}[/cyan]")
+        emit(Message(f"Created server/package.json with dependencies: {', '.join(dependencies.keys())}", "cyan"))
 
         if config.architecture == Architecture.HEXAGONAL.value:
-            self._generate_hexagonal_example(base_path)
+            if self.schema is not None:
+                self._generate_hexagonal_entities(plan)
+            else:
+                self._generate_hexagonal_example(plan)
 
-    def _generate_hexagonal_example(self, base_path: Path) -> None:
+    def _generate_hexagonal_example(self, plan: BuildPlan) -> None:
         """Generate example code with domain/application/adapter structure."""
-        server_path = base_path / "server"
-
-        print("[cyan]Generating hexagonal architecture example (domain/application/adapter)...[/cyan]")
+        emit(Message("Generating hexagonal architecture example (domain/application/adapter)...", "cyan"))
 
         for template_path, output_rel in _HEXAGONAL_TEMPLATES:
-            render_to_file(template_path, server_path / output_rel)
-
-        print("[green]Generated hexagonal architecture example with Example entity![/green]")
-        print("[dim]  - Domain: Example entity[/dim]")
-        print("[dim]  - Ports: GetExampleUseCase, CreateExampleUseCase, ExampleRepository[/dim]")
-        print("[dim]  - Adapters: ExampleController, ExamplePersistenceAdapter[/dim]")
-        print("[dim]  - Entry: src/index.js with dependency injection[/dim]")
-
-    def install_dependencies(self, base_path: Path) -> None:
-        server_path = base_path / "server"
-        print("[yellow]Running npm install for server...[/yellow]")
-        self._run_command(
-            ["npm", "install"],
-            cwd=server_path,
-            success_msg="Server dependencies installed successfully!",
-            fail_msg="Failed to install dependencies. Do you have 'npm' installed?",
-        )
+            plan.add_template(f"server/{output_rel}", template_path)
+
+        emit(Message("Generated hexagonal architecture example with Example entity!", "green"))
+        emit(Message("  - Domain: Example entity", "dim"))
+        emit(Message("  - Ports: GetExampleUseCase, CreateExampleUseCase, ExampleRepository", "dim"))
+        emit(Message("  - Adapters: ExampleController, ExamplePersistenceAdapter", "dim"))
+        emit(Message("  - Entry: src/index.js with dependency injection", "dim"))
+
+    def _generate_hexagonal_entities(self, plan: BuildPlan) -> None:
+        """Generate the hexagonal modules of every schema entity, their index.js exports and the DI wiring."""
+        emit(Message(f"Generating hexagonal code for {len(self.schema)} entities (domain/application/adapter)...", "cyan"))
+
+        exports: dict[str, list[tuple[str, str]]] = {}
+        entities = []
+        for entity in self.schema.entities:
+            context = entity.context()
+            entities.append(context)
+            for template, folder, module, symbol in _ENTITY_TEMPLATES:
+                module, symbol = module.format(name=entity.name), symbol.format(name=entity.name)
+                plan.add_template(f"server/{folder}/{module}", f"express/hexagonal/entity/{template}", entity=context)
+                exports.setdefault(folder, []).append((symbol, module))
+        for folder, symbols in exports.items():
+            plan.add_template(f"server/{folder}/index.js", "express/hexagonal/entity/exports_index.js.j2", exports=symbols)
+        plan.add_template("server/src/index.js", "express/hexagonal/entity/index.js.j2", entities=entities)
+        plan.add_template("server/src/infrastructure/config/index.js", "express/hexagonal/config_index.js.j2")
+
+        emit(Message(f"Generated {len(self.schema)} entities: {', '.join(e.name for e in self.schema.entities[:5])}"
+                     f"{', ...' if len(self.schema) > 5 else ''}", "green"))
+
+    def get_install_steps(self, base_path: Path, libraries: tuple[str, ...] = ()) -> list[InstallStep]:
+        return [
+            InstallStep(
+                label="server",
+                cmd=install_command(base_path / "server"),
+                cwd=base_path / "server",
+                ecosystem="npm",
+                success_msg="Server dependencies installed successfully!",
+                fail_msg="Failed to install dependencies. Do you have 'npm' installed?",
+            )
+        ]
@@ -1,8 +1,36 @@
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from skelly.strategies.base import BackendStrategy
+from skelly.core.events import Message, emit
+from skelly.core.installer import InstallStep
+from skelly.core.maven_repo import Coordinate, MavenRepository
 from skelly.core.models import Architecture, ProjectConfig
-from skelly.core.template_renderer import render_to_file
+from skelly.core.plan import BuildPlan
+from skelly.core.versions import MAVEN, VersionIndex, get_version_index
+
+if TYPE_CHECKING:
+    from skelly.core.domain import DomainSchema
+
+# Per-entity templates of a domain schema: template name → path below the base package.
+_ENTITY_TEMPLATES = [
+    ("Entity.java.j2", "domain/model/{name}.java"),
+    ("Repository.java.j2", "domain/repository/{name}Repository.java"),
+    ("Service.java.j2", "domain/service/{name}Service.java"),
+    ("Request.java.j2", "inbound/dto/{name}Request.java"),
+    ("Response.java.j2", "inbound/dto/{name}Response.java"),
+    ("Controller.java.j2", "inbound/rest/{name}Controller.java"),
+    ("RepositoryImpl.java.j2", "outbound/persistence/{name}RepositoryImpl.java"),
+]
+
+# Hexagonal files that do not depend on the entities.
+_SHARED_TEMPLATES = {
+    "java_spring/hexagonal/domain/ExternalServiceClient.java.j2": "domain/client/ExternalServiceClient.java",
+    "java_spring/hexagonal/inbound/SecurityConfig.java.j2": "inbound/security/SecurityConfig.java",
+    "java_spring/hexagonal/outbound/ExternalServiceClientImpl.java.j2": "outbound/restclient/ExternalServiceClientImpl.java",
+    "java_spring/hexagonal/config/AppConfig.java.j2": "config/AppConfig.java",
+    "java_spring/hexagonal/Application.java.j2": "Application.java",
+}
 
 
 class JavaSpringBackend(BackendStrategy):
@@ -16,9 +44,28 @@ class JavaSpringBackend(BackendStrategy):
         "mapstruct": ("org.mapstruct", "1.5.5.Final"),
     }
 
-    def __init__(self, project_name: str):
+    # Parent version in java_spring/pom.xml.j2; it manages the starter versions.
+    SPRING_BOOT_VERSION = "3.2.0"
+
+    # Artifacts every generated pom.xml needs besides the selected libraries.
+    BASE_ARTIFACTS = (
+        "spring-boot-starter-parent",
+        "spring-boot-starter-web",
+        "spring-boot-maven-plugin",
+    )
+
+    def __init__(
+        self,
+        project_name: str,
+        repository: MavenRepository | None = None,
+        versions: VersionIndex | None = None,
+        schema: "DomainSchema | None" = None,
+    ):
         self.project_name = project_name.lower().replace(" ", "")
         self.base_package = f"com.example.{self.project_name}"
+        self.repository = repository or MavenRepository.from_env()
+        self.versions = versions if versions is not None else get_version_index()
+        self.schema = schema
 
     def get_folders(self) -> list[str]:
         return ["server/src/main/resources"]
@@ -26,35 +73,76 @@ class JavaSpringBackend(BackendStrategy):
     def get_name(self) -> str:
         return "Java Spring Boot"
 
-    def create_config_files(self, config: ProjectConfig, base_path: Path) -> None:
+    def get_ignore_patterns(self) -> list[str]:
+        return ["/server/target/", "*.class", "*.log"]
+
+    def _dependencies(self, libraries: list[str]) -> list[dict]:
         dependencies = []
-        for lib in config.backend_libraries:
+        for lib in libraries:
             dep_info = self.DEPENDENCY_MAP.get(lib)
             group_id = dep_info[0] if dep_info else "org.springframework.boot"
             version = dep_info[1] if dep_info else None
+            if version:
+                # Versions managed by the Spring Boot parent stay unpinned.
+                version = self.versions.pin(MAVEN, f"{group_id}:{lib}", default=version)
             dependencies.append({
                 "group_id": group_id,
                 "artifact_id": lib,
                 "version": version,
             })
-
-        render_to_file(
+        return dependencies
+
+    def required_artifacts(self, libraries: list[str]) -> list[Coordinate]:
+        """Root artifacts of a project with these libraries; versions left to the parent are Spring Boot's."""
+        artifacts = [
+            Coordinate("org.springframework.boot", artifact, self.SPRING_BOOT_VERSION)
+            for artifact in self.BASE_ARTIFACTS
+        ]
+        for dep in self._dependencies(libraries):
+            version = dep["version"] or self.SPRING_BOOT_VERSION
+            artifacts.append(Coordinate(dep["group_id"], dep["artifact_id"], version))
+        return artifacts
+
+    def prefetch(self, libraries: list[str], source: Path | None = None) -> list[Coordinate]:
+        """Resolve the closure of all given libraries into the managed Maven repository."""
+        from skelly.core.template_renderer import render_template
+
+        pom = render_template(
+            "java_spring/pom.xml.j2",
+            project_name="skelly-prefetch",
+            dependencies=self._dependencies(libraries),
+        )
+        artifacts = self.required_artifacts(libraries)
+        self.repository.prefetch(pom, artifacts, source=source)
+        return artifacts
+
+    def maven_args(self, libraries: tuple[str, ...]) -> tuple[str, ...]:
+        """mvn options for a project with these libraries: offline when the managed repository holds them all."""
+        if self.repository.has_closure(self.required_artifacts(list(libraries))):
+            return self.repository.offline_args()
+        return ()
+
+    def create_config_files(self, config: ProjectConfig, plan: BuildPlan) -> None:
+        plan.add_template(
+            "server/pom.xml",
             "java_spring/pom.xml.j2",
-            base_path / "server" / "pom.xml",
             project_name=self.project_name,
-            dependencies=dependencies,
+            dependencies=self._dependencies(list(config.backend_libraries)),
         )
-        print("[cyan]Created server/pom.xml[/cyan]")
+        emit(Message("Created server/pom.xml", "cyan"))
 
         if config.architecture == Architecture.HEXAGONAL.value:
-            self._generate_hexagonal_example(config, base_path)
+            if self.schema is not None:
+                self._generate_hexagonal_entities(plan)
+            else:
+                self._generate_hexagonal_example(plan)
 
-    def _generate_hexagonal_example(self, config: ProjectConfig, base_path: Path) -> None:
+    def _generate_hexagonal_example(self, plan: BuildPlan) -> None:
         """Generate example code with inbound/domain/outbound structure."""
         pkg = self.base_package
         pkg_path = f"server/src/main/java/{pkg.replace('.', '/')}"
 
-        print("[cyan]Generating hexagonal architecture example (inbound/domain/outbound)...[/cyan]")
+        emit(Message("Generating hexagonal architecture example (inbound/domain/outbound)...", "cyan"))
 
         template_file_map = {
             # Domain layer
@@ -79,25 +167,53 @@ class JavaSpringBackend(BackendStrategy):
         }
 
         for template, output in template_file_map.items():
-            render_to_file(template, base_path / output, package=pkg)
+            plan.add_template(output, template, package=pkg)
 
-        render_to_file(
+        plan.add_template(
+            "server/src/main/resources/application.properties",
             "java_spring/application.properties.j2",
-            base_path / "server/src/main/resources/application.properties",
             project_name=self.project_name,
         )
 
-        print("[green]Generated hexagonal architecture example![/green]")
-        print("[dim]  INBOUND:  dto, rest (Controller), messaging (Consumer), security[/dim]")
-        print("[dim]  DOMAIN:   model (Entity), service, repository, client, messaging (interfaces)[/dim]")
-        print("[dim]  OUTBOUND: persistence (RepoImpl), restclient (ClientImpl), messaging (ProducerImpl)[/dim]")
-
-    def install_dependencies(self, base_path: Path) -> None:
-        server_path = base_path / "server"
-        print("[yellow]Running mvn install...[/yellow]")
-        self._run_command(
-            ["mvn", "install", "-DskipTests"],
-            cwd=server_path,
-            success_msg="Java dependencies installed!",
-            fail_msg="Maven build failed. Is 'mvn' installed and in PATH?",
+        emit(Message("Generated hexagonal architecture example!", "green"))
+        emit(Message("  INBOUND:  dto, rest (Controller), messaging (Consumer), security", "dim"))
+        emit(Message("  DOMAIN:   model (Entity), service, repository, client, messaging (interfaces)", "dim"))
+        emit(Message("  OUTBOUND: persistence (RepoImpl), restclient (ClientImpl), messaging (ProducerImpl)", "dim"))
+
+    def _generate_hexagonal_entities(self, plan: BuildPlan) -> None:
+        """Generate model, repository port, service, DTOs, controller and persistence adapter per schema entity."""
+        pkg = self.base_package
+        pkg_path = f"server/src/main/java/{pkg.replace('.', '/')}"
+
+        emit(Message(f"Generating hexagonal code for {len(self.schema)} entities (inbound/domain/outbound)...", "cyan"))
+        for template, output in _SHARED_TEMPLATES.items():
+            plan.add_template(f"{pkg_path}/{output}", template, package=pkg)
+        plan.add_template(
+            "server/src/main/resources/application.properties",
+            "java_spring/application.properties.j2",
+            project_name=self.project_name,
         )
+        for entity in self.schema.entities:
+            context = entity.context()
+            for template, output in _ENTITY_TEMPLATES:
+                plan.add_template(
+                    f"{pkg_path}/{output.format(name=entity.name)}",
+                    f"java_spring/hexagonal/entity/{template}",
+                    package=pkg,
+                    entity=context,
+                )
+
+        emit(Message(f"Generated {len(self.schema)} entities: {', '.join(e.name for e in self.schema.entities[:5])}"
+                     f"{', ...' if len(self.schema) > 5 else ''}", "green"))
+
+    def get_install_steps(self, base_path: Path, libraries: tuple[str, ...] = ()) -> list[InstallStep]:
+        return [
+            InstallStep(
+                label="server",
+                cmd=("mvn", *self.maven_args(libraries), "install", "-DskipTests"),
+                cwd=base_path / "server",
+                ecosystem="maven",
+                success_msg="Java dependencies installed!",
+                fail_msg="Maven build failed. Is 'mvn' installed and in PATH?",
+            )
+        ]
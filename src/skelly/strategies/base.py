@@ -1,11 +1,13 @@
-import logging
-import subprocess
 from abc import ABC, abstractmethod
 from pathlib import Path
 
+from skelly.core.installer import InstallRunner, InstallStep, StepResult
 from skelly.core.models import ProjectConfig
-
-logger = logging.getLogger(__name__)
+from skelly.core.lockfiles import LockfileStore, install_command
+from skelly.core.node_cache import NodeModulesCache
+from skelly.core.plan import BuildPlan
+from skelly.core.tracing import span
+from skelly.core.versions import VersionIndex, get_version_index
 
 
 class ArchitectureStrategy(ABC):
@@ -42,42 +44,37 @@ class BackendStrategy(ABC):
         pass
 
     @abstractmethod
-    def create_config_files(self, config: ProjectConfig, base_path: Path) -> None:
-        """Create configuration files (pom.xml, package.json, requirements.txt)."""
+    def create_config_files(self, config: ProjectConfig, plan: BuildPlan) -> None:
+        """Add configuration files (pom.xml, package.json, requirements.txt) to the build plan."""
         pass
 
     @abstractmethod
-    def install_dependencies(self, base_path: Path) -> None:
-        """Install dependencies using the appropriate package manager."""
+    def get_install_steps(self, base_path: Path, libraries: tuple[str, ...] = ()) -> list[InstallStep]:
+        """Return the commands that install the backend dependencies of a project with these libraries, in order."""
         pass
 
-    @staticmethod
-    def _run_command(
-        cmd: list[str],
-        cwd: Path,
-        success_msg: str,
-        fail_msg: str,
-    ) -> None:
-        """Run a shell command with standardized error handling."""
-        try:
-            subprocess.run(cmd, cwd=cwd, shell=True, check=True)
-            print(f"[green]{success_msg}[/green]")
-        except subprocess.CalledProcessError as e:
-            logger.warning("Command %s failed with exit code %s", cmd, e.returncode)
-            print(f"[red]{fail_msg}[/red]")
-        except FileNotFoundError:
-            logger.error("Command not found: %s", cmd[0])
-            print(f"[red]{fail_msg}[/red]")
-        except Exception as e:
-            logger.exception("Unexpected error running %s", cmd)
-            print(f"[red]Error: {e}[/red]")
+    def get_ignore_patterns(self) -> list[str]:
+        """Return .gitignore patterns for build output and installed dependencies, relative to the project root."""
+        return []
+
+    def install_dependencies(self, base_path: Path, libraries: tuple[str, ...] = ()) -> list[StepResult]:
+        """Install dependencies using the appropriate package manager."""
+        runner = InstallRunner(node_cache=NodeModulesCache.from_env(), lockfiles=LockfileStore.from_env())
+        with span("install_dependencies", "strategy", strategy=self.get_name()):
+            return runner.run([self.get_install_steps(base_path, libraries)])
 
 
 class FrontendStrategy(ABC):
     """
     Handles frontend-specific setup: folder structure, configuration, and dependencies.
+    User-selected libraries are pinned to the versions in the version snapshot,
+    and a lockfile is added when the same dependency set was installed before.
     """
 
+    def __init__(self, versions: VersionIndex | None = None, lockfiles: LockfileStore | None = None):
+        self.versions = versions if versions is not None else get_version_index()
+        self.lockfiles = lockfiles if lockfiles is not None else LockfileStore.from_env()
+
     @abstractmethod
     def get_folders(self) -> list[str]:
         """Return frontend-specific folders (e.g., src/components, src/hooks)."""
@@ -89,23 +86,29 @@ class FrontendStrategy(ABC):
         pass
 
     @abstractmethod
-    def create_config_files(self, config: ProjectConfig, base_path: Path) -> None:
-        """Create frontend configuration files (package.json, vite.config.js, etc.)."""
+    def create_config_files(self, config: ProjectConfig, plan: BuildPlan) -> None:
+        """Add frontend configuration files (package.json, vite.config.js, etc.) to the build plan."""
         pass
 
-    def install_dependencies(self, base_path: Path) -> None:
-        """Install frontend dependencies via npm."""
-        frontend_path = base_path / "frontend"
-        print("[yellow]Running npm install for frontend...[/yellow]")
-        try:
-            subprocess.run(["npm", "install"], cwd=frontend_path, shell=True, check=True)
-            print("[green]Frontend dependencies installed![/green]")
-        except subprocess.CalledProcessError as e:
-            logger.warning("npm install failed with exit code %s", e.returncode)
-            print("[red]Failed to install frontend dependencies. Do you have 'npm' installed?[/red]")
-        except FileNotFoundError:
-            logger.error("npm command not found")
-            print("[red]Failed to install frontend dependencies. Do you have 'npm' installed?[/red]")
-        except Exception as e:
-            logger.exception("Unexpected error during frontend installation")
-            print(f"[red]Error during frontend installation: {e}[/red]")
+    def get_ignore_patterns(self) -> list[str]:
+        """Return .gitignore patterns relative to the project root; npm dependencies and build output by default."""
+        return ["/frontend/node_modules/", "/frontend/dist/"]
+
+    def get_install_steps(self, base_path: Path, libraries: tuple[str, ...] = ()) -> list[InstallStep]:
+        """Return the commands that install the frontend dependencies; npm by default."""
+        return [
+            InstallStep(
+                label="frontend",
+                cmd=install_command(base_path / "frontend"),
+                cwd=base_path / "frontend",
+                ecosystem="npm",
+                success_msg="Frontend dependencies installed!",
+                fail_msg="Failed to install frontend dependencies. Do you have 'npm' installed?",
+            )
+        ]
+
+    def install_dependencies(self, base_path: Path, libraries: tuple[str, ...] = ()) -> list[StepResult]:
+        """Install frontend dependencies."""
+        runner = InstallRunner(node_cache=NodeModulesCache.from_env(), lockfiles=LockfileStore.from_env())
+        with span("install_dependencies", "strategy", strategy=self.get_name()):
+            return runner.run([self.get_install_steps(base_path, libraries)])
@@ -1,5 +1,16 @@
-from .react import ReactFrontend
-from .lit import LitFrontend
-from .angular import AngularFrontend
+from importlib import import_module
 
-__all__ = ["ReactFrontend", "LitFrontend", "AngularFrontend"]
+_EXPORTS = {
+    "ReactFrontend": ".react",
+    "LitFrontend": ".lit",
+    "AngularFrontend": ".angular",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(import_module(module, __name__), name)
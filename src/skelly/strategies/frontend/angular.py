@@ -1,8 +1,11 @@
 import json
-from pathlib import Path
 
 from skelly.strategies.base import FrontendStrategy
+from skelly.core.events import Message, emit
+from skelly.core.lockfiles import add_package_json
 from skelly.core.models import ProjectConfig
+from skelly.core.plan import BuildPlan
+from skelly.core.versions import NPM
 
 
 class AngularFrontend(FrontendStrategy):
@@ -20,9 +23,10 @@ class AngularFrontend(FrontendStrategy):
     def get_name(self) -> str:
         return "Angular"
 
-    def create_config_files(self, config: ProjectConfig, base_path: Path) -> None:
-        frontend_path = base_path / "frontend"
+    def get_ignore_patterns(self) -> list[str]:
+        return [*super().get_ignore_patterns(), "/frontend/.angular/"]
 
+    def create_config_files(self, config: ProjectConfig, plan: BuildPlan) -> None:
         dependencies = {
             "@angular/animations": "^17.0.0",
             "@angular/common": "^17.0.0",
@@ -47,7 +51,7 @@ class AngularFrontend(FrontendStrategy):
         for lib_entry in config.frontend_libraries:
             packages = lib_entry.split()
             for pkg in packages:
-                dependencies[pkg] = "latest"
+                dependencies[pkg] = self.versions.pin(NPM, pkg)
 
         package_json = {
             "name": f"{config.name.lower().replace(' ', '-')}-frontend",
@@ -62,9 +66,7 @@ class AngularFrontend(FrontendStrategy):
             "devDependencies": dev_dependencies,
         }
 
-        package_json_path = frontend_path / "package.json"
-        with open(package_json_path, "w") as f:
-            json.dump(package_json, f, indent=2)
+        add_package_json(plan, "frontend", package_json, self.lockfiles)
 
         angular_json = {
             "$schema": "./node_modules/@angular/cli/lib/config/schema.json",
@@ -93,9 +95,7 @@ class AngularFrontend(FrontendStrategy):
             },
         }
 
-        angular_json_path = frontend_path / "angular.json"
-        with open(angular_json_path, "w") as f:
-            json.dump(angular_json, f, indent=2)
+        plan.add_file("frontend/angular.json", json.dumps(angular_json, indent=2))
 
         index_html = f"""<!DOCTYPE html>
 <html lang="en">
@@ -110,10 +110,6 @@ class AngularFrontend(FrontendStrategy):
   </body>
 </html>
 """
-        src_path = frontend_path / "src"
-        src_path.mkdir(parents=True, exist_ok=True)
-        index_path = src_path / "index.html"
-        with open(index_path, "w") as f:
-            f.write(index_html)
+        plan.add_file("frontend/src/index.html", index_html)
 
-        print("[cyan]Created Angular frontend config[/cyan]")
+        emit(Message("Created Angular frontend config", "cyan"))
@@ -1,8 +1,9 @@
-import json
-from pathlib import Path
-
 from skelly.strategies.base import FrontendStrategy
+from skelly.core.events import Message, emit
+from skelly.core.lockfiles import add_package_json
 from skelly.core.models import ProjectConfig
+from skelly.core.plan import BuildPlan
+from skelly.core.versions import NPM
 
 
 class LitFrontend(FrontendStrategy):
@@ -18,9 +19,7 @@ class LitFrontend(FrontendStrategy):
     def get_name(self) -> str:
         return "Lit"
 
-    def create_config_files(self, config: ProjectConfig, base_path: Path) -> None:
-        frontend_path = base_path / "frontend"
-
+    def create_config_files(self, config: ProjectConfig, plan: BuildPlan) -> None:
         dependencies = {
             "lit": "^3.1.0",
         }
@@ -32,7 +31,7 @@ class LitFrontend(FrontendStrategy):
         for lib_entry in config.frontend_libraries:
             packages = lib_entry.split()
             for pkg in packages:
-                dependencies[pkg] = "latest"
+                dependencies[pkg] = self.versions.pin(NPM, pkg)
 
         package_json = {
             "name": f"{config.name.lower().replace(' ', '-')}-frontend",
@@ -48,9 +47,7 @@ class LitFrontend(FrontendStrategy):
             "devDependencies": dev_dependencies,
         }
 
-        package_json_path = frontend_path / "package.json"
-        with open(package_json_path, "w") as f:
-            json.dump(package_json, f, indent=2)
+        add_package_json(plan, "frontend", package_json, self.lockfiles)
 
         vite_config = """import { defineConfig } from 'vite'
 
@@ -63,9 +60,7 @@ export default defineConfig({
   }
 })
 """
-        vite_config_path = frontend_path / "vite.config.js"
-        with open(vite_config_path, "w") as f:
-            f.write(vite_config)
+        plan.add_file("frontend/vite.config.js", vite_config)
 
         index_html = f"""<!DOCTYPE html>
 <html lang="en">
@@ -80,8 +75,6 @@ export default defineConfig({
   </body>
 </html>
 """
-        index_path = frontend_path / "index.html"
-        with open(index_path, "w") as f:
-            f.write(index_html)
+        plan.add_file("frontend/index.html", index_html)
 
-        print(f"[cyan]Created Lit frontend config with: {', '.join(dependencies.keys())}[/cyan]")
+        emit(Message(f"Created Lit frontend config with: {', '.join(dependencies.keys())}", "cyan"))
@@ -1,8 +1,9 @@
-import json
-from pathlib import Path
-
 from skelly.strategies.base import FrontendStrategy
+from skelly.core.events import Message, emit
+from skelly.core.lockfiles import add_package_json
 from skelly.core.models import ProjectConfig
+from skelly.core.plan import BuildPlan
+from skelly.core.versions import NPM
 
 
 class ReactFrontend(FrontendStrategy):
@@ -21,9 +22,7 @@ class ReactFrontend(FrontendStrategy):
     def get_name(self) -> str:
         return "React"
 
-    def create_config_files(self, config: ProjectConfig, base_path: Path) -> None:
-        frontend_path = base_path / "frontend"
-
+    def create_config_files(self, config: ProjectConfig, plan: BuildPlan) -> None:
         dependencies = {
             "react": "^18.2.0",
             "react-dom": "^18.2.0",
@@ -38,9 +37,9 @@ class ReactFrontend(FrontendStrategy):
             packages = lib_entry.split()
             for pkg in packages:
                 if pkg in ["tailwindcss", "postcss", "autoprefixer"]:
-                    dev_dependencies[pkg] = "latest"
+                    dev_dependencies[pkg] = self.versions.pin(NPM, pkg)
                 else:
-                    dependencies[pkg] = "latest"
+                    dependencies[pkg] = self.versions.pin(NPM, pkg)
 
         package_json = {
             "name": f"{config.name.lower().replace(' ', '-')}-frontend",
@@ -56,9 +55,7 @@ class ReactFrontend(FrontendStrategy):
             "devDependencies": dev_dependencies,
         }
 
-        package_json_path = frontend_path / "package.json"
-        with open(package_json_path, "w") as f:
-            json.dump(package_json, f, indent=2)
+        add_package_json(plan, "frontend", package_json, self.lockfiles)
 
         vite_config = """import { defineConfig } from 'vite'
 import react from '@vitejs/plugin-react'
@@ -67,9 +64,7 @@ export default defineConfig({
   plugins: [react()],
 })
 """
-        vite_config_path = frontend_path / "vite.config.js"
-        with open(vite_config_path, "w") as f:
-            f.write(vite_config)
+        plan.add_file("frontend/vite.config.js", vite_config)
 
         index_html = f"""<!DOCTYPE html>
 <html lang="en">
@@ -84,8 +79,6 @@ export default defineConfig({
   </body>
 </html>
 """
-        index_path = frontend_path / "index.html"
-        with open(index_path, "w") as f:
-            f.write(index_html)
+        plan.add_file("frontend/index.html", index_html)
 
-        print(f"[cyan]Created React frontend config with: {', '.join(dependencies.keys())}[/cyan]")
+        emit(Message(f"Created React frontend config with: {', '.join(dependencies.keys())}", "cyan"))
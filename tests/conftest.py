@@ -0,0 +1,15 @@
+import os
+
+import pytest
+
+
+@pytest.fixture(autouse=True, scope="session")
+def _isolated_cache_dir(tmp_path_factory):
+    """Keep template and package caches out of the real user cache directory."""
+    previous = os.environ.get("SKELLY_CACHE_DIR")
+    os.environ["SKELLY_CACHE_DIR"] = str(tmp_path_factory.mktemp("skelly-cache"))
+    yield
+    if previous is None:
+        os.environ.pop("SKELLY_CACHE_DIR", None)
+    else:
+        os.environ["SKELLY_CACHE_DIR"] = previous
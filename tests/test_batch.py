@@ -0,0 +1,61 @@
+import json
+
+import pytest
+
+from skelly.core.batch import load_specs, run_batch
+from skelly.core.exceptions import BuildError
+
+
+def _write_specs(path, specs):
+    path.write_text("\n".join(json.dumps(spec) for spec in specs) + "\n\n")
+    return path
+
+
+class TestLoadSpecs:
+    def test_skips_blank_lines_and_keeps_line_numbers(self, tmp_path):
+        spec_file = tmp_path / "specs.jsonl"
+        spec_file.write_text('{"name": "a", "backend_stack": "Java"}\n\n{"name": "b", "backend_stack": "Django"}\n')
+        specs = load_specs(spec_file)
+        assert [lineno for lineno, _ in specs] == [1, 3]
+
+    def test_invalid_json_reports_line(self, tmp_path):
+        spec_file = tmp_path / "specs.jsonl"
+        spec_file.write_text('{"name": "a", "backend_stack": "Java"}\nnot json\n')
+        with pytest.raises(BuildError, match="specs.jsonl:2: invalid JSON"):
+            load_specs(spec_file)
+
+
+class TestRunBatch:
+    @pytest.mark.parametrize("processes", [1, 2])
+    def test_builds_every_spec(self, tmp_path, processes):
+        out = str(tmp_path / "out")
+        spec_file = _write_specs(tmp_path / "specs.jsonl", [
+            {"name": "java-hex", "backend_stack": "Java", "architecture": "hexagonal", "output_path": out},
+            {"name": "express-react", "backend_stack": "Express", "frontend_stack": "React", "output_path": out},
+            {"name": "custom", "backend_stack": "Django", "architecture": "custom",
+             "custom_folders": ["docs", "scripts"], "output_path": out},
+        ])
+
+        results = list(run_batch(load_specs(spec_file), processes=processes))
+
+        assert all(result.ok for result in results)
+        assert sorted(result.name for result in results) == ["custom", "express-react", "java-hex"]
+        assert (tmp_path / "out/java-hex/server/pom.xml").exists()
+        assert (tmp_path / "out/express-react/frontend/package.json").exists()
+        assert (tmp_path / "out/custom/scripts/.gitkeep").exists()
+
+    def test_invalid_spec_is_reported_not_raised(self, tmp_path):
+        results = list(run_batch([(7, {"name": "bad", "backend_stack": "Rails"})], processes=1))
+        (result,) = results
+        assert not result.ok
+        assert result.line == 7
+        assert "Unknown BackendStack" in result.error
+
+    def test_wrongly_typed_field_fails_only_its_line(self, tmp_path):
+        specs = [
+            (1, {"name": "typed", "backend_stack": "Express", "backend_libraries": 5}),
+            (2, {"name": "fine", "backend_stack": "Express", "output_path": str(tmp_path)}),
+        ]
+        results = sorted(run_batch(specs, processes=1), key=lambda result: result.line)
+        assert [result.ok for result in results] == [False, True]
+        assert "'backend_libraries' must be a list of strings" in results[0].error
@@ -87,3 +87,14 @@ class TestProjectBuilder:
         result = builder.with_frontend_strategy(None)
         assert result is builder
         assert builder._frontend is None
+
+    def test_create_plan_collects_folders_without_writing(self, tmp_path):
+        builder = ProjectBuilder()
+        builder.set_meta_data("planned")\
+               .with_architecture_strategy(LayeredArchitecture())
+        builder._output_path = str(tmp_path)
+
+        plan = builder.create_plan(builder._create_config())
+
+        assert "server/src/api/routes" in plan.directories()
+        assert not (tmp_path / "planned").exists()
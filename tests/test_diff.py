@@ -0,0 +1,88 @@
+import json
+
+import pytest
+
+from skelly.core.diff import ADD, CONFLICT, MODIFY, UNCHANGED, diff_plan, index_tree
+from skelly.core.executor import PlanExecutor
+from skelly.core.plan import BuildPlan
+from skelly.core.spec import ProjectSpec
+
+SPEC = {"name": "shop", "backend_stack": "Express", "frontend_stack": "React", "architecture": "layered"}
+
+
+def _plan() -> BuildPlan:
+    return BuildPlan().add_folders(["src/api", "docs"]).add_file("src/index.js", "main\n")\
+                      .add_template("README.md", "express/hexagonal/index.js.j2", project_name="shop")
+
+
+def _statuses(diff) -> dict[str, str]:
+    return {entry.path: entry.status for entry in diff.entries}
+
+
+class TestDiffPlan:
+    def test_everything_is_added_to_a_missing_directory(self, tmp_path):
+        diff = diff_plan(_plan(), tmp_path / "missing")
+        assert set(_statuses(diff).values()) == {ADD}
+        assert diff.counts() == {ADD: 6, MODIFY: 0, UNCHANGED: 0, CONFLICT: 0}
+
+    def test_applied_plan_is_unchanged(self, tmp_path):
+        PlanExecutor(workers=1).apply(_plan(), tmp_path)
+        assert set(_statuses(diff_plan(_plan(), tmp_path)).values()) == {UNCHANGED}
+
+    def test_modified_and_conflicting_files(self, tmp_path):
+        PlanExecutor(workers=1).apply(_plan(), tmp_path)
+        (tmp_path / "README.md").write_text("edited by hand\n")
+        plan = _plan().add_file("src/index.js", "main v2\n").add_file("docs/guide.md", "guide\n")
+        statuses = _statuses(diff_plan(plan, tmp_path))
+        assert statuses["src/index.js"] == MODIFY
+        assert statuses["README.md"] == CONFLICT
+        assert statuses["docs/guide.md"] == ADD
+        assert statuses["src/api"] == UNCHANGED
+
+    def test_without_manifest_differences_are_modifications(self, tmp_path):
+        (tmp_path / "src").mkdir()
+        (tmp_path / "src/index.js").write_text("other\n")
+        assert _statuses(diff_plan(_plan(), tmp_path))["src/index.js"] == MODIFY
+
+    def test_files_and_folders_in_each_others_place(self, tmp_path):
+        (tmp_path / "docs").write_text("")
+        (tmp_path / "README.md").mkdir()
+        diff = diff_plan(_plan(), tmp_path)
+        conflicts = {entry.path: entry.reason for entry in diff.entries if entry.status == CONFLICT}
+        assert conflicts == {"docs": "a file is in its place", "README.md": "a directory is in its place"}
+
+    def test_to_dict_is_json(self, tmp_path):
+        data = json.loads(json.dumps(diff_plan(_plan(), tmp_path).to_dict()))
+        assert data["counts"][ADD] == 6
+        assert {"path": "docs", "type": "folder", "status": ADD} in data["entries"]
+
+
+def test_index_tree_only_descends_into_planned_directories(tmp_path):
+    (tmp_path / "src/api").mkdir(parents=True)
+    (tmp_path / "node_modules/left-pad").mkdir(parents=True)
+    index = index_tree(tmp_path, {"src"})
+    assert set(index) == {"src", "src/api", "node_modules"}
+
+
+class TestBuilderDiff:
+    def _builder(self, tmp_path):
+        return ProjectSpec.from_dict({**SPEC, "output_path": str(tmp_path)}).create_builder(install=False)
+
+    def test_matches_a_later_build(self, tmp_path):
+        self._builder(tmp_path).build()
+        (tmp_path / "shop/server/package.json").write_text("{}")
+        counts = self._builder(tmp_path).diff().counts()
+        assert counts[CONFLICT] == 1
+        assert counts[ADD] == counts[MODIFY] == 0
+
+    def test_writes_nothing(self, tmp_path):
+        diff = self._builder(tmp_path).diff()
+        assert not (tmp_path / "shop").exists()
+        assert diff.counts()[ADD] == len(diff.entries)
+
+    def test_requires_an_architecture(self):
+        from skelly.core.builder import ProjectBuilder
+        from skelly.core.exceptions import BuildError
+
+        with pytest.raises(BuildError, match="Architecture"):
+            ProjectBuilder().set_meta_data("x").diff()
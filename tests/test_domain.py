@@ -0,0 +1,106 @@
+import json
+
+import pytest
+
+from skelly.core.domain import DomainSchema, load_schema
+from skelly.core.exceptions import BuildError
+from skelly.core.executor import PlanExecutor
+from skelly.core.spec import ProjectSpec
+
+SCHEMA = {
+    "entities": [
+        {"name": "Order", "fields": {"total": "decimal", "note": "string"}},
+        {"name": "OrderItem", "fields": [{"name": "quantity", "type": "integer"}, {"name": "sku"}]},
+    ]
+}
+
+
+def _spec(tmp_path, stack: str, schema: dict = SCHEMA) -> ProjectSpec:
+    path = tmp_path / "schema.json"
+    path.write_text(json.dumps(schema))
+    return ProjectSpec.from_dict({
+        "name": "shop", "backend_stack": stack, "architecture": "hexagonal",
+        "schema": str(path), "output_path": str(tmp_path),
+    })
+
+
+class TestDomainSchema:
+    def test_names(self):
+        [order, item] = DomainSchema.from_dict(SCHEMA).entities
+        assert (item.var_name, item.plural_var_name, item.route) == ("orderItem", "orderItems", "order-items")
+        assert [(f.name, f.java_type, f.js_type) for f in item.fields] == [
+            ("quantity", "Integer", "number"), ("sku", "String", "string"),
+        ]
+        assert order.fields[0].capitalized == "Total"
+
+    @pytest.mark.parametrize("data, message", [
+        ({"entities": []}, "non-empty"),
+        ({"entities": [{"name": "order"}]}, "PascalCase"),
+        ({"entities": [{"name": "A"}, {"name": "A"}]}, "Duplicate"),
+        ({"entities": [{"name": "A", "fields": {"id": "uuid"}}]}, "invalid field"),
+        ({"entities": [{"name": "A", "fields": {"x": "money"}}]}, "unknown type"),
+        ({"entities": [{"name": "Class"}]}, "reserved"),
+    ])
+    def test_invalid(self, data, message):
+        with pytest.raises(ValueError, match=message):
+            DomainSchema.from_dict(data)
+
+    def test_load_yaml(self, tmp_path):
+        pytest.importorskip("yaml")
+        path = tmp_path / "schema.yaml"
+        path.write_text("entities:\n  - name: Category\n    fields: {title: string}\n")
+        assert [e.name for e in load_schema(path).entities] == ["Category"]
+
+    def test_load_reports_the_file(self, tmp_path):
+        path = tmp_path / "schema.json"
+        path.write_text('{"entities": [{"name": "bad"}]}')
+        with pytest.raises(BuildError, match="schema.json"):
+            load_schema(path)
+
+
+class TestEntityGeneration:
+    def test_java(self, tmp_path):
+        _spec(tmp_path, "Java").create_builder(install=False).build()
+        package = tmp_path / "shop/server/src/main/java/com/example/shop"
+        controller = (package / "inbound/rest/OrderItemController.java").read_text()
+        assert '@RequestMapping("/api/order-items")' in controller
+        assert "request.quantity()," in controller
+        assert "private java.math.BigDecimal total;" in (package / "domain/model/Order.java").read_text()
+        assert (package / "outbound/persistence/OrderRepositoryImpl.java").exists()
+        assert (package / "Application.java").exists()
+        assert not (package / "domain/model/Example.java").exists()
+
+    def test_express(self, tmp_path):
+        _spec(tmp_path, "Express").create_builder(install=False).build()
+        src = tmp_path / "shop/server/src"
+        index = (src / "index.js").read_text()
+        assert "app.use('/api/order-items', createOrderItemController(orderItemService));" in index
+        assert (src / "application/port/out/index.js").read_text() == (
+            "export { OrderRepositoryPort } from './OrderRepository.js';\n"
+            "export { OrderItemRepositoryPort } from './OrderItemRepository.js';\n"
+        )
+        assert "OrderItem.create(command.quantity, command.sku)" in (
+            src / "application/port/in/CreateOrderItemUseCase.js"
+        ).read_text()
+        assert not (src / "domain/model/Example.js").exists()
+
+    def test_schema_needs_hexagonal(self, tmp_path):
+        spec = ProjectSpec.from_dict({"name": "shop", "backend_stack": "Express", "schema": "schema.json"})
+        with pytest.raises(ValueError, match="hexagonal"):
+            spec.create_builder()
+
+    def test_django_is_not_supported(self, tmp_path):
+        with pytest.raises(ValueError, match="Django"):
+            _spec(tmp_path, "Django").create_builder()
+
+
+def test_process_rendering_matches_in_process_rendering(tmp_path):
+    entities = [{"name": f"Entity{i}", "fields": {"label": "string"}} for i in range(40)]
+    builder = _spec(tmp_path, "Express", {"entities": entities}).create_builder(install=False)
+    plan = builder.create_plan(builder._create_config())
+    plan.add_file("README.md", "# shop\n")
+
+    serial = PlanExecutor(workers=1).apply(plan, tmp_path / "serial", keep_content=True)
+    parallel = PlanExecutor(processes=2).apply(plan, tmp_path / "parallel", keep_content=True)
+    assert parallel.contents == serial.contents
+    assert len(parallel.written) == len(plan.files)
@@ -0,0 +1,105 @@
+import io
+import json
+
+from rich.console import Console
+
+from skelly.core.builder import ProjectBuilder
+from skelly.core.events import (
+    ApplyFinished,
+    ApplyStarted,
+    BuildFinished,
+    BuildStarted,
+    ConsoleSink,
+    EventBus,
+    FileSkipped,
+    FileWritten,
+    FolderCreated,
+    InstallOutput,
+    JsonLinesSink,
+    Message,
+    ProgressSink,
+    subscribed,
+)
+from skelly.strategies.architecture import LayeredArchitecture
+from skelly.strategies.backend import ExpressBackend
+
+
+def _builder(tmp_path, **options) -> ProjectBuilder:
+    builder = ProjectBuilder(install=False, **options)
+    builder.set_meta_data("evented")\
+           .set_architecture("Layered Architecture")\
+           .with_architecture_strategy(LayeredArchitecture())\
+           .with_backend_strategy(ExpressBackend())
+    builder._output_path = str(tmp_path)
+    return builder
+
+
+def _console() -> Console:
+    return Console(file=io.StringIO(), width=200, color_system=None)
+
+
+class TestEventBus:
+    def test_delivers_to_subscribers_in_order(self):
+        bus, first, second = EventBus(), [], []
+        with subscribed(first.append, second.append, target=bus):
+            assert bus.active
+            bus.emit(Message("hi"))
+        bus.emit(Message("unheard"))
+        assert first == second == [Message("hi")]
+        assert not bus.active
+
+    def test_builds_are_silent_without_sinks(self, tmp_path, capsys):
+        _builder(tmp_path).build()
+        assert capsys.readouterr().out == ""
+
+
+class TestBuildEvents:
+    def test_one_event_per_folder_and_file(self, tmp_path):
+        events = []
+        with subscribed(events.append):
+            _builder(tmp_path).build()
+        [started] = [event for event in events if isinstance(event, ApplyStarted)]
+        folders = [event for event in events if isinstance(event, FolderCreated)]
+        written = [event for event in events if isinstance(event, FileWritten)]
+        assert (len(folders), len(written)) == (started.folders, started.files)
+        assert isinstance(events[0], BuildStarted) and isinstance(events[-1], BuildFinished)
+        assert ApplyFinished(len(written), 0, 0) in events
+
+    def test_rebuild_reports_skipped_files(self, tmp_path):
+        _builder(tmp_path).build()
+        events = []
+        with subscribed(events.append):
+            _builder(tmp_path).build()
+        assert not [event for event in events if isinstance(event, FileWritten)]
+        assert FileSkipped("server/package.json", "unchanged") in events
+
+
+class TestSinks:
+    def test_json_lines(self, tmp_path):
+        stream = io.StringIO()
+        with subscribed(JsonLinesSink(stream)):
+            _builder(tmp_path).build()
+        records = [json.loads(line) for line in stream.getvalue().splitlines()]
+        assert records[0]["event"] == "BuildStarted"
+        assert records[-1]["event"] == "BuildFinished"
+        assert records[-1]["config"]["name"] == "evented"
+        assert all("time" in record for record in records)
+
+    def test_console_renders_markup_and_escapes_text(self):
+        console = _console()
+        sink = ConsoleSink(console)
+        sink(Message("Created [server]/package.json", "cyan"))
+        sink(InstallOutput("server", "[bold]not markup[/bold]"))
+        sink(FileWritten("a.txt", 3))
+        output = console.file.getvalue()
+        assert "Created [server]/package.json" in output
+        assert "server | [bold]not markup[/bold]" in output
+        assert "a.txt" not in output
+
+    def test_progress_bar_through_a_build(self, tmp_path):
+        console = _console()
+        with subscribed(ProgressSink(console)):
+            _builder(tmp_path, workers=4).build()
+        output = console.file.getvalue()
+        assert "Building project 'evented'" in output
+        assert "Project files written successfully." in output
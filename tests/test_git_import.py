@@ -0,0 +1,66 @@
+import shutil
+import subprocess
+
+import pytest
+
+from skelly.core.git_import import COMMON_IGNORES, GitCommit, fast_import_stream, gitignore, initialize_repository
+from skelly.core.spec import ProjectSpec
+
+pytestmark = pytest.mark.skipif(shutil.which("git") is None, reason="git is not installed")
+
+
+def _git(project, *args) -> str:
+    return subprocess.run(["git", *args], cwd=project, capture_output=True, text=True, check=True).stdout
+
+
+class TestFastImportStream:
+    def test_blobs_then_one_commit(self):
+        stream = b"".join(fast_import_stream(
+            [("a.txt", b"hello\n"), ('we"ird.txt', b"")], "A <a@b>", "msg", "main", timestamp=0,
+        ))
+        assert stream.startswith(b"blob\nmark :1\ndata 6\nhello\n\n")
+        assert b"author A <a@b> 0 +0000\n" in stream
+        assert b'M 100644 :2 "we\\"ird.txt"\n' in stream
+        assert stream.endswith(b"done\n")
+
+
+class TestInitializeRepository:
+    def test_commit_matches_the_files(self, tmp_path):
+        (tmp_path / "src").mkdir()
+        files = [("README.md", b"# hi\n"), ("src/app.js", b"console.log(1)\n")]
+        for path, data in files:
+            (tmp_path / path).write_bytes(data)
+
+        initialize_repository(tmp_path, files, GitCommit(author="Dev <dev@example.com>", message="Scaffold"))
+
+        assert _git(tmp_path, "log", "--format=%an <%ae>|%s") == "Dev <dev@example.com>|Scaffold\n"
+        assert _git(tmp_path, "ls-files").split() == ["README.md", "src/app.js"]
+        assert _git(tmp_path, "status", "--porcelain") == ""
+        assert _git(tmp_path, "symbolic-ref", "--short", "HEAD").strip() == "main"
+
+
+class TestBuilderGit:
+    def test_express_react_project(self, tmp_path):
+        spec = ProjectSpec.from_dict({
+            "name": "gitted", "backend_stack": "Express", "frontend_stack": "React", "output_path": str(tmp_path),
+        })
+        spec.create_builder(install=False, git=GitCommit(author="Dev <dev@example.com>")).build()
+        project = tmp_path / "gitted"
+
+        ignore = (project / ".gitignore").read_text().splitlines()
+        assert ignore == list(dict.fromkeys([*COMMON_IGNORES, "/server/node_modules/", "/server/.env",
+                                             "/frontend/node_modules/", "/frontend/dist/"]))
+        tracked = _git(project, "ls-files").split()
+        assert {".gitignore", "server/package.json", "frontend/package.json"} <= set(tracked)
+        assert not [path for path in tracked if path.startswith(".skelly/")]
+        assert _git(project, "status", "--porcelain") == ""
+
+    def test_existing_repository_is_left_alone(self, tmp_path):
+        spec = ProjectSpec.from_dict({"name": "twice", "backend_stack": "Django", "output_path": str(tmp_path)})
+        spec.create_builder(install=False, git=GitCommit()).build()
+        spec.create_builder(install=False, git=GitCommit()).build()
+        assert len(_git(tmp_path / "twice", "log", "--format=%H").split()) == 1
+
+
+def test_gitignore_drops_duplicates():
+    assert gitignore(["*.pyc", "*.pyc"]).splitlines().count("*.pyc") == 1
@@ -0,0 +1,184 @@
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+from skelly.core.builder import ProjectBuilder
+from skelly.core.install_queue import DONE, FAILED, PENDING, RUNNING, InstallQueue, InstallWorker
+from skelly.core.installer import InstallStep
+from skelly.strategies.architecture import LayeredArchitecture
+from skelly.strategies.backend import ExpressBackend
+from skelly.strategies.frontend import ReactFrontend
+
+# Appends "<timestamp> +1" on start and "<timestamp> -1" on exit to the log file in argv[1].
+TRACKED_SLEEP = (
+    "import sys, time\n"
+    "log = open(sys.argv[1], 'a')\n"
+    "log.write(f'{time.time()} 1\\n'); log.flush()\n"
+    "time.sleep(0.3)\n"
+    "log.write(f'{time.time()} -1\\n'); log.flush()\n"
+)
+
+# Fails on the first run and succeeds once the marker file in argv[1] exists.
+FLAKY = (
+    "import os, sys\n"
+    "if not os.path.exists(sys.argv[1]):\n"
+    "    open(sys.argv[1], 'w').close()\n"
+    "    sys.exit(1)\n"
+)
+
+
+def _step(cwd: Path, code: str, *args: str, ecosystem: str = "npm", label: str = "server") -> InstallStep:
+    return InstallStep(label=label, cmd=(sys.executable, "-c", code, *args), cwd=cwd, ecosystem=ecosystem)
+
+
+def _max_overlap(log: Path) -> int:
+    events = sorted(
+        (float(stamp), int(delta))
+        for stamp, delta in (line.split() for line in log.read_text().splitlines())
+    )
+    current = peak = 0
+    for _, delta in events:
+        current += delta
+        peak = max(peak, current)
+    return peak
+
+
+@pytest.fixture
+def queue(tmp_path):
+    return InstallQueue(tmp_path / "queue.json")
+
+
+class TestInstallQueue:
+    def test_enqueue_persists_jobs(self, queue, tmp_path):
+        step = _step(tmp_path, "pass")
+        queue.enqueue(tmp_path, [[step], []])
+        jobs = InstallQueue(queue.path).jobs()
+        assert len(jobs) == 1
+        assert jobs[0].steps == [step]
+        assert jobs[0].status == PENDING
+        assert json.loads(queue.path.read_text())["version"] == 1
+
+    def test_claim_marks_job_running(self, queue, tmp_path):
+        queue.enqueue(tmp_path, [[_step(tmp_path, "pass")]])
+        job = queue.claim()
+        assert job.status == RUNNING
+        assert job.attempts == 1
+        assert queue.claim() is None
+        assert queue.counts()[RUNNING] == 1
+
+    def test_claim_skips_excluded_ecosystems(self, queue, tmp_path):
+        queue.enqueue(tmp_path, [
+            [_step(tmp_path, "pass", ecosystem="maven")],
+            [_step(tmp_path, "pass", ecosystem="npm")],
+        ])
+        assert queue.claim({"maven"}).ecosystem == "npm"
+
+    def test_failed_job_is_retried_then_fails(self, queue, tmp_path):
+        queue.enqueue(tmp_path, [[_step(tmp_path, "pass")]])
+        job = queue.claim()
+        job = queue.finish(job.id, False, 1.0, "boom", retries=1, backoff=0)
+        assert job.status == PENDING
+        job = queue.claim()
+        job = queue.finish(job.id, False, 1.0, "boom", retries=1, backoff=0)
+        assert job.status == FAILED
+        assert job.error == "boom"
+
+    def test_retry_backoff_delays_claim(self, queue, tmp_path):
+        queue.enqueue(tmp_path, [[_step(tmp_path, "pass")]])
+        job = queue.claim()
+        queue.finish(job.id, False, 1.0, "boom", retries=1, backoff=60)
+        assert queue.claim() is None
+        assert queue.next_retry_delay() > 50
+
+    def test_requeue_stale_jobs(self, queue, tmp_path):
+        queue.enqueue(tmp_path, [[_step(tmp_path, "pass")]])
+        queue.claim()
+        # The claiming process is still alive.
+        assert queue.requeue_stale() == 0
+        with queue._transaction() as jobs:
+            jobs[0].worker = 2 ** 22 + 12345
+        assert queue.requeue_stale() == 1
+        assert queue.counts()[PENDING] == 1
+
+    def test_retry_failed_and_remove(self, queue, tmp_path):
+        queue.enqueue(tmp_path, [[_step(tmp_path, "pass")], [_step(tmp_path, "pass")]])
+        queue.finish(queue.claim().id, False, 1.0, "boom", retries=0)
+        queue.finish(queue.claim().id, True, 1.0, None, retries=0)
+        assert queue.remove({DONE}) == 1
+        assert queue.retry_failed() == 1
+        assert queue.jobs()[0].attempts == 0
+
+
+class TestInstallWorker:
+    def test_drains_queue(self, queue, tmp_path):
+        queue.enqueue(tmp_path, [[_step(tmp_path, "pass")], [_step(tmp_path, "pass", label="frontend")]])
+        stats = InstallWorker(queue).run()
+        assert stats == {DONE: 2, FAILED: 0}
+        assert queue.counts()[DONE] == 2
+
+    def test_respects_ecosystem_limit(self, queue, tmp_path):
+        maven_log, npm_log = tmp_path / "maven.log", tmp_path / "npm.log"
+        for _ in range(4):
+            queue.enqueue(tmp_path, [
+                [_step(tmp_path, TRACKED_SLEEP, str(maven_log), ecosystem="maven")],
+                [_step(tmp_path, TRACKED_SLEEP, str(npm_log), ecosystem="npm")],
+            ])
+        stats = InstallWorker(queue, concurrency=6, limits={"maven": 2, "npm": 4}).run()
+        assert stats[DONE] == 8
+        assert _max_overlap(maven_log) <= 2
+        assert _max_overlap(npm_log) <= 4
+
+    def test_waits_instead_of_polling_a_full_ecosystem(self, queue, tmp_path, monkeypatch):
+        log = tmp_path / "maven.log"
+        queue.enqueue(tmp_path, [[_step(tmp_path, TRACKED_SLEEP, str(log), ecosystem="maven")] for _ in range(2)])
+        saves = []
+        save = InstallQueue._save
+        monkeypatch.setattr(InstallQueue, "_save", lambda self, jobs: saves.append(1) or save(self, jobs))
+        assert InstallWorker(queue, limits={"maven": 1}).run()[DONE] == 2
+        # One claim and one finish per job, plus nothing while the second job waits.
+        assert len(saves) <= 4
+
+    def test_respects_concurrency(self, queue, tmp_path):
+        log = tmp_path / "all.log"
+        for _ in range(4):
+            queue.enqueue(tmp_path, [[_step(tmp_path, TRACKED_SLEEP, str(log))]])
+        InstallWorker(queue, concurrency=1).run()
+        assert _max_overlap(log) == 1
+
+    def test_retries_failed_job(self, queue, tmp_path):
+        queue.enqueue(tmp_path, [[_step(tmp_path, FLAKY, str(tmp_path / "marker"))]])
+        stats = InstallWorker(queue, retries=1, backoff=0).run()
+        assert stats == {DONE: 1, FAILED: 0}
+        assert queue.jobs()[0].attempts == 2
+
+    def test_gives_up_after_retries(self, queue, tmp_path):
+        queue.enqueue(tmp_path, [[_step(tmp_path, "raise SystemExit(2)")]])
+        stats = InstallWorker(queue, retries=1, backoff=0).run()
+        assert stats == {DONE: 0, FAILED: 1}
+        job = queue.jobs()[0]
+        assert job.status == FAILED
+        assert "exited with 2" in job.error
+
+    def test_invalid_concurrency(self, queue):
+        with pytest.raises(ValueError):
+            InstallWorker(queue, concurrency=0)
+
+
+class TestDeferredInstall:
+    def test_build_enqueues_instead_of_installing(self, tmp_path, monkeypatch):
+        queue_path = tmp_path / "queue.json"
+        monkeypatch.setenv("SKELLY_INSTALL_QUEUE", str(queue_path))
+        monkeypatch.chdir(tmp_path)
+        builder = ProjectBuilder(defer_install=True)
+        builder.set_meta_data("deferred")\
+               .with_architecture_strategy(LayeredArchitecture())\
+               .with_backend_strategy(ExpressBackend())\
+               .with_frontend_strategy(ReactFrontend())
+        builder.build()
+
+        jobs = InstallQueue(queue_path).jobs()
+        assert sorted(job.steps[0].label for job in jobs) == ["frontend", "server"]
+        assert all(job.steps[0].cwd.is_absolute() for job in jobs)
+        assert not (tmp_path / "deferred" / "server" / "node_modules").exists()
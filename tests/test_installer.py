@@ -0,0 +1,123 @@
+import sys
+import time
+
+from skelly.core.builder import ProjectBuilder
+from skelly.core.events import InstallOutput, subscribed
+from skelly.core.installer import InstallRunner, InstallStep
+from skelly.strategies.backend import ExpressBackend
+from skelly.strategies.frontend import ReactFrontend
+
+
+def _python_step(tmp_path, label: str, code: str, **kwargs) -> InstallStep:
+    return InstallStep(label=label, cmd=(sys.executable, "-c", code), cwd=tmp_path, ecosystem="pip", **kwargs)
+
+
+class TestInstallRunner:
+    def test_successful_step(self, tmp_path):
+        results = InstallRunner().run([[_python_step(tmp_path, "server", "pass")]])
+        assert len(results) == 1
+        assert results[0].ok
+        assert results[0].returncode == 0
+        assert results[0].duration > 0
+
+    def test_output_is_tagged_with_label(self, tmp_path):
+        events = []
+        with subscribed(events.append):
+            InstallRunner().run([[_python_step(tmp_path, "server", "print('hello'); import sys; print('oops', file=sys.stderr)")]])
+        lines = [event for event in events if isinstance(event, InstallOutput)]
+        assert InstallOutput("server", "hello") in lines
+        assert InstallOutput("server", "oops") in lines
+
+    def test_line_longer_than_the_stream_limit(self, tmp_path):
+        events = []
+        code = "print('x' * 300_000); print('done', end='')"
+        with subscribed(events.append):
+            [result] = InstallRunner().run([[_python_step(tmp_path, "server", code)]])
+        assert result.ok
+        lines = [event.line for event in events if isinstance(event, InstallOutput)]
+        assert "".join(lines[:-1]) == "x" * 300_000
+        assert lines[-1] == "done"
+
+    def test_runs_in_step_cwd(self, tmp_path):
+        events = []
+        with subscribed(events.append):
+            InstallRunner().run([[_python_step(tmp_path, "server", "import os; print(os.getcwd())")]])
+        assert InstallOutput("server", str(tmp_path)) in events
+
+    def test_sequences_run_concurrently(self, tmp_path):
+        sleep = "import time; time.sleep(0.5)"
+        start = time.perf_counter()
+        results = InstallRunner().run([
+            [_python_step(tmp_path, "server", sleep)],
+            [_python_step(tmp_path, "frontend", sleep)],
+        ])
+        elapsed = time.perf_counter() - start
+        assert all(result.ok for result in results)
+        assert elapsed < 0.95
+
+    def test_sequence_stops_at_first_failure(self, tmp_path):
+        results = InstallRunner().run([[
+            _python_step(tmp_path, "server", "raise SystemExit(3)"),
+            _python_step(tmp_path, "server", "pass"),
+        ]])
+        assert len(results) == 1
+        assert results[0].returncode == 3
+        assert not results[0].ok
+
+    def test_failure_does_not_stop_other_sequences(self, tmp_path):
+        results = InstallRunner().run([
+            [_python_step(tmp_path, "server", "raise SystemExit(1)")],
+            [_python_step(tmp_path, "frontend", "pass")],
+        ])
+        assert [result.ok for result in results] == [False, True]
+
+    def test_timeout_kills_step(self, tmp_path):
+        start = time.perf_counter()
+        results = InstallRunner(timeout=0.3).run([[_python_step(tmp_path, "server", "import time; time.sleep(10)")]])
+        assert time.perf_counter() - start < 5
+        assert results[0].timed_out
+        assert not results[0].ok
+
+    def test_step_timeout_overrides_runner_default(self, tmp_path):
+        step = _python_step(tmp_path, "server", "import time; time.sleep(10)", timeout=0.3)
+        results = InstallRunner(timeout=60).run([[step]])
+        assert results[0].timed_out
+
+    def test_missing_command(self, tmp_path):
+        step = InstallStep(label="server", cmd=("skelly-no-such-tool",), cwd=tmp_path, ecosystem="npm")
+        results = InstallRunner().run([[step]])
+        assert not results[0].ok
+        assert "command not found" in results[0].error
+
+    def test_no_steps(self):
+        assert InstallRunner().run([[], []]) == []
+
+
+class TestInstallSteps:
+    def test_backend_steps(self, tmp_path):
+        steps = ExpressBackend().get_install_steps(tmp_path)
+        assert [step.cmd for step in steps] == [("npm", "install")]
+        assert steps[0].cwd == tmp_path / "server"
+        assert steps[0].label == "server"
+
+    def test_frontend_steps(self, tmp_path):
+        steps = ReactFrontend().get_install_steps(tmp_path)
+        assert steps[0].cwd == tmp_path / "frontend"
+        assert steps[0].ecosystem == "npm"
+
+    def test_builder_installs_backend_and_frontend_concurrently(self, tmp_path, monkeypatch):
+        sleep = "import time; time.sleep(0.5)"
+        monkeypatch.setattr(
+            ExpressBackend, "get_install_steps",
+            lambda self, base, libraries=(): [_python_step(base, "server", sleep)],
+        )
+        monkeypatch.setattr(
+            ReactFrontend, "get_install_steps",
+            lambda self, base, libraries=(): [_python_step(base, "frontend", sleep)],
+        )
+        builder = ProjectBuilder()
+        builder.with_backend_strategy(ExpressBackend()).with_frontend_strategy(ReactFrontend())
+        start = time.perf_counter()
+        results = builder._install_dependencies(tmp_path, builder._create_config())
+        assert time.perf_counter() - start < 0.95
+        assert sorted(result.step.label for result in results) == ["frontend", "server"]
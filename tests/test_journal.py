@@ -0,0 +1,133 @@
+import json
+import os
+import sys
+
+from skelly.core.builder import ProjectBuilder
+from skelly.core.events import FileWritten, Message, subscribed
+from skelly.core.installer import InstallRunner, InstallStep
+from skelly.core.journal import JOURNAL_PATH, StepJournal, install_key
+from skelly.strategies.architecture import LayeredArchitecture
+from skelly.strategies.backend import ExpressBackend
+
+
+def _step(cwd, label: str, code: str) -> InstallStep:
+    return InstallStep(label=label, cmd=(sys.executable, "-c", code), cwd=cwd, ecosystem="pip")
+
+
+def _touch(name: str) -> str:
+    """Install step code that appends to a counter file in the working directory."""
+    return f"open({name!r}, 'a').write('x')"
+
+
+def _builder(tmp_path, monkeypatch, steps, **options) -> ProjectBuilder:
+    monkeypatch.setattr(ExpressBackend, "get_install_steps", lambda self, base, libraries=(): steps(base / "server"))
+    builder = ProjectBuilder(**options)
+    builder.set_meta_data("journaled")\
+           .set_output_path(str(tmp_path))\
+           .set_architecture("Layered Architecture")\
+           .with_architecture_strategy(LayeredArchitecture())\
+           .with_backend_strategy(ExpressBackend())
+    return builder
+
+
+class TestStepJournal:
+    def test_done_only_when_resuming(self, tmp_path):
+        StepJournal(tmp_path).record(("folders", "abc"))
+        assert not StepJournal(tmp_path).done("folders", "abc")
+        assert StepJournal(tmp_path, resume=True).done("folders", "abc")
+        assert not StepJournal(tmp_path, resume=True).done("folders", "changed")
+
+    def test_forgotten_step_is_incomplete(self, tmp_path):
+        journal = StepJournal(tmp_path)
+        journal.record(("install:server", "abc"))
+        journal.forget("install:server")
+        assert not StepJournal(tmp_path, resume=True).done("install:server", "abc")
+
+    def test_corrupt_journal_is_ignored(self, tmp_path):
+        (tmp_path / ".skelly").mkdir()
+        (tmp_path / JOURNAL_PATH).write_text("{not json")
+        assert StepJournal(tmp_path, resume=True).steps == {}
+
+
+class TestResume:
+    def test_build_records_every_step(self, tmp_path, monkeypatch):
+        _builder(tmp_path, monkeypatch, lambda cwd: [_step(cwd, "server", _touch("installed"))]).build()
+        steps = json.loads((tmp_path / "journaled" / JOURNAL_PATH).read_text())["steps"]
+        assert {"root", "folders", "files:Express.js"} <= set(steps)
+        assert any(key.startswith("install:server:") for key in steps)
+
+    def test_resume_continues_after_the_completed_steps(self, tmp_path, monkeypatch):
+        server = tmp_path / "journaled" / "server"
+
+        def steps(cwd):
+            return [_step(cwd, "server", _touch("first")), _step(cwd, "server", "raise SystemExit(1)")]
+
+        _builder(tmp_path, monkeypatch, steps).build()
+        assert (server / "first").read_text() == "x"
+
+        def fixed(cwd):
+            return [_step(cwd, "server", _touch("first")), _step(cwd, "server", _touch("second"))]
+
+        events = []
+        with subscribed(events.append):
+            _builder(tmp_path, monkeypatch, fixed, resume=True).build()
+        assert (server / "first").read_text() == "x"
+        assert (server / "second").read_text() == "x"
+        assert not [event for event in events if isinstance(event, FileWritten)]
+        assert any(isinstance(event, Message) and "skipped" in event.text for event in events)
+
+    def test_without_resume_every_step_runs_again(self, tmp_path, monkeypatch):
+        def steps(cwd):
+            return [_step(cwd, "server", _touch("count"))]
+
+        _builder(tmp_path, monkeypatch, steps).build()
+        _builder(tmp_path, monkeypatch, steps).build()
+        assert (tmp_path / "journaled" / "server" / "count").read_text() == "xx"
+
+    def test_changed_inputs_are_redone(self, tmp_path, monkeypatch):
+        def steps(cwd):
+            return [_step(cwd, "server", _touch("count"))]
+
+        _builder(tmp_path, monkeypatch, steps).build()
+        events = []
+        with subscribed(events.append):
+            _builder(tmp_path, monkeypatch, steps, resume=True).add_backend_libraries(["cors"]).build()
+        written = {event.path for event in events if isinstance(event, FileWritten)}
+        assert "server/package.json" in written
+        # The install's dependency file changed, so it ran again.
+        assert (tmp_path / "journaled" / "server" / "count").read_text() == "xx"
+
+    def test_completed_npm_install_is_not_redone(self, tmp_path, monkeypatch):
+        # A stand-in npm that logs its arguments and, like npm install, writes the lockfile.
+        bin_dir = tmp_path / "bin"
+        bin_dir.mkdir()
+        npm = bin_dir / "npm"
+        npm.write_text(
+            f"#!{sys.executable}\n"
+            "import os, sys\n"
+            "open(os.environ['NPM_LOG'], 'a').write(' '.join(sys.argv[1:]) + '\\n')\n"
+            "open('package-lock.json', 'w').write('{\"lockfileVersion\": 3}')\n"
+        )
+        npm.chmod(0o755)
+        monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
+        monkeypatch.setenv("NPM_LOG", str(tmp_path / "npm.log"))
+        monkeypatch.setenv("SKELLY_NODE_CACHE", "0")
+        monkeypatch.setenv("SKELLY_LOCKFILES", "0")
+
+        def build(**options):
+            ProjectBuilder(**options).set_meta_data("journaled").set_output_path(str(tmp_path))\
+                .with_architecture_strategy(LayeredArchitecture()).with_backend_strategy(ExpressBackend()).build()
+
+        build()
+        build(resume=True)
+        assert (tmp_path / "npm.log").read_text() == "install\n"
+
+    def test_runner_skips_only_the_leading_completed_steps(self, tmp_path):
+        journal = StepJournal(tmp_path)
+        first, second = _step(tmp_path, "server", _touch("a")), _step(tmp_path, "server", _touch("b"))
+        InstallRunner(journal=journal).run([[first, second]])
+        journal.forget(install_key(first, 0))
+
+        results = InstallRunner(journal=StepJournal(tmp_path, resume=True)).run([[first, second]])
+        assert [result.resumed for result in results] == [False, False]
+        assert (tmp_path / "a").read_text() == (tmp_path / "b").read_text() == "xx"
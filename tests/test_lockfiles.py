@@ -0,0 +1,208 @@
+import base64
+import hashlib
+import io
+import json
+import shutil
+import tarfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import unquote
+
+import pytest
+
+from skelly.core.installer import InstallRunner
+from skelly.core.lockfiles import LOCKFILE, LockfileStore, install_command
+from skelly.core.models import ProjectConfig
+from skelly.core.plan import BuildPlan
+from skelly.core.versions import VersionIndex
+from skelly.strategies.backend import ExpressBackend
+
+needs_npm = pytest.mark.skipif(shutil.which("npm") is None, reason="npm is not installed")
+
+
+def _tarball(name: str, version: str, dependencies: dict) -> bytes:
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode="w:gz") as archive:
+        for member, content in {
+            "package/package.json": json.dumps({"name": name, "version": version, "dependencies": dependencies}),
+            "package/index.js": f"module.exports = {json.dumps(name + '@' + version)};\n",
+        }.items():
+            data = content.encode()
+            info = tarfile.TarInfo(member)
+            info.size = len(data)
+            archive.addfile(info, io.BytesIO(data))
+    return buffer.getvalue()
+
+
+class StandInRegistry:
+    """
+    npm registry stand-in serving packuments and tarballs over HTTP.
+    Every packument request sleeps for `latency` seconds, like a registry
+    round trip; tarball downloads are served immediately.
+    """
+
+    def __init__(self, latency: float = 0.05):
+        self.latency = latency
+        self.packuments: dict[str, dict] = {}
+        self.tarballs: dict[str, bytes] = {}
+        self.requests: list[str] = []
+        registry = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                path = unquote(self.path).lstrip("/")
+                registry.requests.append(path)
+                if path in registry.tarballs:
+                    body, content_type = registry.tarballs[path], "application/octet-stream"
+                elif path in registry.packuments:
+                    time.sleep(registry.latency)
+                    body, content_type = json.dumps(registry.packuments[path]).encode(), "application/json"
+                else:
+                    self.send_error(404)
+                    return
+                self.send_response(200)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_port}/"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def publish(self, name: str, version: str, dependencies: dict | None = None) -> None:
+        data = _tarball(name, version, dependencies or {})
+        tarball = f"{name}/-/{name}-{version}.tgz"
+        self.tarballs[tarball] = data
+        packument = self.packuments.setdefault(name, {"name": name, "dist-tags": {}, "versions": {}})
+        packument["dist-tags"]["latest"] = version
+        packument["versions"][version] = {
+            "name": name,
+            "version": version,
+            "dependencies": dependencies or {},
+            "dist": {
+                "tarball": self.url + tarball,
+                "shasum": hashlib.sha1(data).hexdigest(),
+                "integrity": "sha512-" + base64.b64encode(hashlib.sha512(data).digest()).decode(),
+            },
+        }
+
+    def close(self) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+
+
+@pytest.fixture
+def registry(tmp_path, monkeypatch):
+    registry = StandInRegistry()
+    registry.publish("express", "4.18.2", {"body-parser": "^1.20.0", "debug": "^2.6.9"})
+    registry.publish("body-parser", "1.20.2", {"debug": "^2.6.9"})
+    registry.publish("debug", "2.6.9", {"ms": "^2.0.0"})
+    registry.publish("ms", "2.0.0")
+    registry.publish("helmet", "7.1.0")
+    for name, value in {
+        "registry": registry.url,
+        "cache": str(tmp_path / "npm-cache"),
+        "userconfig": str(tmp_path / "npmrc"),
+        "audit": "false",
+        "fund": "false",
+        "update_notifier": "false",
+    }.items():
+        monkeypatch.setenv(f"npm_config_{name}", value)
+    yield registry
+    registry.close()
+
+
+@pytest.fixture
+def store(tmp_path):
+    return LockfileStore(tmp_path / "lockfiles")
+
+
+def _config() -> ProjectConfig:
+    return ProjectConfig(name="api", frontend_stack="None", backend_stack="Express", backend_libraries=("helmet",))
+
+
+def _generate(backend: ExpressBackend, target) -> BuildPlan:
+    """Write the planned package files of an Express project into target."""
+    plan = BuildPlan()
+    backend.create_config_files(_config(), plan)
+    for planned in plan.files:
+        path = target / planned.path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(planned.render())
+    return plan
+
+
+def _lock(packages: dict, version: int = 3) -> dict:
+    return {"name": "x", "version": "1.0.0", "lockfileVersion": version, "requires": True, "packages": packages}
+
+
+PACKAGE = {"name": "old-name", "version": "0.1.0", "dependencies": {"ms": "^2.0.0"}}
+
+
+class TestLockfileStore:
+    def _project(self, path, package, lock):
+        path.mkdir(parents=True)
+        (path / "package.json").write_text(json.dumps(package))
+        (path / LOCKFILE).write_text(json.dumps(lock))
+        return path
+
+    def test_save_and_assemble(self, store, tmp_path):
+        entry = {"version": "2.0.0", "resolved": "https://registry.example/ms-2.0.0.tgz", "integrity": "sha512-x"}
+        project = self._project(tmp_path / "p", PACKAGE, _lock({"": {"name": "old-name"}, "node_modules/ms": entry}))
+        assert store.save(project)
+        assert not store.save(project)
+
+        package = {"name": "new-name", "version": "0.2.0", "scripts": {"start": "node ."}, "dependencies": {"ms": "^2.0.0"}}
+        lock = json.loads(store.lockfile_for(package))
+        assert lock["name"] == "new-name"
+        assert lock["packages"][""] == {"name": "new-name", "version": "0.2.0", "dependencies": {"ms": "^2.0.0"}}
+        assert lock["packages"]["node_modules/ms"] == entry
+
+    def test_miss_for_other_dependencies(self, store, tmp_path):
+        store.save(self._project(tmp_path / "p", PACKAGE, _lock({"node_modules/ms": {"version": "2.0.0"}})))
+        assert store.lockfile_for({"dependencies": {"ms": "^2.1.0"}}) is None
+
+    def test_local_packages_are_not_kept(self, store, tmp_path):
+        lock = _lock({"node_modules/lib": {"resolved": "../lib", "link": True}})
+        assert not store.save(self._project(tmp_path / "p", PACKAGE, lock))
+        assert store.lockfile_for(PACKAGE) is None
+
+    def test_project_without_lockfile(self, store, tmp_path):
+        (tmp_path / "package.json").write_text(json.dumps(PACKAGE))
+        assert not store.save(tmp_path)
+        assert install_command(tmp_path) == ("npm", "install")
+
+
+class TestExpressLockfile:
+    def test_no_lockfile_without_cached_graph(self, store, tmp_path):
+        plan = _generate(ExpressBackend(VersionIndex(), store), tmp_path)
+        assert "server/package-lock.json" not in {planned.path for planned in plan.files}
+        [step] = ExpressBackend(VersionIndex(), store).get_install_steps(tmp_path)
+        assert step.cmd == ("npm", "install")
+
+    @needs_npm
+    def test_install_then_ci_from_cached_graph(self, registry, store, tmp_path):
+        backend = ExpressBackend(VersionIndex({"npm": {"helmet": "7.1.0"}}), store)
+        runner = InstallRunner(timeout=120, lockfiles=store)
+
+        first = tmp_path / "first"
+        _generate(backend, first)
+        [install] = runner.run([backend.get_install_steps(first)])
+        assert install.ok and install.step.cmd == ("npm", "install")
+        assert any(not path.endswith(".tgz") for path in registry.requests)
+
+        # A newer release must not leak into projects that reuse the cached resolution.
+        registry.publish("debug", "2.6.10", {"ms": "^2.0.0"})
+        registry.requests.clear()
+        second = tmp_path / "second"
+        plan = _generate(backend, second)
+        assert "server/package-lock.json" in {planned.path for planned in plan.files}
+        [ci] = runner.run([backend.get_install_steps(second)])
+        assert ci.ok and ci.step.cmd == ("npm", "ci")
+        assert all(path.endswith(".tgz") for path in registry.requests)
+        assert json.loads((second / "server/node_modules/debug/package.json").read_text())["version"] == "2.6.9"
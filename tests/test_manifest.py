@@ -0,0 +1,98 @@
+import time
+
+from skelly.core.executor import PlanExecutor
+from skelly.core.manifest import MANIFEST_PATH, Manifest, hash_config
+from skelly.core.models import ProjectConfig
+from skelly.core.output import FileSystemOutput
+from skelly.core.plan import BuildPlan
+from skelly.core.spec import ProjectSpec
+
+
+def _plan(content="export default {}"):
+    plan = BuildPlan()
+    plan.add_folder("server/src/models")
+    plan.add_file("server/src/config/index.js", content)
+    plan.add_file("server/README.md", "# Server")
+    return plan
+
+
+def _snapshot(root):
+    return {
+        path.relative_to(root).as_posix(): path.stat().st_mtime_ns
+        for path in root.rglob("*") if path.is_file()
+    }
+
+
+class TestHashConfig:
+    def test_ignores_output_path(self):
+        a = ProjectConfig(name="x", frontend_stack="React", backend_stack="Java", output_path="/a")
+        b = ProjectConfig(name="x", frontend_stack="React", backend_stack="Java", output_path="/b")
+        assert hash_config(a) == hash_config(b)
+
+    def test_changes_with_libraries(self):
+        a = ProjectConfig(name="x", frontend_stack="React", backend_stack="Java")
+        b = ProjectConfig(name="x", frontend_stack="React", backend_stack="Java", backend_libraries=("lombok",))
+        assert hash_config(a) != hash_config(b)
+
+
+class TestIncrementalApply:
+    def test_first_apply_writes_manifest(self, tmp_path):
+        result = PlanExecutor(workers=1).apply(_plan(), tmp_path, config_hash="abc")
+
+        manifest = Manifest.load(FileSystemOutput(tmp_path))
+        assert result.manifest_written
+        assert manifest.config_hash == "abc"
+        assert set(manifest.files) == {"server/README.md", "server/src/config/index.js", "server/src/models/.gitkeep"}
+
+    def test_noop_rerun_touches_nothing(self, tmp_path):
+        PlanExecutor(workers=1).apply(_plan(), tmp_path, config_hash="abc")
+        before = _snapshot(tmp_path)
+        time.sleep(0.01)
+
+        result = PlanExecutor().apply(_plan(), tmp_path, config_hash="abc")
+
+        assert result.written == []
+        assert not result.manifest_written
+        assert _snapshot(tmp_path) == before
+
+    def test_changed_content_is_rewritten(self, tmp_path):
+        PlanExecutor(workers=1).apply(_plan(), tmp_path)
+        result = PlanExecutor(workers=1).apply(_plan("export default { port: 1 }"), tmp_path)
+
+        assert result.written == ["server/src/config/index.js"]
+        assert (tmp_path / "server/src/config/index.js").read_text() == "export default { port: 1 }"
+
+    def test_user_modified_file_is_kept(self, tmp_path):
+        PlanExecutor(workers=1).apply(_plan(), tmp_path)
+        (tmp_path / "server/README.md").write_text("# My notes")
+
+        result = PlanExecutor(workers=1).apply(_plan("export default { port: 1 }"), tmp_path)
+        again = PlanExecutor(workers=1).apply(_plan("export default { port: 1 }"), tmp_path)
+
+        assert result.user_modified == ["server/README.md"]
+        assert again.user_modified == ["server/README.md"]
+        assert (tmp_path / "server/README.md").read_text() == "# My notes"
+
+    def test_untracked_existing_file_is_kept_when_manifest_exists(self, tmp_path):
+        PlanExecutor(workers=1).apply(_plan(), tmp_path)
+        (tmp_path / "server/NOTES.md").write_text("mine")
+        plan = _plan()
+        plan.add_file("server/NOTES.md", "generated")
+
+        result = PlanExecutor(workers=1).apply(plan, tmp_path)
+
+        assert result.user_modified == ["server/NOTES.md"]
+        assert (tmp_path / "server/NOTES.md").read_text() == "mine"
+
+    def test_noop_rerun_of_java_hexagonal_project(self, tmp_path):
+        spec = ProjectSpec.from_dict({
+            "name": "javahex", "backend_stack": "Java", "architecture": "hexagonal", "output_path": str(tmp_path),
+        })
+        spec.create_builder(install=False).build()
+        project = tmp_path / "javahex"
+        before = _snapshot(project)
+        assert (project / MANIFEST_PATH).exists()
+
+        spec.create_builder(install=False).build()
+
+        assert _snapshot(project) == before
@@ -0,0 +1,129 @@
+import pytest
+
+from skelly.core.exceptions import DependencyInstallError
+from skelly.core.maven_repo import Coordinate, MavenRepository
+from skelly.core.models import BackendStack, ProjectConfig
+from skelly.core.plan import BuildPlan
+from skelly.core.workspace import Workspace, WorkspaceMember
+from skelly.factories.backend_factory import BackendFactory
+from skelly.strategies.architecture import LayeredArchitecture
+from skelly.strategies.backend import JavaSpringBackend
+
+JAVA_LIBRARIES = BackendFactory.get_library_names(BackendStack.JAVA)
+
+
+def _stand_in_repo(path, coordinates):
+    """File-based Maven repository with a POM and JAR per artifact plus one transitive dependency."""
+    for coordinate in [*coordinates, Coordinate("org.slf4j", "slf4j-api", "2.0.9")]:
+        pom = path / coordinate.pom_path()
+        pom.parent.mkdir(parents=True, exist_ok=True)
+        pom.write_text(f"<project><artifactId>{coordinate.artifact_id}</artifactId></project>")
+        pom.with_suffix(".jar").write_bytes(b"PK")
+    return path
+
+
+def _files(plan: BuildPlan) -> dict:
+    return {planned.path: planned for planned in plan.files}
+
+
+def _config(libraries) -> ProjectConfig:
+    return ProjectConfig(
+        name="shop",
+        frontend_stack="None",
+        backend_stack="Java",
+        architecture="Layered Architecture",
+        backend_libraries=tuple(libraries),
+    )
+
+
+@pytest.fixture
+def repository(tmp_path):
+    return MavenRepository(tmp_path / "managed")
+
+
+@pytest.fixture
+def source(tmp_path):
+    artifacts = JavaSpringBackend("x").required_artifacts(JAVA_LIBRARIES)
+    return _stand_in_repo(tmp_path / "stand-in", artifacts)
+
+
+class TestCoordinate:
+    def test_parse(self):
+        assert Coordinate.parse("org.projectlombok:lombok:1.18.30") == Coordinate("org.projectlombok", "lombok", "1.18.30")
+
+    def test_parse_invalid(self):
+        with pytest.raises(ValueError):
+            Coordinate.parse("lombok")
+
+    def test_pom_path(self):
+        coordinate = Coordinate("org.projectlombok", "lombok", "1.18.30")
+        assert coordinate.pom_path() == "org/projectlombok/lombok/1.18.30/lombok-1.18.30.pom"
+
+
+class TestMavenRepository:
+    def test_prefetch_from_stand_in(self, repository, source):
+        backend = JavaSpringBackend("x", repository)
+        artifacts = backend.prefetch(JAVA_LIBRARIES, source=source)
+        assert repository.has_closure(artifacts)
+        assert (repository.path / "org/slf4j/slf4j-api/2.0.9/slf4j-api-2.0.9.jar").exists()
+
+    def test_prefetch_with_missing_artifact(self, repository, tmp_path):
+        source = _stand_in_repo(tmp_path / "partial", [])
+        with pytest.raises(DependencyInstallError, match="spring-boot-starter-parent"):
+            JavaSpringBackend("x", repository).prefetch(JAVA_LIBRARIES, source=source)
+        assert repository.prefetched() == set()
+
+    def test_prefetch_from_missing_directory(self, repository, tmp_path):
+        with pytest.raises(DependencyInstallError):
+            JavaSpringBackend("x", repository).prefetch(JAVA_LIBRARIES, source=tmp_path / "nope")
+
+    def test_closure_requires_artifacts_on_disk(self, repository, source):
+        artifacts = JavaSpringBackend("x", repository).prefetch(JAVA_LIBRARIES, source=source)
+        (repository.path / artifacts[-1].pom_path()).unlink()
+        assert not repository.has_closure(artifacts)
+
+    def test_offline_args(self, repository):
+        assert repository.offline_args() == ("-o", f"-Dmaven.repo.local={repository.path.resolve()}")
+
+
+class TestJavaOfflineInstall:
+    def test_online_without_prefetch(self, repository, tmp_path):
+        backend = JavaSpringBackend("shop", repository)
+        [step] = backend.get_install_steps(tmp_path, ("lombok",))
+        assert step.cmd == ("mvn", "install", "-DskipTests")
+
+    def test_offline_after_prefetch(self, repository, source, tmp_path):
+        backend = JavaSpringBackend("shop", repository)
+        backend.prefetch(JAVA_LIBRARIES, source=source)
+        [step] = backend.get_install_steps(tmp_path, ("lombok", "spring-boot-starter-security"))
+        assert step.cmd == ("mvn", *repository.offline_args(), "install", "-DskipTests")
+
+    def test_unprefetched_library_is_installed_online(self, repository, source, tmp_path):
+        backend = JavaSpringBackend("shop", repository)
+        backend.prefetch(["lombok"], source=source)
+        [step] = backend.get_install_steps(tmp_path, ("mapstruct",))
+        assert "-o" not in step.cmd
+
+    def test_generated_files_do_not_depend_on_the_host(self, repository, source):
+        backend = JavaSpringBackend("shop", repository)
+        backend.prefetch(JAVA_LIBRARIES, source=source)
+        plan = BuildPlan()
+        backend.create_config_files(_config(["lombok"]), plan)
+        assert not [path for path in _files(plan) if "/.mvn/" in path]
+        assert not [planned for planned in plan.files if str(repository.path) in planned.render()]
+
+    def test_workspace_builds_offline_only_when_every_module_is_prefetched(self, repository, source, tmp_path):
+        backend = JavaSpringBackend("shop", repository)
+        backend.prefetch(["lombok"], source=source)
+        members = [WorkspaceMember("orders", backend, libraries=("lombok",))]
+        config = _config([])
+
+        workspace = Workspace(members)
+        workspace.plan(config, LayeredArchitecture())
+        [[step]] = workspace.install_steps(tmp_path, config)
+        assert step.cmd == ("mvn", *repository.offline_args(), "install", "-DskipTests")
+
+        workspace = Workspace([*members, WorkspaceMember("billing", backend, libraries=("mapstruct",))])
+        workspace.plan(config, LayeredArchitecture())
+        [[step]] = workspace.install_steps(tmp_path, config)
+        assert step.cmd == ("mvn", "install", "-DskipTests")
@@ -0,0 +1,138 @@
+import json
+import os
+import sys
+
+import pytest
+
+from skelly.core.installer import InstallRunner, InstallStep
+from skelly.core.node_cache import NodeModulesCache, dependency_key, format_size, parse_size
+
+# Stand-in for `npm install`: creates node_modules and counts its runs in argv[1].
+FAKE_NPM = (
+    "import os, sys\n"
+    "os.makedirs('node_modules/left-pad', exist_ok=True)\n"
+    "open('node_modules/left-pad/index.js', 'w').write('module.exports = 1;\\n')\n"
+    "open(sys.argv[1], 'a').write('run\\n')\n"
+)
+
+
+def _package(path, dependencies, **extra):
+    path.mkdir(parents=True, exist_ok=True)
+    (path / "package.json").write_text(json.dumps({"name": path.name, "dependencies": dependencies, **extra}))
+    return path
+
+
+def _node_modules(path, files: dict[str, str]):
+    for name, content in files.items():
+        target = path / "node_modules" / name
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_text(content)
+    return path / "node_modules"
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return NodeModulesCache(tmp_path / "cache")
+
+
+class TestDependencyKey:
+    def test_ignores_name_version_scripts_and_order(self):
+        a = {"name": "a", "version": "1.0.0", "scripts": {"x": "y"}, "dependencies": {"react": "1", "vite": "2"}}
+        b = {"name": "b", "dependencies": {"vite": "2", "react": "1"}}
+        assert dependency_key(a) == dependency_key(b)
+
+    def test_depends_on_dependencies(self):
+        assert dependency_key({"dependencies": {"react": "1"}}) != dependency_key({"dependencies": {"react": "2"}})
+        assert dependency_key({"dependencies": {"react": "1"}}) != dependency_key({"devDependencies": {"react": "1"}})
+
+    def test_key_for_without_package_json(self, cache, tmp_path):
+        assert cache.key_for(tmp_path) is None
+
+
+class TestSizes:
+    @pytest.mark.parametrize("text,expected", [("1024", 1024), ("2K", 2048), ("1.5M", 1572864), ("2GB", 2 * 1024 ** 3)])
+    def test_parse_size(self, text, expected):
+        assert parse_size(text) == expected
+
+    def test_parse_invalid_size(self):
+        with pytest.raises(ValueError):
+            parse_size("lots")
+
+    def test_format_size(self):
+        assert format_size(512) == "512 B"
+        assert format_size(1536) == "1.5 KiB"
+
+
+class TestNodeModulesCache:
+    def test_store_and_materialize(self, cache, tmp_path):
+        source = _node_modules(tmp_path / "a", {"react/index.js": "react", "vite/bin/vite.js": "vite"})
+        entry = cache.store("k1", source)
+        assert entry.size == len("react") + len("vite")
+
+        target = tmp_path / "b" / "node_modules"
+        assert cache.materialize("k1", target)
+        assert (target / "react" / "index.js").read_text() == "react"
+        assert (target / "vite" / "bin" / "vite.js").read_text() == "vite"
+
+    def test_materialize_uses_hardlinks(self, cache, tmp_path):
+        cache.store("k1", _node_modules(tmp_path / "a", {"react/index.js": "react"}))
+        target = tmp_path / "b" / "node_modules"
+        cache.materialize("k1", target)
+        cached = cache.root / "k1" / "node_modules" / "react" / "index.js"
+        assert os.path.samefile(cached, target / "react" / "index.js")
+
+    def test_miss(self, cache, tmp_path):
+        assert not cache.materialize("missing", tmp_path / "node_modules")
+        assert not (tmp_path / "node_modules").exists()
+
+    def test_store_existing_key_is_noop(self, cache, tmp_path):
+        cache.store("k1", _node_modules(tmp_path / "a", {"x.js": "1"}))
+        assert cache.store("k1", _node_modules(tmp_path / "b", {"x.js": "2"})) is None
+        assert len(cache.entries()) == 1
+
+    def test_lru_eviction(self, tmp_path):
+        cache = NodeModulesCache(tmp_path / "cache", max_bytes=25)
+        cache.store("old", _node_modules(tmp_path / "a", {"x.js": "x" * 10}))
+        cache.store("used", _node_modules(tmp_path / "b", {"x.js": "x" * 10}))
+        cache.materialize("old", tmp_path / "c" / "node_modules")
+        cache.store("new", _node_modules(tmp_path / "d", {"x.js": "x" * 10}))
+        assert sorted(entry.key for entry in cache.entries()) == ["new", "old"]
+
+    def test_prune(self, cache, tmp_path):
+        cache.store("k1", _node_modules(tmp_path / "a", {"x.js": "x" * 10}))
+        cache.store("k2", _node_modules(tmp_path / "b", {"x.js": "x" * 10}))
+        assert len(cache.prune(10)) == 1
+        assert len(cache.prune(0)) == 1
+        assert cache.entries() == []
+
+    def test_from_env(self, monkeypatch):
+        monkeypatch.setenv("SKELLY_NODE_CACHE_SIZE", "1M")
+        assert NodeModulesCache.from_env().max_bytes == 1024 ** 2
+        monkeypatch.setenv("SKELLY_NODE_CACHE", "0")
+        assert NodeModulesCache.from_env() is None
+
+
+class TestCachedInstall:
+    def _step(self, cwd, counter):
+        return InstallStep(label="frontend", cmd=(sys.executable, "-c", FAKE_NPM, str(counter)), cwd=cwd, ecosystem="npm")
+
+    def test_second_install_is_served_from_cache(self, cache, tmp_path):
+        counter = tmp_path / "runs.txt"
+        runner = InstallRunner(node_cache=cache)
+        first = _package(tmp_path / "one", {"left-pad": "1.3.0"})
+        second = _package(tmp_path / "two", {"left-pad": "1.3.0"})
+
+        [result] = runner.run([[self._step(first, counter)]])
+        assert result.ok and not result.cached
+        [result] = runner.run([[self._step(second, counter)]])
+        assert result.ok and result.cached
+
+        assert counter.read_text().count("run") == 1
+        assert (second / "node_modules" / "left-pad" / "index.js").exists()
+
+    def test_different_dependencies_miss(self, cache, tmp_path):
+        counter = tmp_path / "runs.txt"
+        runner = InstallRunner(node_cache=cache)
+        runner.run([[self._step(_package(tmp_path / "one", {"left-pad": "1.3.0"}), counter)]])
+        runner.run([[self._step(_package(tmp_path / "two", {"left-pad": "1.2.0"}), counter)]])
+        assert counter.read_text().count("run") == 2
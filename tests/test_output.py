@@ -0,0 +1,130 @@
+import io
+import tarfile
+import zipfile
+
+import pytest
+
+from skelly.core.output import (
+    FileSystemOutput,
+    MemoryOutput,
+    TarStreamOutput,
+    ZipStreamOutput,
+    archive_format_for,
+    open_archive,
+)
+from skelly.core.spec import ProjectSpec
+
+
+class WriteOnlyStream:
+    """Mimics a pipe such as stdout: no seek, no tell."""
+
+    def __init__(self):
+        self._buffer = io.BytesIO()
+
+    def write(self, data):
+        return self._buffer.write(data)
+
+    def flush(self):
+        pass
+
+    def getvalue(self):
+        return self._buffer.getvalue()
+
+
+def _spec(tmp_path):
+    return ProjectSpec.from_dict({
+        "name": "archived",
+        "backend_stack": "Java",
+        "frontend_stack": "React",
+        "architecture": "hexagonal",
+        "output_path": str(tmp_path),
+    })
+
+
+def _disk_files(root):
+    return {
+        path.relative_to(root).as_posix(): path.read_bytes()
+        for path in root.rglob("*") if path.is_file() and ".skelly" not in path.parts
+    }
+
+
+class TestOutputBackends:
+    def test_memory_output_matches_disk_build(self, tmp_path):
+        spec = _spec(tmp_path)
+        spec.create_builder(install=False).build()
+        memory = MemoryOutput()
+        spec.create_builder(install=False).with_output(memory).build()
+
+        files = {path: data for path, data in memory.files.items() if not path.startswith(".skelly")}
+        assert files == _disk_files(tmp_path / "archived")
+
+    def test_tar_stream_is_byte_identical_to_disk_build(self, tmp_path):
+        spec = _spec(tmp_path)
+        spec.create_builder(install=False).build()
+        stream = WriteOnlyStream()
+        with TarStreamOutput(stream, prefix="archived") as output:
+            spec.create_builder(install=False).with_output(output).build()
+
+        with tarfile.open(fileobj=io.BytesIO(stream.getvalue()), mode="r:gz") as tar:
+            files = {
+                member.name.removeprefix("archived/"): tar.extractfile(member).read()
+                for member in tar.getmembers() if member.isfile()
+            }
+        assert files == _disk_files(tmp_path / "archived")
+
+    def test_zip_stream_is_byte_identical_to_disk_build(self, tmp_path):
+        spec = _spec(tmp_path)
+        spec.create_builder(install=False).build()
+        stream = WriteOnlyStream()
+        with ZipStreamOutput(stream, prefix="archived") as output:
+            spec.create_builder(install=False).with_output(output).build()
+
+        with zipfile.ZipFile(io.BytesIO(stream.getvalue())) as archive:
+            files = {
+                name.removeprefix("archived/"): archive.read(name)
+                for name in archive.namelist() if not name.endswith("/")
+            }
+        assert files == _disk_files(tmp_path / "archived")
+
+    def test_archive_members_are_the_plan(self, tmp_path):
+        builder = _spec(tmp_path).create_builder(install=False)
+        plan = builder.create_plan(builder._create_config())
+        stream = WriteOnlyStream()
+        with ZipStreamOutput(stream) as output:
+            _spec(tmp_path).create_builder(install=False).with_output(output).build()
+
+        with zipfile.ZipFile(io.BytesIO(stream.getvalue())) as archive:
+            names = archive.namelist()
+        assert sorted(name for name in names if not name.endswith("/")) == sorted(planned.path for planned in plan.files)
+        assert sorted(name[:-1] for name in names if name.endswith("/")) == sorted(plan.directories())
+
+    def test_tar_stream_adds_each_directory_once(self):
+        buffer = io.BytesIO()
+        with TarStreamOutput(buffer, prefix="p") as output:
+            output.make_dir("server/src")
+            output.make_dir("server/test")
+            output.write_file("server/src/a.txt", b"a")
+        with tarfile.open(fileobj=io.BytesIO(buffer.getvalue()), mode="r:gz") as tar:
+            assert tar.getnames() == ["p", "p/server", "p/server/src", "p/server/test", "p/server/src/a.txt"]
+
+    def test_filesystem_output_reads_back(self, tmp_path):
+        output = FileSystemOutput(tmp_path)
+        output.make_dir("a/b")
+        output.write_file("a/b/c.txt", b"data")
+        assert output.read_file("a/b/c.txt") == b"data"
+        assert output.stat("a/b/c.txt").st_size == 4
+        assert output.read_file("missing.txt") is None
+
+
+class TestArchiveFormats:
+    @pytest.mark.parametrize("path, expected", [
+        ("-", "tar.gz"),
+        ("project.tar.gz", "tar.gz"),
+        ("project.ZIP", "zip"),
+    ])
+    def test_format_from_path(self, path, expected):
+        assert archive_format_for(path) == expected
+
+    def test_unknown_format_raises(self):
+        with pytest.raises(ValueError, match="Unknown archive format"):
+            open_archive(io.BytesIO(), "rar")
@@ -0,0 +1,95 @@
+import pytest
+
+from skelly.core.pathset import MAX_PATHS, PathSet, count_braces, expand_braces, split_path, split_paths
+from skelly.strategies.architecture import CustomArchitecture
+
+
+class TestExpandBraces:
+    def test_cartesian_product(self):
+        assert expand_braces("services/{a,b}/src/{api,domain}") == [
+            "services/a/src/api",
+            "services/a/src/domain",
+            "services/b/src/api",
+            "services/b/src/domain",
+        ]
+
+    def test_nested_groups(self):
+        assert expand_braces("lib/{core,{web,cli}/adapters}") == ["lib/core", "lib/web/adapters", "lib/cli/adapters"]
+
+    def test_ranges(self):
+        assert expand_braces("v{1..3}") == ["v1", "v2", "v3"]
+        assert expand_braces("shard{08..10}") == ["shard08", "shard09", "shard10"]
+        assert expand_braces("{c..a}") == ["c", "b", "a"]
+
+    def test_group_without_alternatives_is_literal(self):
+        assert expand_braces("docs/{draft}") == ["docs/{draft}"]
+
+    def test_unbalanced(self):
+        with pytest.raises(ValueError, match="Unbalanced"):
+            expand_braces("services/{a,b")
+
+    @pytest.mark.parametrize("pattern", [
+        "services/{a,b}/src/{api,domain}", "lib/{core,{web,cli}/adapters}", "v{1..3}/{c..a}", "docs/{draft}/{x,y}",
+    ])
+    def test_count_matches_expansion(self, pattern):
+        assert count_braces(pattern) == len(expand_braces(pattern))
+
+    def test_limit(self):
+        assert len(expand_braces("s{1..10}", limit=10)) == 10
+        with pytest.raises(ValueError, match="more than 10 paths"):
+            expand_braces("s{1..11}", limit=10)
+
+    def test_huge_pattern_is_rejected_without_expanding(self):
+        with pytest.raises(ValueError, match=f"more than {MAX_PATHS} paths"):
+            expand_braces("{0..9}" * 100)
+
+
+class TestSplitPaths:
+    def test_commas_inside_braces_are_kept(self):
+        assert split_paths("src, services/{a,b}/src ,, utils") == ["src", "services/{a,b}/src", "utils"]
+
+
+class TestSplitPath:
+    def test_normalizes(self):
+        assert split_path("./src//api\\v1/") == ["src", "api", "v1"]
+
+    @pytest.mark.parametrize("path", ["/etc", "C:\\Windows", "../outside", "src/../../outside", "src/*", ".", ""])
+    def test_rejects(self, path):
+        with pytest.raises(ValueError):
+            split_path(path)
+
+
+class TestPathSet:
+    def test_dedupes_and_collapses_to_leaves(self):
+        paths = PathSet(["src/api", "src", "./src/api/", "src/domain/model", "utils"])
+        assert paths.leaves() == ["src/api", "src/domain/model", "utils"]
+        assert len(paths) == 5
+        assert "src/domain" in paths
+        assert "src/web" not in paths
+
+    def test_leaves_are_sorted_by_segment(self):
+        assert PathSet(["a-b/x", "a/z", "a/b"]).leaves() == ["a/b", "a/z", "a-b/x"]
+
+    def test_large_layout(self):
+        paths = PathSet(expand_braces("services/s{000..999}/{api,domain,infra,web,jobs}/m{0..19}"))
+        assert len(paths.leaves()) == 100_000
+
+
+class TestCustomArchitecture:
+    def test_expands_and_collapses(self):
+        strategy = CustomArchitecture(["services/{users,orders}/src/{api,domain}", "services", "services/users/src"])
+        assert strategy.get_folders() == [
+            "services/orders/src/api",
+            "services/orders/src/domain",
+            "services/users/src/api",
+            "services/users/src/domain",
+        ]
+
+    def test_rejects_traversal(self):
+        with pytest.raises(ValueError, match="must not leave the project"):
+            CustomArchitecture(["src", "../../etc"])
+
+    def test_caps_the_total_expansion(self):
+        half = f"s{{1..{MAX_PATHS // 2 + 1}}}"
+        with pytest.raises(ValueError, match="Custom folders expand to more than"):
+            CustomArchitecture([f"a/{half}", f"b/{half}"])
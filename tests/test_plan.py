@@ -0,0 +1,139 @@
+import pytest
+
+from skelly.core.executor import PlanExecutor
+from skelly.core.plan import BuildPlan, PlannedFile, normalize_path
+
+
+class TestNormalizePath:
+    def test_strips_dot_and_trailing_slash(self):
+        assert normalize_path("./server/src/") == "server/src"
+
+    def test_converts_backslashes(self):
+        assert normalize_path("server\\src\\main") == "server/src/main"
+
+    def test_rejects_empty(self):
+        with pytest.raises(ValueError, match="Invalid project path"):
+            normalize_path("./")
+
+
+class TestBuildPlan:
+    def test_directories_are_minimal(self):
+        plan = BuildPlan()
+        plan.add_folders(["server/src", "server/src/api", "server/src/api/routes", "frontend"])
+        assert plan.directories() == ["frontend", "server/src/api/routes"]
+
+    def test_file_parents_count_as_directories(self):
+        plan = BuildPlan()
+        plan.add_folder("server")
+        plan.add_file("server/src/index.js", "")
+        assert plan.directories() == ["server/src"]
+
+    def test_gitkeep_only_in_empty_folders(self):
+        plan = BuildPlan()
+        plan.add_folders(["server/src/config", "server/src/utils", "server/src"])
+        plan.add_file("server/src/config/index.js", "export {}")
+        paths = [f.path for f in plan.files]
+        assert paths == ["server/src/config/index.js", "server/src/utils/.gitkeep"]
+
+    def test_later_file_replaces_earlier(self):
+        plan = BuildPlan()
+        plan.add_file("a.txt", "old")
+        plan.add_file("./a.txt", "new")
+        assert [f.render() for f in plan.files] == ["new"]
+
+    def test_template_is_rendered_on_demand(self):
+        plan = BuildPlan()
+        plan.add_template(
+            "server/src/main/resources/application.properties",
+            "java_spring/application.properties.j2",
+            project_name="planned",
+        )
+        (planned,) = plan.files
+        assert planned.content is None
+        assert "spring.application.name=planned" in planned.render()
+
+
+class TestPlanExecutor:
+    def test_apply_writes_plan(self, tmp_path):
+        plan = BuildPlan()
+        plan.add_folders(["server/src/models", "server/src/config"])
+        plan.add_file("server/src/config/index.js", "export default {}")
+
+        PlanExecutor().apply(plan, tmp_path)
+
+        assert (tmp_path / "server/src/config/index.js").read_text() == "export default {}"
+        assert (tmp_path / "server/src/models/.gitkeep").exists()
+        assert not (tmp_path / "server/src/config/.gitkeep").exists()
+
+    def test_apply_with_thread_pool_matches_sequential(self, tmp_path):
+        plan = BuildPlan()
+        plan.add_folder("server/src/empty")
+        for i in range(20):
+            plan.add_file(f"server/src/module{i}/index.js", f"export const id = {i};")
+
+        PlanExecutor(workers=1).apply(plan, tmp_path / "sequential")
+        PlanExecutor(workers=8).apply(plan, tmp_path / "parallel")
+
+        for planned in plan.files:
+            sequential = (tmp_path / "sequential" / planned.path).read_text()
+            assert (tmp_path / "parallel" / planned.path).read_text() == sequential
+
+    def test_rejects_zero_workers(self):
+        with pytest.raises(ValueError, match="workers must be at least 1"):
+            PlanExecutor(workers=0)
+
+
+class TestStreamedFiles:
+    @staticmethod
+    def _plan(count: int) -> BuildPlan:
+        exports = [(f"Symbol{i}", f"Module{i}.js") for i in range(count)]
+        return BuildPlan().add_template("src/index.js", "express/hexagonal/entity/exports_index.js.j2", exports=exports)
+
+    def test_large_file_is_streamed_in_blocks(self, tmp_path, monkeypatch):
+        from skelly.core import template_renderer
+
+        monkeypatch.setattr(template_renderer, "STREAM_BLOCK", 64)
+        (planned,) = self._plan(500).files
+        blocks = list(planned.stream())
+        assert len(blocks) > 1
+        assert b"".join(blocks) == planned.render().encode()
+
+        result = PlanExecutor(stream_threshold=4096).apply(self._plan(500), tmp_path)
+        assert result.written == ["src/index.js"]
+        assert (tmp_path / "src/index.js").read_text() == planned.render()
+
+    def test_interrupted_stream_leaves_the_previous_file(self, tmp_path, monkeypatch):
+        executor = PlanExecutor(stream_threshold=1024)
+        executor.apply(self._plan(100), tmp_path)
+        before = (tmp_path / "src/index.js").read_bytes()
+
+        calls = []
+
+        def interrupted(self):
+            # The existing file is hashed from a first rendering; the second one, being written, is cut short.
+            calls.append(1)
+            yield b"x" * 2048
+            if len(calls) > 1:
+                raise KeyboardInterrupt
+            yield b"x" * 2048
+
+        with monkeypatch.context() as patch:
+            patch.setattr(PlannedFile, "stream", interrupted)
+            with pytest.raises(KeyboardInterrupt):
+                executor.apply(self._plan(120), tmp_path)
+        assert (tmp_path / "src/index.js").read_bytes() == before
+        assert sorted(path.name for path in (tmp_path / "src").iterdir()) == ["index.js"]
+        # Still recognised as generated, so the next run repairs it.
+        assert executor.apply(self._plan(120), tmp_path).written == ["src/index.js"]
+
+    def test_streamed_file_regeneration(self, tmp_path):
+        executor = PlanExecutor(stream_threshold=1024)
+        executor.apply(self._plan(100), tmp_path)
+        assert executor.apply(self._plan(100), tmp_path).unchanged == ["src/index.js"]
+
+        assert executor.apply(self._plan(120), tmp_path).written == ["src/index.js"]
+        assert "Symbol119" in (tmp_path / "src/index.js").read_text()
+
+        (tmp_path / "src/index.js").write_text("// mine\n")
+        assert executor.apply(self._plan(130), tmp_path).user_modified == ["src/index.js"]
+        assert (tmp_path / "src/index.js").read_text() == "// mine\n"
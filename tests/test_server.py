@@ -0,0 +1,161 @@
+import http.client
+import io
+import json
+import socket
+import tarfile
+import threading
+
+import pytest
+
+from skelly.core.server import ScaffoldService, create_server, percentile
+
+SPEC = {"name": "served", "backend_stack": "Express", "architecture": "hexagonal"}
+
+
+class _UnixConnection(http.client.HTTPConnection):
+    def __init__(self, path):
+        super().__init__("localhost")
+        self.path = path
+
+    def connect(self):
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.connect(self.path)
+
+
+@pytest.fixture
+def serve(tmp_path):
+    servers = []
+
+    def start(**options):
+        socket_path = options.pop("socket_path", None)
+        service = ScaffoldService(root=tmp_path, **options)
+        server = create_server(service, socket_path=socket_path, port=0)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        servers.append((server, service))
+        if socket_path:
+            return service, lambda: _UnixConnection(str(socket_path))
+        return service, lambda: http.client.HTTPConnection(*server.server_address)
+
+    yield start
+    for server, service in servers:
+        server.shutdown()
+        server.server_close()
+        service.close()
+
+
+def _request(connect, method, path, body=None):
+    connection = connect()
+    payload = json.dumps(body).encode() if body is not None else None
+    connection.request(method, path, body=payload, headers={"Content-Type": "application/json"})
+    response = connection.getresponse()
+    data = response.read()
+    connection.close()
+    return response, data
+
+
+class TestPercentile:
+    def test_nearest_rank(self):
+        values = [float(n) for n in range(1, 101)]
+        assert [percentile(values, q) for q in (50, 90, 99, 100)] == [50.0, 90.0, 99.0, 100.0]
+        assert percentile([], 50) == 0.0
+
+
+class TestScaffoldDaemon:
+    def test_returns_a_tarball(self, serve):
+        _, connect = serve()
+        response, data = _request(connect, "POST", "/scaffold", SPEC)
+        assert response.status == 200
+        assert response.getheader("Content-Type") == "application/gzip"
+        names = tarfile.open(fileobj=io.BytesIO(data)).getnames()
+        assert "served/server/package.json" in names
+
+    def test_writes_into_the_root(self, serve, tmp_path):
+        _, connect = serve()
+        response, data = _request(connect, "POST", "/scaffold?output=dir", {**SPEC, "output_path": "projects"})
+        assert response.status == 200
+        assert json.loads(data)["path"] == str(tmp_path / "projects" / "served")
+        assert (tmp_path / "projects" / "served" / "server" / "package.json").is_file()
+
+    def test_diff_against_the_root(self, serve, tmp_path):
+        _, connect = serve()
+        spec = {**SPEC, "output_path": "projects"}
+        _request(connect, "POST", "/scaffold?output=dir", spec)
+        (tmp_path / "projects/served/server/package.json").write_text("{}")
+        response, data = _request(connect, "POST", "/scaffold?output=diff", spec)
+        assert response.status == 200
+        counts = json.loads(data)["counts"]
+        assert counts["conflict"] == 1
+        assert counts["add"] == counts["modify"] == 0
+
+    def test_rejects_targets_outside_the_root(self, serve):
+        _, connect = serve()
+        response, data = _request(connect, "POST", "/scaffold?output=dir", {**SPEC, "output_path": "../elsewhere"})
+        assert response.status == 400
+        assert "inside" in json.loads(data)["error"]
+
+    @pytest.mark.parametrize("spec", [
+        {"name": "../escaped"},
+        {"output_path": "../elsewhere"},
+        {"schema": "/etc/hostname", "architecture": "hexagonal"},
+    ])
+    def test_nothing_outside_the_root(self, serve, tmp_path, spec):
+        _, connect = serve()
+        for output in ("dir", "diff"):
+            response, data = _request(connect, "POST", f"/scaffold?output={output}", {**SPEC, **spec})
+            assert response.status == 400
+            assert "inside" in json.loads(data)["error"] or "name" in json.loads(data)["error"]
+        assert not (tmp_path.parent / "escaped").exists()
+
+    def test_wrongly_typed_field_is_a_bad_request(self, serve):
+        service, connect = serve()
+        response, data = _request(connect, "POST", "/scaffold", {**SPEC, "backend_libraries": 5})
+        assert response.status == 400
+        assert "must be a list of strings" in json.loads(data)["error"]
+        assert service.metrics()["requests"]["failed"] == 1
+
+    def test_oversized_custom_folders_are_a_bad_request(self, serve):
+        service, connect = serve()
+        folders = {"architecture": "custom", "custom_folders": ["src/{0..9}{0..9}{0..9}{0..9}{0..9}"]}
+        response, data = _request(connect, "POST", "/scaffold", {**SPEC, **folders})
+        assert response.status == 400
+        assert "custom_folders expand to more than" in json.loads(data)["error"]
+        assert service.metrics()["latency_ms"]["samples"] == 0
+
+    def test_invalid_spec_is_a_bad_request(self, serve):
+        _, connect = serve()
+        response, data = _request(connect, "POST", "/scaffold", {"name": "x", "backend_stack": "Cobol"})
+        assert response.status == 400
+        assert "Unknown BackendStack" in json.loads(data)["error"]
+
+    def test_full_queue_is_rejected_with_503(self, serve):
+        service, connect = serve(workers=1, queue_size=1)
+        release = threading.Event()
+        blocked = [service.submit(release.wait), service.submit(release.wait)]
+        try:
+            response, _ = _request(connect, "POST", "/scaffold", SPEC)
+            assert response.status == 503
+            assert response.getheader("Retry-After") == "1"
+            assert service.metrics()["queued"] == 1
+        finally:
+            release.set()
+        for future in blocked:
+            future.result()
+        response, _ = _request(connect, "POST", "/scaffold", SPEC)
+        assert response.status == 200
+
+    def test_metrics_report_latency_percentiles(self, serve):
+        _, connect = serve()
+        for _ in range(3):
+            _request(connect, "POST", "/scaffold", SPEC)
+        response, data = _request(connect, "GET", "/metrics")
+        metrics = json.loads(data)
+        assert metrics["requests"]["ok"] == 3
+        assert metrics["latency_ms"]["samples"] == 3
+        assert 0 < metrics["latency_ms"]["p50"] <= metrics["latency_ms"]["p99"] <= metrics["latency_ms"]["max"]
+
+    def test_serves_on_a_unix_socket(self, serve, tmp_path):
+        _, connect = serve(socket_path=tmp_path / "skelly.sock")
+        response, data = _request(connect, "GET", "/health")
+        assert (response.status, json.loads(data)) == (200, {"status": "ok"})
+        response, data = _request(connect, "POST", "/scaffold?format=zip", SPEC)
+        assert response.status == 200 and data[:2] == b"PK"
@@ -0,0 +1,66 @@
+import pytest
+
+from skelly.core.models import BackendStack, FrontendStack
+from skelly.core.spec import ProjectSpec
+from skelly.strategies.architecture import CustomArchitecture
+from skelly.strategies.backend import JavaSpringBackend
+from skelly.strategies.frontend import ReactFrontend
+
+
+class TestProjectSpec:
+    def test_from_dict_parses_enum_values_and_names(self):
+        spec = ProjectSpec.from_dict({
+            "name": "svc",
+            "backend_stack": "Java",
+            "frontend_stack": "REACT",
+            "backend_libraries": ["lombok"],
+        })
+        assert spec.backend_stack is BackendStack.JAVA
+        assert spec.frontend_stack is FrontendStack.REACT
+        assert spec.backend_libraries == ("lombok",)
+
+    def test_from_dict_defaults(self):
+        spec = ProjectSpec.from_dict({"name": "svc", "backend_stack": "Express"})
+        assert spec.frontend_stack is FrontendStack.NONE
+        assert spec.architecture == "layered"
+        assert spec.output_path == "./"
+
+    def test_from_dict_rejects_unknown_fields(self):
+        with pytest.raises(ValueError, match="Unknown spec fields: colour"):
+            ProjectSpec.from_dict({"name": "svc", "backend_stack": "Java", "colour": "red"})
+
+    def test_from_dict_rejects_unknown_stack(self):
+        with pytest.raises(ValueError, match="Unknown BackendStack 'Rails'"):
+            ProjectSpec.from_dict({"name": "svc", "backend_stack": "Rails"})
+
+    def test_from_dict_requires_name(self):
+        with pytest.raises(ValueError, match="'name' is required"):
+            ProjectSpec.from_dict({"backend_stack": "Java"})
+
+    @pytest.mark.parametrize("field, value", [
+        ("backend_libraries", 5), ("custom_folders", "src"), ("frontend_libraries", [1]),
+        ("output_path", 3), ("architecture", ["layered"]),
+    ])
+    def test_from_dict_rejects_wrong_types(self, field, value):
+        with pytest.raises(ValueError, match=f"'{field}' must be"):
+            ProjectSpec.from_dict({"name": "svc", "backend_stack": "Java", field: value})
+
+    @pytest.mark.parametrize("name", ["../x", "a/b", "a\\b", "..", 7])
+    def test_from_dict_rejects_names_that_are_not_one_directory(self, name):
+        with pytest.raises(ValueError, match="name"):
+            ProjectSpec.from_dict({"name": name, "backend_stack": "Java"})
+
+    def test_create_builder_wires_strategies(self, tmp_path):
+        spec = ProjectSpec(
+            name="wired",
+            backend_stack=BackendStack.JAVA,
+            frontend_stack=FrontendStack.REACT,
+            architecture="custom",
+            custom_folders=("docs",),
+            output_path=str(tmp_path),
+        )
+        builder = spec.create_builder()
+        assert isinstance(builder._architecture, CustomArchitecture)
+        assert isinstance(builder._backend, JavaSpringBackend)
+        assert isinstance(builder._frontend, ReactFrontend)
+        assert builder._create_config().output_path == str(tmp_path)
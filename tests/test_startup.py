@@ -0,0 +1,54 @@
+import json
+import subprocess
+import sys
+
+import pytest
+
+HEAVY_MODULES = ("questionary", "prompt_toolkit", "rich", "jinja2")
+
+
+def _loaded_modules(code: str) -> set[str]:
+    """Run code in a fresh interpreter and return the names in sys.modules afterwards."""
+    result = subprocess.run(
+        [sys.executable, "-c", code + "\nimport json, sys\nprint(json.dumps(sorted(sys.modules)))"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return set(json.loads(result.stdout.splitlines()[-1]))
+
+
+def _heavy(modules) -> list[str]:
+    return sorted(m for m in modules if m.split(".")[0] in HEAVY_MODULES)
+
+
+class TestStartup:
+    def test_cli_import_skips_heavy_dependencies(self):
+        assert _heavy(_loaded_modules("import skelly.cli")) == []
+
+    @pytest.mark.parametrize("argv", [["--help"], ["batch", "--help"]])
+    def test_help_skips_heavy_dependencies(self, argv):
+        code = (
+            "import sys\n"
+            f"sys.argv = ['skelly', *{argv!r}]\n"
+            "from skelly.cli import main\n"
+            "try:\n"
+            "    main()\n"
+            "except SystemExit:\n"
+            "    pass\n"
+        )
+        assert _heavy(_loaded_modules(code)) == []
+
+    def test_strategies_package_is_lazy(self):
+        modules = _loaded_modules("import skelly.strategies")
+        assert not [m for m in modules if m.startswith("skelly.strategies.backend")]
+
+    def test_factory_imports_only_selected_strategy(self):
+        modules = _loaded_modules(
+            "from skelly.core.models import BackendStack\n"
+            "from skelly.factories.base import StrategyFactory\n"
+            "StrategyFactory.create_backend(BackendStack.DJANGO, 'app')\n"
+        )
+        assert "skelly.strategies.backend.django" in modules
+        assert "skelly.strategies.backend.java_spring" not in modules
+        assert _heavy(modules) == []
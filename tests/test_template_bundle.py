@@ -0,0 +1,79 @@
+import os
+
+import pytest
+from jinja2 import Environment, TemplateNotFound
+
+from skelly import __version__
+from skelly.core import template_bundle, template_cache
+from skelly.core.template_bundle import BundleLoader, build_bundle, load_bundle
+from skelly.core.template_renderer import create_environment, list_templates
+
+
+@pytest.fixture
+def bundle(tmp_path, monkeypatch):
+    path = build_bundle(tmp_path / "templates.bundle")
+    monkeypatch.setenv("SKELLY_TEMPLATE_BUNDLE", str(path))
+    return path
+
+
+class TestBundle:
+    def test_serves_every_template_unchanged(self, bundle):
+        loader = BundleLoader.open(bundle)
+        env = Environment()
+        assert loader.list_templates() == sorted(
+            path.relative_to(template_cache.TEMPLATES_DIR).as_posix()
+            for path in template_cache.TEMPLATES_DIR.rglob("*.j2")
+        )
+        for name in loader.list_templates():
+            source, filename, uptodate = loader.get_source(env, name)
+            assert source == (template_cache.TEMPLATES_DIR / name).read_text(encoding="utf-8")
+            assert filename.endswith(name) and uptodate()
+        with pytest.raises(TemplateNotFound):
+            loader.get_source(env, "missing.j2")
+
+    def test_records_the_version(self, bundle):
+        assert BundleLoader.open(bundle).version == __version__
+
+    def test_checksum_follows_contents_not_mtimes(self, tmp_path):
+        templates = tmp_path / "templates"
+        templates.mkdir()
+        template = templates / "a.j2"
+        template.write_text("{{ x }}", encoding="utf-8")
+        first = BundleLoader.open(build_bundle(tmp_path / "first.bundle", templates)).checksum
+        os.utime(template, (0, 0))
+        assert BundleLoader.open(build_bundle(tmp_path / "touched.bundle", templates)).checksum == first
+        template.write_text("{{ y }}", encoding="utf-8")
+        assert BundleLoader.open(build_bundle(tmp_path / "edited.bundle", templates)).checksum != first
+
+    def test_rejects_other_files(self, tmp_path):
+        (tmp_path / "junk.bundle").write_bytes(b"not a bundle at all")
+        assert load_bundle(tmp_path / "junk.bundle") is None
+        assert load_bundle(tmp_path / "missing.bundle") is None
+
+
+class TestRendererWithBundle:
+    def test_environment_uses_the_bundle(self, bundle, monkeypatch):
+        monkeypatch.setenv("SKELLY_TEMPLATE_CACHE", "0")
+        env = create_environment()
+        assert isinstance(env.loader, BundleLoader)
+        assert "java_spring/pom.xml.j2" in list_templates()
+        plain = create_environment(use_cache=False)
+        result = env.get_template("java_spring/application.properties.j2").render(project_name="mapped")
+        assert "spring.application.name=mapped" in result
+        assert result == plain.get_template("java_spring/application.properties.j2").render(project_name="mapped")
+
+    def test_opens_the_bundle_once(self, bundle):
+        assert load_bundle() is load_bundle()
+
+    def test_falls_back_to_package_loader_when_disabled(self, bundle, monkeypatch):
+        monkeypatch.setenv("SKELLY_TEMPLATE_BUNDLE", "0")
+        monkeypatch.setenv("SKELLY_TEMPLATE_CACHE", "0")
+        assert not isinstance(create_environment().loader, BundleLoader)
+
+    def test_bundle_of_another_version_is_ignored(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(template_bundle, "__version__", "0.0.0")
+        monkeypatch.setenv("SKELLY_TEMPLATE_BUNDLE", str(build_bundle(tmp_path / "old.bundle")))
+        monkeypatch.setenv("SKELLY_TEMPLATE_CACHE", "0")
+        env = create_environment()
+        assert not isinstance(env.loader, BundleLoader)
+        assert env.get_template("java_spring/application.properties.j2")
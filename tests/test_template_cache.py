@@ -0,0 +1,53 @@
+import os
+
+from jinja2 import ChoiceLoader, PackageLoader
+
+from skelly.core import template_cache
+from skelly.core.template_renderer import compile_templates, create_environment
+
+
+class TestTemplatesChecksum:
+    def test_changes_when_a_template_changes(self, tmp_path):
+        (tmp_path / "a.j2").write_text("a")
+        before = template_cache.templates_checksum(tmp_path)
+        (tmp_path / "a.j2").write_text("ab")
+        assert template_cache.templates_checksum(tmp_path) != before
+
+    def test_ignores_non_template_files(self, tmp_path):
+        (tmp_path / "a.j2").write_text("a")
+        before = template_cache.templates_checksum(tmp_path)
+        (tmp_path / "__init__.py").write_text("")
+        assert template_cache.templates_checksum(tmp_path) == before
+
+
+class TestCreateEnvironment:
+    def test_disabled_cache_uses_plain_package_loader(self, monkeypatch):
+        monkeypatch.setenv("SKELLY_TEMPLATE_CACHE", "0")
+        env = create_environment()
+        assert isinstance(env.loader, PackageLoader)
+        assert env.bytecode_cache is None
+
+    def test_bytecode_cache_is_populated(self, monkeypatch, tmp_path):
+        monkeypatch.setenv("SKELLY_CACHE_DIR", str(tmp_path))
+        env = create_environment()
+        env.get_template("java_spring/pom.xml.j2")
+        assert list(template_cache.bytecode_cache_dir().glob("__jinja2_*.cache"))
+
+    def test_unwritable_bytecode_cache_does_not_break_rendering(self, monkeypatch, tmp_path):
+        monkeypatch.setenv("SKELLY_CACHE_DIR", str(tmp_path))
+        env = create_environment()
+        os.rmdir(template_cache.bytecode_cache_dir())
+        result = env.get_template("java_spring/application.properties.j2").render(project_name="ro")
+        assert "spring.application.name=ro" in result
+
+    def test_compiled_templates_are_picked_up(self, monkeypatch, tmp_path):
+        monkeypatch.setenv("SKELLY_CACHE_DIR", str(tmp_path))
+        target = compile_templates()
+        assert target == template_cache.compiled_templates_dir()
+        assert list(target.glob("tmpl_*.py"))
+
+        env = create_environment()
+        assert isinstance(env.loader, ChoiceLoader)
+        compiled = env.get_template("java_spring/pom.xml.j2").render(project_name="aot", dependencies=[])
+        plain = create_environment(use_cache=False).get_template("java_spring/pom.xml.j2")
+        assert compiled == plain.render(project_name="aot", dependencies=[])
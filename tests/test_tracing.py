@@ -0,0 +1,88 @@
+import json
+import sys
+
+from skelly.core.builder import ProjectBuilder
+from skelly.core.installer import InstallRunner, InstallStep
+from skelly.core.tracing import Tracer, span, tracing
+from skelly.strategies.architecture import HexagonalArchitecture
+from skelly.strategies.backend import ExpressBackend
+from skelly.strategies.frontend import ReactFrontend
+
+
+def _build(tmp_path, workers: int = 4) -> None:
+    builder = ProjectBuilder(workers=workers, install=False)
+    builder.set_meta_data("traced")\
+           .set_architecture("Hexagonal Architecture")\
+           .with_architecture_strategy(HexagonalArchitecture("traced", "server/src"))\
+           .with_backend_strategy(ExpressBackend())\
+           .with_frontend_strategy(ReactFrontend())
+    builder._output_path = str(tmp_path)
+    builder.build()
+
+
+class TestSpan:
+    def test_no_op_without_tracer(self):
+        with span("anything", path="x") as value:
+            assert value is None
+
+    def test_records_complete_events(self):
+        with tracing() as tracer:
+            with span("outer"):
+                with span("inner", "file", path="a.txt"):
+                    pass
+        inner, outer = tracer.spans()
+        assert (inner["name"], inner["cat"], inner["args"]) == ("inner", "file", {"path": "a.txt"})
+        assert outer["ts"] <= inner["ts"] and inner["dur"] <= outer["dur"]
+        assert inner["tid"] == outer["tid"]
+
+    def test_tracing_is_scoped(self):
+        with tracing() as tracer:
+            pass
+        with span("after"):
+            pass
+        assert tracer.spans() == []
+
+    def test_named_tracks(self):
+        with tracing() as tracer:
+            with span("a", track="install: server"), span("b", track="install: frontend"):
+                pass
+        names = {event["args"]["name"] for event in tracer.events if event["ph"] == "M"}
+        assert names == {"install: server", "install: frontend"}
+        assert len({event["tid"] for event in tracer.spans()}) == 2
+
+    def test_save_chrome_trace(self, tmp_path):
+        tracer = Tracer()
+        with tracing(tracer), span("phase"):
+            pass
+        data = json.loads(tracer.save(tmp_path / "trace.json").read_text())
+        assert data["traceEvents"][-1]["name"] == "phase"
+
+
+class TestBuildSpans:
+    def test_phases_and_strategy_calls(self, tmp_path):
+        with tracing() as tracer:
+            _build(tmp_path)
+        names = {event["name"] for event in tracer.spans()}
+        assert {"build", "plan", "apply", "make_directories", "write_files", "render", "write"} <= names
+        strategies = [event["args"]["strategy"] for event in tracer.spans("create_config_files")]
+        assert strategies == ["Express.js", "React"]
+
+    def test_one_render_span_per_file(self, tmp_path):
+        with tracing() as tracer:
+            _build(tmp_path, workers=1)
+        rendered = {event["args"]["path"] for event in tracer.spans("render")}
+        assert "server/src/index.js" in rendered
+        assert "frontend/package.json" in rendered
+        [build] = tracer.spans("build")
+        assert all(event["ts"] >= build["ts"] for event in tracer.spans("write"))
+
+    def test_install_steps_on_own_tracks(self, tmp_path):
+        steps = [
+            [InstallStep(label=label, cmd=(sys.executable, "-c", "pass"), cwd=tmp_path, ecosystem="pip")]
+            for label in ("server", "frontend")
+        ]
+        with tracing() as tracer:
+            InstallRunner().run(steps)
+        spans = [event for event in tracer.spans() if event["cat"] == "install"]
+        assert len(spans) == 2
+        assert len({event["tid"] for event in spans}) == 2
@@ -0,0 +1,139 @@
+import subprocess
+import sys
+import zipfile
+
+import pytest
+
+from skelly.core.exceptions import DependencyInstallError
+from skelly.core.installer import InstallRunner
+from skelly.core.models import ProjectConfig
+from skelly.core.plan import BuildPlan
+from skelly.core.venvs import (
+    VenvStore,
+    Wheelhouse,
+    bin_dir,
+    clone_venv,
+    requirement_name,
+    requirements_key,
+    venv_python,
+)
+from skelly.strategies.backend import DjangoBackend
+
+
+def _wheel(directory, name: str, version: str = "4.2.0"):
+    """Minimal pure-Python wheel with a module and a console script, standing in for a real package."""
+    directory.mkdir(parents=True, exist_ok=True)
+    dist_info = f"{name}-{version}.dist-info"
+    files = {
+        f"{name}/__init__.py": f"VERSION = {version!r}\ndef main():\n    print('{name}', VERSION)\n",
+        f"{dist_info}/METADATA": f"Metadata-Version: 2.1\nName: {name}\nVersion: {version}\n",
+        f"{dist_info}/WHEEL": "Wheel-Version: 1.0\nGenerator: skelly-tests\nRoot-Is-Purelib: true\nTag: py3-none-any\n",
+        f"{dist_info}/entry_points.txt": f"[console_scripts]\n{name}-admin = {name}:main\n",
+    }
+    files[f"{dist_info}/RECORD"] = "".join(f"{path},,\n" for path in [*files, f"{dist_info}/RECORD"])
+    path = directory / f"{name}-{version}-py3-none-any.whl"
+    with zipfile.ZipFile(path, "w") as wheel:
+        for member, content in files.items():
+            wheel.writestr(member, content)
+    return path
+
+
+def _config(libraries=()) -> ProjectConfig:
+    return ProjectConfig(name="api", frontend_stack="None", backend_stack="Django", backend_libraries=tuple(libraries))
+
+
+@pytest.fixture
+def wheelhouse(tmp_path):
+    return Wheelhouse(tmp_path / "wheelhouse")
+
+
+@pytest.fixture
+def store(tmp_path):
+    return VenvStore(tmp_path / "venvs")
+
+
+class TestRequirements:
+    def test_requirement_name(self):
+        assert requirement_name("Django>=4.2") == "django"
+        assert requirement_name("django-cors-headers") == "django_cors_headers"
+
+    def test_key_ignores_order_and_case(self):
+        assert requirements_key(["django>=4.2", "celery"]) == requirements_key(["Celery", "django>=4.2"])
+        assert requirements_key(["django>=4.2"]) != requirements_key(["django>=4.2", "celery"])
+
+
+class TestWheelhouse:
+    def test_build_from_directory(self, wheelhouse, tmp_path):
+        _wheel(tmp_path / "wheels", "django")
+        wheelhouse.build(["django>=4.2"], source=tmp_path / "wheels")
+        assert wheelhouse.covers(["django>=4.2"])
+        assert not wheelhouse.covers(["django>=4.2", "celery"])
+
+    def test_build_with_missing_wheel(self, wheelhouse, tmp_path):
+        _wheel(tmp_path / "wheels", "django")
+        with pytest.raises(DependencyInstallError, match="celery"):
+            wheelhouse.build(["django>=4.2", "celery"], source=tmp_path / "wheels")
+        assert not wheelhouse.covers(["django>=4.2"])
+
+
+class TestCloneVenv:
+    def test_clone_rewrites_paths(self, tmp_path):
+        source = tmp_path / "source"
+        subprocess.run([sys.executable, "-m", "venv", "--without-pip", str(source)], check=True)
+        script = bin_dir(source) / "tool"
+        script.write_text(f"#!{venv_python(source)}\nprint('hi')\n")
+        target = tmp_path / "target"
+
+        clone_venv(source, target)
+
+        assert str(venv_python(target)) in (bin_dir(target) / "tool").read_text()
+        assert str(source) in script.read_text()
+        prefix = subprocess.run(
+            [str(venv_python(target)), "-c", "import sys; print(sys.prefix)"],
+            capture_output=True, text=True, check=True,
+        ).stdout.strip()
+        assert prefix == str(target)
+
+
+class TestDjangoInstallSteps:
+    def test_fresh_install_uses_index_without_wheelhouse(self, wheelhouse, store, tmp_path):
+        backend = DjangoBackend(wheelhouse, store)
+        backend.create_config_files(_config(), BuildPlan())
+        steps = backend.get_install_steps(tmp_path)
+        assert [step.cmd[1:3] for step in steps] == [("-m", "venv"), ("-m", "pip"), ("-m", "skelly.core.venvs")]
+        assert "--no-index" not in steps[1].cmd
+        assert steps[1].cmd[0] == str(venv_python((tmp_path / "server" / ".venv").absolute()))
+
+    def test_fresh_install_uses_wheelhouse(self, wheelhouse, store, tmp_path):
+        _wheel(tmp_path / "wheels", "django")
+        backend = DjangoBackend(wheelhouse, store)
+        backend.prefetch([], source=tmp_path / "wheels")
+        backend.create_config_files(_config(), BuildPlan())
+        pip = backend.get_install_steps(tmp_path)[1]
+        assert pip.cmd[pip.cmd.index("--find-links") + 1] == str(wheelhouse.path)
+        assert "--no-index" in pip.cmd
+
+    def test_offline_install_then_clone(self, wheelhouse, store, tmp_path):
+        _wheel(tmp_path / "wheels", "django")
+        backend = DjangoBackend(wheelhouse, store)
+        backend.prefetch([], source=tmp_path / "wheels")
+        runner = InstallRunner()
+
+        backend.create_config_files(_config(), BuildPlan())
+        first = tmp_path / "first"
+        (first / "server").mkdir(parents=True)
+        (first / "server" / "requirements.txt").write_text("django>=4.2")
+        results = runner.run([backend.get_install_steps(first)])
+        assert [result.ok for result in results] == [True, True, True]
+
+        second = tmp_path / "second"
+        (second / "server").mkdir(parents=True)
+        steps = backend.get_install_steps(second)
+        assert len(steps) == 1 and "clone" in steps[0].cmd
+        [result] = runner.run([steps])
+        assert result.ok
+
+        venv = second / "server" / ".venv"
+        out = subprocess.run([str(bin_dir(venv) / "django-admin")], capture_output=True, text=True, check=True)
+        assert out.stdout.strip() == "django 4.2.0"
+        assert str(venv.absolute()) in (bin_dir(venv) / "django-admin").read_text()
@@ -0,0 +1,118 @@
+import json
+
+import pytest
+
+from skelly.core.models import ProjectConfig
+from skelly.core.plan import BuildPlan
+from skelly.core.versions import MAVEN, NPM, PYPI, Registry, VersionIndex, refresh_index
+from skelly.strategies.backend import DjangoBackend, ExpressBackend, JavaSpringBackend
+from skelly.strategies.frontend import ReactFrontend
+
+
+@pytest.fixture
+def registry_dir(tmp_path):
+    """Directory stand-in for the npm, Maven and PyPI registries."""
+    root = tmp_path / "registry"
+    npm = {"helmet": "7.1.0", "@tanstack/react-query": "5.17.9", "tailwindcss": "3.4.1"}
+    for name, version in npm.items():
+        path = root / "npm" / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps({"name": name, "dist-tags": {"latest": version}}))
+
+    metadata = root / "maven/org/projectlombok/lombok/maven-metadata.xml"
+    metadata.parent.mkdir(parents=True)
+    metadata.write_text(
+        "<metadata><groupId>org.projectlombok</groupId><artifactId>lombok</artifactId>"
+        "<versioning><latest>1.18.31-SNAPSHOT</latest><release>1.18.30</release></versioning></metadata>"
+    )
+
+    for name, version in {"django": "5.0.1", "celery": "5.3.6"}.items():
+        path = root / "pypi" / name / "json"
+        path.parent.mkdir(parents=True)
+        path.write_text(json.dumps({"info": {"name": name, "version": version}}))
+    return root
+
+
+def _files(plan: BuildPlan) -> dict:
+    return {planned.path: planned for planned in plan.files}
+
+
+INDEX = VersionIndex({
+    NPM: {"helmet": "7.1.0", "tailwindcss": "3.4.1", "@tanstack/react-query": "5.17.9"},
+    MAVEN: {"org.projectlombok:lombok": "1.18.32"},
+    PYPI: {"django": "5.0.1", "celery": "5.3.6"},
+})
+
+
+class TestRegistry:
+    def test_latest_per_ecosystem(self, registry_dir):
+        registry = Registry.from_directory(registry_dir)
+        assert registry.latest(NPM, "helmet") == "7.1.0"
+        assert registry.latest(NPM, "@tanstack/react-query") == "5.17.9"
+        assert registry.latest(MAVEN, "org.projectlombok:lombok") == "1.18.30"
+        assert registry.latest(PYPI, "django") == "5.0.1"
+
+    def test_unknown_package(self, registry_dir):
+        assert Registry.from_directory(registry_dir).latest(NPM, "left-pad") is None
+
+    def test_refresh_index(self, registry_dir):
+        packages = {NPM: ["helmet", "left-pad"], MAVEN: ["org.projectlombok:lombok"], PYPI: ["celery"]}
+        index, missing = refresh_index(packages, Registry.from_directory(registry_dir))
+        assert index.pin(NPM, "helmet") == "7.1.0"
+        assert index.pin(PYPI, "celery") == "5.3.6"
+        assert missing == ["npm:left-pad"]
+        assert index.generated_at is not None
+
+
+class TestVersionIndex:
+    def test_save_and_load(self, tmp_path):
+        path = INDEX.save(tmp_path / "versions.json")
+        loaded = VersionIndex.load(path)
+        assert loaded.versions == INDEX.versions
+        assert len(loaded) == 6
+
+    def test_missing_snapshot_is_empty(self, tmp_path):
+        index = VersionIndex.load(tmp_path / "nope.json")
+        assert len(index) == 0
+        assert index.pin(NPM, "helmet") == "latest"
+
+
+class TestPinning:
+    def test_express_pins_libraries(self):
+        plan = BuildPlan()
+        config = ProjectConfig(name="api", frontend_stack="None", backend_stack="Express",
+                               backend_libraries=("helmet", "morgan"))
+        ExpressBackend(INDEX).create_config_files(config, plan)
+        dependencies = json.loads(_files(plan)["server/package.json"].content)["dependencies"]
+        assert dependencies["helmet"] == "7.1.0"
+        assert dependencies["morgan"] == "latest"
+        assert dependencies["express"] == "^4.18.2"
+
+    def test_react_pins_dev_and_runtime_libraries(self):
+        plan = BuildPlan()
+        config = ProjectConfig(name="ui", frontend_stack="React", backend_stack="Express",
+                               frontend_libraries=("tailwindcss postcss autoprefixer", "@tanstack/react-query"))
+        ReactFrontend(INDEX).create_config_files(config, plan)
+        package = json.loads(_files(plan)["frontend/package.json"].content)
+        assert package["devDependencies"]["tailwindcss"] == "3.4.1"
+        assert package["dependencies"]["@tanstack/react-query"] == "5.17.9"
+
+    def test_java_pins_unmanaged_artifacts_only(self):
+        backend = JavaSpringBackend("shop", versions=INDEX)
+        dependencies = {dep["artifact_id"]: dep["version"]
+                        for dep in backend._dependencies(["lombok", "mapstruct", "spring-boot-starter-security"])}
+        assert dependencies == {
+            "lombok": "1.18.32",
+            "mapstruct": "1.5.5.Final",
+            "spring-boot-starter-security": None,
+        }
+
+    def test_django_pins_requirements(self):
+        assert DjangoBackend(versions=INDEX).requirements(["celery", "django-cors-headers"]) == [
+            "django==5.0.1",
+            "celery==5.3.6",
+            "django-cors-headers",
+        ]
+
+    def test_django_without_snapshot(self):
+        assert DjangoBackend(versions=VersionIndex()).requirements([]) == ["django>=4.2"]
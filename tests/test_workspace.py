@@ -0,0 +1,122 @@
+import json
+
+import pytest
+
+from skelly.core.builder import ProjectBuilder
+from skelly.core.exceptions import BuildError
+from skelly.core.installer import InstallStep
+from skelly.core.journal import install_fingerprint
+from skelly.core.node_cache import NodeModulesCache
+from skelly.core.spec import ProjectSpec, split_members
+from skelly.strategies.architecture import LayeredArchitecture
+from skelly.strategies.backend import DjangoBackend, ExpressBackend
+from skelly.strategies.frontend import ReactFrontend
+
+SPEC = {
+    "name": "shop", "backend_stack": "Express", "frontend_stack": "React",
+    "backends": ["orders", "billing", {"directory": "inventory", "stack": "Java", "libraries": ["lombok"]}],
+}
+
+
+def _builder(tmp_path, **spec) -> ProjectBuilder:
+    return ProjectSpec.from_dict({**SPEC, **spec, "output_path": str(tmp_path)}).create_builder(install=False)
+
+
+class TestWorkspaceLayout:
+    def test_members_in_their_directories(self, tmp_path):
+        _builder(tmp_path).build()
+        root = tmp_path / "shop"
+
+        package = json.loads((root / "package.json").read_text())
+        assert package["workspaces"] == ["orders", "billing", "frontend"]
+        assert package["private"] is True
+        names = [json.loads((root / d / "package.json").read_text())["name"] for d in package["workspaces"]]
+        assert names == ["shop-orders-server", "shop-billing-server", "shop-frontend"]
+        assert (root / "orders/src/api/routes").is_dir()
+        assert not (root / "server").exists()
+
+        pom = (root / "pom.xml").read_text()
+        assert "<packaging>pom</packaging>" in pom
+        assert "<module>inventory</module>" in pom
+        assert "<artifactId>lombok</artifactId>" in (root / "inventory/pom.xml").read_text()
+
+    def test_one_install_per_ecosystem_at_the_root(self, tmp_path):
+        builder = _builder(tmp_path)
+        builder.build()
+        root = tmp_path / "shop"
+        steps = [sequence[0] for sequence in builder._workspace.install_steps(root, builder._create_config())]
+        assert [(step.ecosystem, step.cwd, step.members) for step in steps] == [
+            ("npm", root, ("orders", "billing", "frontend")),
+            ("maven", root, ("inventory",)),
+        ]
+
+    def test_member_lockfiles_are_dropped(self, tmp_path, monkeypatch):
+        from skelly.core.lockfiles import LockfileStore
+
+        monkeypatch.setattr(LockfileStore, "lockfile_for", lambda self, package: "{}")
+        _builder(tmp_path, backends=["orders"], frontend_stack="None (Backend only)").build()
+        assert (tmp_path / "shop/orders/package.json").exists()
+        assert not (tmp_path / "shop/orders/package-lock.json").exists()
+
+    def test_ignore_patterns_follow_the_members(self, tmp_path):
+        builder = _builder(tmp_path)
+        builder.create_plan(builder._create_config())
+        patterns = builder._workspace.ignore_patterns()
+        assert {"/node_modules/", "/orders/node_modules/", "/inventory/target/", "/frontend/dist/"} <= set(patterns)
+        assert not [pattern for pattern in patterns if pattern.startswith("/server/")]
+
+
+class TestWorkspaceBuilder:
+    def _base(self, tmp_path) -> ProjectBuilder:
+        builder = ProjectBuilder(install=False)
+        return builder.set_meta_data("ws").set_output_path(str(tmp_path))\
+                      .with_architecture_strategy(LayeredArchitecture())
+
+    def test_django_cannot_be_a_member(self, tmp_path):
+        builder = self._base(tmp_path).add_backend("api", DjangoBackend())
+        with pytest.raises(BuildError, match="cannot be part of a workspace"):
+            builder.build()
+
+    def test_members_and_single_strategies_do_not_mix(self, tmp_path):
+        builder = self._base(tmp_path).add_backend("api", ExpressBackend()).with_frontend_strategy(ReactFrontend())
+        with pytest.raises(BuildError, match="either"):
+            builder.build()
+
+    def test_directories_must_be_unique(self, tmp_path):
+        builder = self._base(tmp_path).add_backend("api", ExpressBackend()).add_frontend("api", ReactFrontend())
+        with pytest.raises(BuildError, match="unique"):
+            builder.build()
+
+    @pytest.mark.parametrize("directory", ["../api", "apps/api", "/api", ".skelly", "my api", "workspace"])
+    def test_directory_must_be_one_plain_name(self, tmp_path, directory):
+        with pytest.raises(ValueError, match="Invalid workspace directory"):
+            self._base(tmp_path).add_backend(directory, ExpressBackend())
+
+    def test_spec_rejects_nested_members(self, tmp_path):
+        with pytest.raises(ValueError, match="Invalid workspace directory"):
+            _builder(tmp_path, backends=["apps/api"])
+        with pytest.raises(ValueError, match="must be a list of strings"):
+            _builder(tmp_path, backends=[{"directory": "api", "libraries": 5}])
+
+
+def test_split_members():
+    backends, frontends = split_members(["orders", "billing=Java", "web=React"])
+    assert [(m.directory, m.stack and m.stack.value) for m in backends] == [("orders", None), ("billing", "Java")]
+    assert [m.directory for m in frontends] == ["web"]
+    with pytest.raises(ValueError, match="Unknown BackendStack"):
+        split_members(["api=Rails"])
+
+
+def test_workspace_root_is_not_cached(tmp_path):
+    (tmp_path / "package.json").write_text(json.dumps({"name": "ws", "workspaces": ["a"]}))
+    assert NodeModulesCache(tmp_path / "cache").key_for(tmp_path) is None
+
+
+def test_install_fingerprint_covers_the_members(tmp_path):
+    (tmp_path / "api").mkdir()
+    (tmp_path / "package.json").write_text("{}")
+    (tmp_path / "api/package.json").write_text('{"dependencies": {"a": "1"}}')
+    step = InstallStep(label="workspace", cmd=("npm", "install"), cwd=tmp_path, ecosystem="npm", members=("api",))
+    before = install_fingerprint(step)
+    (tmp_path / "api/package.json").write_text('{"dependencies": {"a": "2"}}')
+    assert install_fingerprint(step) != before